@@ -0,0 +1,44 @@
+"""Benchmark reading many images from a synthetic corpus."""
+
+from exif import extract_thumbnails, read_columns, read_gps_many, read_many
+
+
+def test_read_many(benchmark, corpus_paths):
+    """Benchmark reading every tag from each image (in the calling process)."""
+    benchmark.pedantic(
+        lambda: list(read_many(corpus_paths, workers=0)), rounds=3, iterations=1
+    )
+
+
+def test_read_many_tags(benchmark, corpus_paths):
+    """Benchmark reading a few tags from each image (in the calling process)."""
+    benchmark.pedantic(
+        lambda: list(
+            read_many(corpus_paths, tags=["make", "model", "orientation"], workers=0)
+        ),
+        rounds=3,
+        iterations=1,
+    )
+
+
+def test_read_columns(benchmark, corpus_paths):
+    """Benchmark reading the same few tags from each image into columns."""
+    benchmark.pedantic(
+        lambda: read_columns(corpus_paths, ["make", "model", "orientation"]),
+        rounds=3,
+        iterations=1,
+    )
+
+
+def test_read_gps_many(benchmark, corpus_paths):
+    """Benchmark reading the GPS coordinates of each image into arrays."""
+    benchmark.pedantic(lambda: read_gps_many(corpus_paths), rounds=3, iterations=1)
+
+
+def test_extract_thumbnails(benchmark, corpus_paths):
+    """Benchmark extracting the thumbnail from each image (in the calling process)."""
+    benchmark.pedantic(
+        lambda: list(extract_thumbnails(corpus_paths, workers=0)),
+        rounds=3,
+        iterations=1,
+    )
@@ -0,0 +1,78 @@
+"""Benchmark parsing, reading, modifying, adding, deleting, and serializing EXIF metadata."""
+
+import pytest
+
+from exif import Image
+
+ADDED_TAGS = {
+    0: ("artist", "Benchmark"),
+    "exif": ("body_serial_number", "0123456789"),
+    "gps": ("gps_map_datum", "WGS-84"),
+}
+"""Tag (absent from the test images) and value to add to each IFD."""
+
+
+def test_construct(benchmark, image_bytes):
+    """Benchmark parsing an image."""
+    benchmark(Image, image_bytes)
+
+
+def test_construct_header_only(benchmark, image_bytes):
+    """Benchmark parsing an image's EXIF metadata without retaining the image data."""
+    benchmark(Image, image_bytes, header_only=True)
+
+
+def test_get_all(benchmark, image_bytes):
+    """Benchmark reading every tag of a parsed image."""
+    image = Image(image_bytes)
+    benchmark(image.get_all)
+
+
+@pytest.mark.parametrize("tag", ["model", "orientation", "x_resolution"])
+def test_read_tag(benchmark, image_bytes, tag):
+    """Benchmark reading a single tag (of several types) from a freshly-parsed image."""
+    benchmark(lambda: Image(image_bytes).get(tag))
+
+
+@pytest.mark.parametrize("ifd_key", list(ADDED_TAGS), ids=str)
+def test_add_tag(benchmark, image_bytes, ifd_key):
+    """Benchmark adding a tag to each IFD."""
+    tag, value = ADDED_TAGS[ifd_key]
+
+    def setup():
+        image = Image(image_bytes)
+        if tag in image.list_all():
+            image.delete(tag)  # synthetic images may already contain the tag
+
+        return (image, tag, value), {}
+
+    benchmark.pedantic(setattr, setup=setup, rounds=50)
+
+
+def test_modify_tag(benchmark, image_bytes):
+    """Benchmark modifying an existing tag in place."""
+
+    def setup():
+        image = Image(image_bytes)
+        if "software" not in image.list_all():
+            image.software = "Synthetic Software"  # synthetic images may lack the tag
+
+        return (image, "software", "Benchmark"), {}
+
+    benchmark.pedantic(setattr, setup=setup, rounds=50)
+
+
+def test_delete_all(benchmark, image_bytes):
+    """Benchmark deleting every tag."""
+
+    def setup():
+        return (Image(image_bytes),), {}
+
+    benchmark.pedantic(Image.delete_all, setup=setup, rounds=20)
+
+
+def test_get_file(benchmark, image_bytes):
+    """Benchmark serializing a modified image."""
+    image = Image(image_bytes)
+    image.software = "Benchmark"
+    benchmark(image.get_file)
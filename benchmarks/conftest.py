@@ -0,0 +1,72 @@
+"""Benchmark fixtures (i.e., the test images and synthetic images)."""
+
+import os
+
+import pytest
+
+from exif._datatypes import TiffByteOrder
+from exif.synthetic import generate_image, write_corpus
+
+TEST_DIR = os.path.join(os.path.dirname(__file__), os.pardir, "tests")
+
+FIXTURE_NAMES = ["grand_canyon.jpg", "little_endian.jpg", "noise.jpg"]
+
+SYNTHETIC_IMAGES = {
+    "large_image_data": {
+        "thumbnail_nbytes": 8192,
+        "image_data_nbytes": 16 * 1024 * 1024,
+    },
+    "many_tags": {"tag_count": 400, "ascii_nbytes": 24, "thumbnail_nbytes": 4096},
+    "maker_note_le": {
+        "byte_order": TiffByteOrder.LITTLE,
+        "maker_note_nbytes": 32768,
+        "thumbnail_nbytes": 8192,
+        "extra_ifd_count": 2,
+    },
+}
+"""Keyword arguments for ``generate_image()`` keyed by synthetic image name."""
+
+CORPUS_SIZE = int(os.environ.get("EXIF_BENCHMARK_CORPUS_SIZE", "200"))
+"""Number of images in the synthetic corpus (configurable to benchmark at larger scales)."""
+
+_IMAGE_BYTES_CACHE = {}
+
+
+def get_image_bytes(name):
+    """Get the bytes of a test image or synthetic image (generated once per session).
+
+    :param str name: test image file name or synthetic image name
+    :returns: image bytes
+    :rtype: bytes
+
+    """
+    try:
+        return _IMAGE_BYTES_CACHE[name]
+    except KeyError:
+        pass
+
+    if name in SYNTHETIC_IMAGES:
+        image_bytes = generate_image(seed=name, **SYNTHETIC_IMAGES[name])
+    else:
+        with open(os.path.join(TEST_DIR, name), "rb") as image_file:
+            image_bytes = image_file.read()
+
+    _IMAGE_BYTES_CACHE[name] = image_bytes
+    return image_bytes
+
+
+@pytest.fixture(params=FIXTURE_NAMES + list(SYNTHETIC_IMAGES))
+def image_bytes(request):
+    """Bytes of each test image and synthetic image."""
+    return get_image_bytes(request.param)
+
+
+@pytest.fixture(scope="session")
+def corpus_paths(tmp_path_factory):
+    """File paths of a synthetic corpus with varying byte orders."""
+    return write_corpus(
+        tmp_path_factory.mktemp("corpus"),
+        CORPUS_SIZE,
+        byte_order=None,
+        thumbnail_nbytes=4096,
+    )
@@ -1,5 +1,8 @@
 """Read and modify image EXIF metadata using Python."""
 
+from exif._batch import ReadResult, ThumbnailResult, extract_thumbnails, read_many
+from exif._cache import MetadataCache
+from exif._columns import Column, read_columns
 from exif._constants import (
     ColorSpace,
     ExposureMode,
@@ -16,6 +19,10 @@ from exif._constants import (
     WhiteBalance,
 )
 from exif._datatypes import Flash, FlashMode, FlashReturn
+from exif._gps import GpsArrays, read_gps_many
 from exif._image import Image
+from exif._instrumentation import Instrumentation, PhaseStats
+from exif._stream_parser import ExifStreamParser
+from exif._thumbnail import extract_thumbnail
 
 DATETIME_STR_FORMAT = "%Y:%m:%d %H:%M:%S"
@@ -1,29 +1,43 @@
 """APP1 metadata interface module for EXIF tags."""
 
+import struct
 import warnings
-from typing import List
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Type, Union
 
-from plum.buffer import Buffer
 from plum.bigendian import uint16
-from plum.exceptions import UnpackError
 
-from exif._utils import pack_into, value_fits_in_ifd_tag
+from exif._app1_serializer import (
+    IfdEntry,
+    IfdKey,
+    get_value_nbytes,
+    read_ifd_entries,
+    serialize_ifds,
+)
+from exif._ifd_decoder import get_decoder
+from exif._instrumentation import (
+    IFDS_VISITED,
+    INSTRUMENTATION,
+    PARSE_IFDS,
+    READ_TAG,
+    TAGS_BUILT,
+    increment,
+    timed,
+)
+from exif._tag_index import IfdTagIndex
+from exif._utils import DirtyRangeBytearray
 from exif._constants import (
     ATTRIBUTE_ID_MAP,
     ATTRIBUTE_NAME_MAP,
     ATTRIBUTE_TYPE_MAP,
     ERROR_IMG_NO_ATTR,
+    EXIF_IFD_POINTER_TAG_ID,
+    GPS_IFD_POINTER_TAG_ID,
+    INTEROPERABILITY_IFD_POINTER_TAG_ID,
+    THUMBNAIL_LENGTH_TAG_ID,
+    THUMBNAIL_OFFSET_TAG_ID,
     ExifMarkers,
 )
-from exif._datatypes import (
-    ExifType,
-    Ifd,
-    IfdLe,
-    IfdTag,
-    IfdTagLe,
-    TiffByteOrder,
-    TiffHeader,
-)
+from exif._datatypes import ExifType, TiffByteOrder
 from exif.ifd_tag import (
     Ascii,
     BaseIfdTag,
@@ -38,408 +52,226 @@ from exif.ifd_tag import (
     UserComment,
     WindowsXp,
 )
-from exif.ifd_tag._rational import RationalDtype
-from exif.ifd_tag._srational import SrationalDtype
 from exif.ifd_tag._user_comment import USER_COMMENT_CHARACTER_CODE_LEN_BYTES
 
-# FUTURE: There's quite a few spots where a new Plum Buffer is created for the APP1 body bytes. Consider cleaning this
-# up to share the same buffer reference. Also, fix the false positive no-member Pylint errors.
-# pylint: disable=no-member
-
-
-class App1MetaData:
-
-    """APP1 metadata interface class for EXIF tags."""
-
-    def _add_empty_ifd(self, ifd):
-        if not ifd == "gps":
-            raise RuntimeError(f"only can add GPS IFD to image, not {ifd}")
-
-        if 1 not in self.ifd_pointers:
-            raise RuntimeError("can't yet add to images without a subsequent IFD 1")
-
-        if self.endianness == TiffByteOrder.BIG:
-            ifd_cls = Ifd
+MAX_APP1_SEGMENT_LENGTH = 0xFFFF
+"""Maximum value of the APP1 segment's length field (which includes the length field itself)."""
+
+_GPS_TAG_IDS = range(0x0000, 0x0100)
+_TIFF_TAG_IDS = range(
+    0x0100, 0x0215
+)  # baseline TIFF tags (which IFD 1 also uses to describe the thumbnail)
+_IFD0_TAG_IDS = {
+    ATTRIBUTE_ID_MAP[tag]
+    for tag in [
+        "artist",
+        "copyright",
+        "datetime",
+        "image_description",
+        "make",
+        "model",
+        "orientation",
+        "rating",
+        "rating_percent",
+        "software",
+    ]
+} | set(range(ATTRIBUTE_ID_MAP["xp_title"], ATTRIBUTE_ID_MAP["xp_subject"] + 1))
+
+
+_SUB_IFD_KEYS = {
+    EXIF_IFD_POINTER_TAG_ID: "exif",
+    GPS_IFD_POINTER_TAG_ID: "gps",
+    INTEROPERABILITY_IFD_POINTER_TAG_ID: "interopt",
+}
+"""Sub-IFD name keyed by the ID of the tag that points to it."""
+
+_TIFF_BYTE_ORDER = struct.Struct(">H")  # byte order indicator reads the same either way
+_TIFF_HEADER_IFD_OFFSET = 4  # after the byte order indicator and reserved field
+
+_TYPE_TAG_CLASSES: Dict[int, Type[BaseIfdTag]] = {
+    ExifType.BYTE: Byte,
+    ExifType.ASCII: Ascii,
+    ExifType.SHORT: Short,
+    ExifType.LONG: Long,
+    ExifType.RATIONAL: Rational,
+    ExifType.SLONG: Slong,
+    ExifType.SRATIONAL: Srational,
+    ExifType.SSHORT: Sshort,
+}
+"""Tag parser class keyed by EXIF type (for tags without a dedicated parser class)."""
+
+_SPECIAL_TAG_CLASSES = {
+    ATTRIBUTE_ID_MAP[
+        "exif_version"
+    ]: ExifVersion,  # custom ASCII encoding without termination character
+    ATTRIBUTE_ID_MAP["user_comment"]: UserComment,
+    **{  # legacy Windows XP tags
+        tag_id: WindowsXp
+        for tag_id in range(
+            ATTRIBUTE_ID_MAP["xp_title"], ATTRIBUTE_ID_MAP["xp_subject"] + 1
+        )
+    },
+}
+
+_TAG_CLASSES = {
+    (tag_id, tag_type): _SPECIAL_TAG_CLASSES.get(
+        tag_id, _TYPE_TAG_CLASSES.get(tag_type, BaseIfdTag)
+    )
+    for tag_id in set(ATTRIBUTE_ID_MAP.values()) | set(_SPECIAL_TAG_CLASSES)
+    for tag_type in range(max(ExifType) + 1)
+}
+"""Tag parser class keyed by tag ID and EXIF type (precomputed for every known tag and standard type)."""
+
+
+def _get_projected_ifds(tag_ids: Iterable[int]) -> Set[Union[int, str]]:
+    """Get the IFDs that need to be parsed to find a set of tags.
+
+    IFD 0 is always parsed since it contains the pointers to the EXIF and GPS IFDs (and tags are commonly found there
+    even if the standard places them elsewhere).
+
+    :param tag_ids: IDs of the requested tags
+    :returns: IFD numbers and names (where IFD 1 stands for IFD 1 onward)
+
+    """
+    ifd_keys: Set[Union[int, str]] = {0}
+
+    for tag_id in tag_ids:
+        if tag_id in _IFD0_TAG_IDS:
+            pass  # IFD 0 is always parsed
+        elif tag_id in _GPS_TAG_IDS:
+            ifd_keys.add("gps")
+        elif tag_id in _TIFF_TAG_IDS:
+            ifd_keys.add(1)
         else:
-            ifd_cls = IfdLe
+            ifd_keys.add("exif")
 
-        new_app1_bytes = self.body_bytes[: self.ifd_pointers[1]]
-        bytes_after_new_ifd = self.body_bytes[self.ifd_pointers[1] :]
+    return ifd_keys
 
-        # Inert empty IFD.
-        empty_ifd = Ifd(tags=[], next=0)
-        new_app1_bytes += empty_ifd.ipack()
 
-        # Touch up pointer to IFD 1 (which we already know exists).
-        new_app1_bytes_buffer = Buffer(new_app1_bytes)
-        new_app1_bytes_buffer.offset = self.ifd_pointers[0]
+# FUTURE: Fix the false positive no-member Pylint errors.
+# pylint: disable=no-member
 
-        ifd_zero = new_app1_bytes_buffer.unpack(ifd_cls)
-        ifd_zero.next += empty_ifd.nbytes
-        new_app1_bytes[
-            self.ifd_pointers[0] : self.ifd_pointers[0] + ifd_zero.nbytes
-        ] = ifd_zero.ipack()
 
-        # Touch up IFD 1 pointers!
-        after_new_ifd_buffer = Buffer(bytes_after_new_ifd)
-        after_new_ifd_buffer.offset = 0
-        ifd1 = after_new_ifd_buffer.unpack(ifd_cls)
+class App1MetaData:
 
-        for tag_index in range(ifd1.count):
-            tag_t = ifd1.tags[tag_index]
-            is_value_in_ifd_tag_itself = value_fits_in_ifd_tag(tag_t)
-            if (
-                tag_t.tag_id in [ATTRIBUTE_ID_MAP["jpeg_interchange_format"]]
-                or not is_value_in_ifd_tag_itself
-            ):
-                tag_t.value_offset += empty_ifd.nbytes
-            ifd1.tags[tag_index] = tag_t
+    """APP1 metadata interface class for EXIF tags."""
 
-        pack_into(datatype=ifd1, buffer=bytes_after_new_ifd, offset=0)
+    @property
+    def thumbnail_bytes(self) -> Optional[memoryview]:
+        """Thumbnail JPEG bytes that IFD 1 points to (or ``None`` if there isn't a thumbnail).
 
-        # Parse new bytes containing the additional placeholder IFD.
-        self.body_bytes = new_app1_bytes + bytes_after_new_ifd
-        self._parse_ifd_segments()
+        The thumbnail is located when accessed using the offset and length tags in IFD 1 (falling back to scanning for
+        the JPEG start and end markers after IFD 1 if those tags are missing or invalid). The returned memory view
+        shares the APP1 body bytes instead of copying the thumbnail.
 
-        # Adjust the size of the APP1 header to reflect the new length.
-        app1_len = uint16.view(
-            self.header_bytes, offset=2
-        )  # 2 bytes into the header, i.e., right after the marker
-        app1_len += empty_ifd.nbytes
-
-        # Add pointer tag to IFD 0.
-        # new IFD bytes were appended directly in front of IFD 1, need to point to beginning of new block
-        offset_of_new_ifd = self.ifd_pointers[1] - empty_ifd.nbytes
-        self._add_tag("_gps_ifd_pointer", offset_of_new_ifd)
-
-    def _add_tag(
-        self, tag, value
-    ):  # pylint: disable=too-many-locals, too-many-branches, too-many-statements
-        # FUTURE: This method could likely use some future cleanup and abstraction.
+        """
         try:
-            tag_type, ifd_number = ATTRIBUTE_TYPE_MAP[tag]
+            ifd1_offset = self.ifd_pointers[1]
         except KeyError:
-            raise AttributeError(f"cannot add attribute {tag} to image")
-
-        if self.endianness == TiffByteOrder.BIG:
-            ifd_cls = Ifd
-            ifd_tag_cls = IfdTag
-        else:
-            ifd_cls = IfdLe
-            ifd_tag_cls = IfdTagLe
-
-        if ifd_number not in self.ifd_pointers:
-            self._add_empty_ifd(ifd_number)
-
-        # Make a list of all IFDs that will need to be re-packed with touched up pointers.
-        subsequent_ifd_names = [
-            ifd
-            for ifd, offset in self.ifd_pointers.items()
-            if offset > self.ifd_pointers[ifd_number]
-        ]
-        subsequent_ifd_offsets = sorted(
-            [
-                offset
-                for offset in self.ifd_pointers.values()
-                if offset > self.ifd_pointers[ifd_number]
-            ]
-        )
-
-        # Determine the number of bytes that will be injected.
-        added_bytes = ifd_tag_cls.nbytes
-        pointer_value_bytes = 0
-        value_count = 1
-
-        if tag_type == ExifType.ASCII and len(value) >= 4:
-            pointer_value_bytes = len(value) + 1  # add one for null termination
-
-        if tag_type == ExifType.ASCII:
-            value_count = len(value) + 1
+            return None  # IFD 1 contains the thumbnail (if present)
 
-        if tag_type == ExifType.RATIONAL:
-            if isinstance(value, tuple):
-                value_count = len(value)
-            else:
-                value_count = 1
+        body_view = self.body_view
+        thumbnail_offset = None
+        thumbnail_nbytes = None
 
-            pointer_value_bytes = value_count * RationalDtype.nbytes
+        try:
+            ifd_tags, _ = self.decoder.read_ifd(body_view, ifd1_offset)
+        except struct.error:
+            ifd_tags = []
+
+        for tag_t in ifd_tags:
+            if tag_t.tag_id == THUMBNAIL_OFFSET_TAG_ID:
+                thumbnail_offset = tag_t.value_offset
+            elif tag_t.tag_id == THUMBNAIL_LENGTH_TAG_ID:
+                thumbnail_nbytes = tag_t.value_offset
+
+        if thumbnail_offset is not None and thumbnail_nbytes is not None:
+            thumbnail_view = body_view[
+                thumbnail_offset : thumbnail_offset + thumbnail_nbytes
+            ]
+            if (
+                len(thumbnail_view) == thumbnail_nbytes
+                and thumbnail_view[: len(ExifMarkers.SOI)] == ExifMarkers.SOI
+            ):
+                return thumbnail_view
 
-        if tag_type == ExifType.SRATIONAL:
-            # Value count stays at 1 since EXIF specification does not define multi-valued SRATIONAL tags.
-            pointer_value_bytes = value_count * SrationalDtype.nbytes
+        start_index = self.body_bytes.find(ExifMarkers.SOI, ifd1_offset)
+        end_index = self.body_bytes.find(ExifMarkers.EOI, ifd1_offset)
+        if start_index == -1 or end_index == -1:
+            return None  # no thumbnail
 
-        if (
-            tag == "user_comment"
-        ):  # character code header followed by null-terminated ASCII string
-            value_count = USER_COMMENT_CHARACTER_CODE_LEN_BYTES + len(value) + 1
-
-            if len(value) >= 4:
-                pointer_value_bytes = (
-                    USER_COMMENT_CHARACTER_CODE_LEN_BYTES + len(value) + 1
-                )
+        return body_view[start_index : end_index + len(ExifMarkers.EOI)]
 
-        added_bytes += pointer_value_bytes
+    @property
+    def body_bytes(self) -> DirtyRangeBytearray:
+        """APP1 body bytes (i.e., everything after the EXIF identifier code) with modified ranges recorded."""
+        return self._body_bytes
 
-        # Keep all bytes prior to the IFD where the new tag will be added.
-        new_app1_bytes = self.body_bytes[: self.ifd_pointers[ifd_number]]
+    def _replace_body(self, body_bytes: Union[bytes, bytearray]) -> None:
+        # Replacing the body entirely (e.g., when adding tags) modifies all of it.
+        self._body_bytes = DirtyRangeBytearray(body_bytes)
+        self._body_bytes.mark_dirty(0, len(body_bytes))
+        self._body_view = memoryview(self._body_bytes)
 
-        # If IFD 1 occurs after that added tag, adjust the pointer to it from IFD 0.
-        if ifd_number != 0:
-            new_app1_buffer = Buffer(new_app1_bytes)
-            new_app1_buffer.offset = self.ifd_pointers[0]
-            ifd_zero = new_app1_buffer.unpack(ifd_cls)
+    @property
+    def body_view(self) -> memoryview:
+        """Memory view over the APP1 body bytes (shared by all tag parsers to read values without copying them)."""
+        return self._body_view
 
-            if ifd_zero.next and 1 in subsequent_ifd_names:
-                ifd_zero.next += added_bytes
+    @property
+    def endianness(self) -> TiffByteOrder:
+        """TIFF byte order (read from the byte order indicator at the start of the APP1 body)."""
+        (byte_order,) = _TIFF_BYTE_ORDER.unpack_from(self._body_view)
+        return TiffByteOrder(byte_order)
 
-            # Also adjust the pointers to the GPS and EXIF IFDs if they occur after the added tag.
-            for tag_index in range(ifd_zero.count):
-                tag_t = ifd_zero.tags[tag_index]
+    def write(self, offset: int, data: bytes) -> None:
+        """Overwrite APP1 body bytes (recording the modified range).
 
-                is_ifd_pointer_to_adjust = (
-                    tag_t.tag_id == ATTRIBUTE_ID_MAP["_gps_ifd_pointer"]
-                    and "gps" in subsequent_ifd_names
-                )
-                is_ifd_pointer_to_adjust |= (
-                    tag_t.tag_id == ATTRIBUTE_ID_MAP["_exif_ifd_pointer"]
-                    and "exif" in subsequent_ifd_names
-                )
+        All modifications to the APP1 body go through this method. The body grows (zero-filled) if the data extends
+        beyond its end, which replaces the underlying byte array (and the shared memory view over it) since a byte
+        array can't be resized while views over it exist.
 
-                if is_ifd_pointer_to_adjust:
-                    tag_t.value_offset += added_bytes
+        :param offset: offset within the APP1 body to write the data to
+        :param data: bytes to write
 
-                ifd_zero.tags[tag_index] = tag_t
+        """
+        stop = offset + len(data)
 
-            pack_into(
-                datatype=ifd_zero, buffer=new_app1_bytes, offset=self.ifd_pointers[0]
-            )
+        if stop > len(self._body_bytes):
+            previous_dirty_ranges = self._body_bytes.get_dirty_ranges()
+            previous_len = len(self._body_bytes)
 
-        # Adjust InteropOffset in EXIF IFD if needed
-        if "interopt" in subsequent_ifd_names and "exif" not in subsequent_ifd_names:
-            new_app1_buffer = Buffer(new_app1_bytes)
-            new_app1_buffer.offset = self.ifd_pointers["exif"]
-            ifd_exif = new_app1_buffer.unpack(ifd_cls)
-
-            for tag_index in range(ifd_exif.count):
-                tag_t = ifd_exif.tags[tag_index]
-                is_ifd_pointer_to_adjust = (
-                    tag_t.tag_id == ATTRIBUTE_ID_MAP["_interoperability_ifd_Pointer"]
-                    and "interopt" in subsequent_ifd_names
-                )
+            self._body_view.release()
+            self._body_bytes = DirtyRangeBytearray(self._body_bytes)
+            self._body_bytes.extend(bytes(stop - previous_len))
+            self._body_view = memoryview(self._body_bytes)
 
-                if is_ifd_pointer_to_adjust:
-                    tag_t.value_offset += added_bytes
+            for start, dirty_stop in previous_dirty_ranges:
+                self._body_bytes.mark_dirty(start, dirty_stop)
+            self._body_bytes.mark_dirty(previous_len, stop)
 
-                ifd_exif.tags[tag_index] = tag_t
+        self._body_bytes[offset:stop] = data
 
-            pack_into(
-                datatype=ifd_exif,
-                buffer=new_app1_bytes,
-                offset=self.ifd_pointers["exif"],
-            )
+    def get_segment_bytes(self) -> bytes:
+        """Get equivalent APP1 segment bytes."""
+        return bytes(self.header_bytes) + bytes(self.body_bytes)
 
-        # Unpack the original bytes of the IFD to which the new tag will be added to.
-        target_ifd_offset = self.ifd_pointers[ifd_number]
-        body_bytes_buffer = Buffer(self.body_bytes)
-        body_bytes_buffer.offset = target_ifd_offset
-        target_ifd = body_bytes_buffer.unpack(ifd_cls)
-
-        # Find the end of the data block
-        # in well structured EXIF blocks this should be identical to
-        # len(self.body_bytes) or subsequent_ifd_offsets[0]
-        target_ifd_end = (
-            subsequent_ifd_offsets[0]
-            if subsequent_ifd_offsets
-            else len(self.body_bytes)
-        )
-        # size of this itd without data
-        target_ifd_tail_start = target_ifd_offset + 2 + target_ifd.count * 12 + 4
-        # now iterate throw values and check for appended data
-        for tag_index in range(target_ifd.count):
-            tag_t = target_ifd.tags[tag_index]
-            is_value_in_ifd_tag_itself = value_fits_in_ifd_tag(tag_t)
-            if (
-                tag_t.tag_id in [ATTRIBUTE_ID_MAP["jpeg_interchange_format"]]
-                or not is_value_in_ifd_tag_itself
-            ):
-                itemsize = 1
-                if tag_t.type == ExifType.RATIONAL:
-                    itemsize = RationalDtype.nbytes
-                if tag_t.type == ExifType.SRATIONAL:
-                    itemsize = SrationalDtype.nbytes
-                tag_data_end = tag_t.value_offset + tag_t.value_count * itemsize
-                target_ifd_tail_start = max(target_ifd_tail_start, tag_data_end)
-
-        # store ifd data before and after insert position
-        orig_ifd_values = self.body_bytes[
-            target_ifd_offset + target_ifd.nbytes : target_ifd_tail_start
-        ]
-        orig_ifd_values_tail = self.body_bytes[target_ifd_tail_start:target_ifd_end]
-
-        # Determine if a pointer to a value is necessary, and if so, find it.
+    @staticmethod
+    def _get_value_count(tag, tag_type, value):
         if (
-            (tag_type == ExifType.ASCII and len(value) >= 4)
-            or tag_type in [ExifType.RATIONAL, ExifType.SRATIONAL]
-            or (tag == "user_comment" and len(value) >= 4)
-        ):
-            value_pointer = target_ifd_tail_start + ifd_tag_cls.nbytes
-        elif tag == "_gps_ifd_pointer":
-            # Must set pointer values now or else they'll incorrectly point to 0x00 when parsing.
-            # Also add number of inserted bytes by which the target location is now shifted back
-            value += added_bytes
-            value_pointer = value
-        else:
-            value_pointer = 0
-
-        # Iterate over the IFD's tags and increase any value offset pointers by the size of an IFD tag.
-        for tag_index in range(target_ifd.count):
-            tag_t = target_ifd.tags[tag_index]
-
-            is_ifd_pointer_to_adjust = (
-                tag_t.tag_id == ATTRIBUTE_ID_MAP["_gps_ifd_pointer"]
-                and "gps" in subsequent_ifd_names
-            )
-            is_ifd_pointer_to_adjust |= (
-                tag_t.tag_id == ATTRIBUTE_ID_MAP["_exif_ifd_pointer"]
-                and "exif" in subsequent_ifd_names
-            )
-
-            is_value_in_ifd_tag_itself = value_fits_in_ifd_tag(tag_t)
-            if is_ifd_pointer_to_adjust:
-                tag_t.value_offset += added_bytes
-            elif not is_value_in_ifd_tag_itself:
-                tag_t.value_offset += ifd_tag_cls.nbytes
-
-            target_ifd.tags[tag_index] = tag_t
-
-        # Add the new tag to the IFD.
-        target_ifd.count += 1
-        target_ifd.tags.append(
-            ifd_tag_cls(
-                tag_id=ATTRIBUTE_ID_MAP[tag],
-                type=tag_type,
-                value_count=value_count,
-                value_offset=value_pointer,
-            )
-        )
-
-        # If necessary, touch up the pointer to the next IFD.
-        if target_ifd.next:
-            target_ifd.next += added_bytes
-
-        # Pack new IFD bytes into the new body bytes (along with the pre-existing values that follow).
-        new_app1_bytes[
-            target_ifd_offset : target_ifd_offset + target_ifd.nbytes
-        ] = target_ifd.ipack()
-        new_app1_bytes += orig_ifd_values
-        new_app1_bytes += b"\x00" * pointer_value_bytes
-        new_app1_bytes += orig_ifd_values_tail
-
-        # Touch up pointers in any subsequent IFDs.
-        # FUTURE: This could likely be better abstracted!
-        while subsequent_ifd_offsets:
-            current_ifd_offset = subsequent_ifd_offsets.pop(0)
-
-            body_bytes_buffer = Buffer(self.body_bytes)
-            body_bytes_buffer.offset = current_ifd_offset
-            target_ifd = body_bytes_buffer.unpack(ifd_cls)
-
-            if subsequent_ifd_offsets:
-                orig_ifd_values = self.body_bytes[
-                    current_ifd_offset + target_ifd.nbytes : subsequent_ifd_offsets[0]
-                ]
-            else:
-                orig_ifd_values = self.body_bytes[
-                    current_ifd_offset + target_ifd.nbytes :
-                ]
-
-            for tag_index in range(target_ifd.count):
-                tag_t = target_ifd.tags[tag_index]
-                is_value_in_ifd_tag_itself = value_fits_in_ifd_tag(tag_t)
-                if (
-                    tag_t.tag_id in [ATTRIBUTE_ID_MAP["jpeg_interchange_format"]]
-                    or not is_value_in_ifd_tag_itself
-                ):
-                    tag_t.value_offset += added_bytes
-                elif tag_t.tag_id in [
-                    ATTRIBUTE_ID_MAP["_interoperability_ifd_Pointer"]
-                ]:
-                    tag_t.value_offset += added_bytes
-
-                target_ifd.tags[tag_index] = tag_t
-
-            if target_ifd.next:
-                target_ifd.next += added_bytes
-
-            new_app1_bytes += target_ifd.ipack()
-            new_app1_bytes += orig_ifd_values
-
-        # Finally, adjust the size of the APP1 header to reflect the new length.
-        app1_len = uint16.view(
-            self.header_bytes, offset=2
-        )  # 2 bytes into the header, i.e., right after the marker
-        app1_len += added_bytes
-
-        # Reload to pick up on new bytes arrangement and then modify the currently-zero value.
-        self.body_bytes = new_app1_bytes
-        self._parse_ifd_segments()
-        self.ifd_tags[ATTRIBUTE_ID_MAP[tag]].modify(value)
-
-        # If the tag is a user comment, update its character code header to reflect ASCII encoding.
-        if tag == "user_comment":
-            self.ifd_tags[ATTRIBUTE_ID_MAP[tag]].set_character_code_to_ascii()
-
-    def _delete_ifd_tag(self, attribute_id):
-        # Overwrite pointer data with null bytes (if applicable, depending on datatype).
-        self.ifd_tags[attribute_id].wipe()
-
-        # Unpack the original IFD section.
-        corresponding_ifd_offset = self.ifd_pointers[self.tag_parent_ifd[attribute_id]]
-        if self.endianness == TiffByteOrder.BIG:
-            ifd_cls = Ifd
-        else:
-            ifd_cls = IfdLe
-
-        body_bytes_buffer = Buffer(self.body_bytes)
-        body_bytes_buffer.offset = corresponding_ifd_offset
-        orig_ifd = body_bytes_buffer.unpack(ifd_cls)
-
-        # Construct a new IFD section datatype containing all tags but the deletion target.
-        preserved_tags = [tag for tag in orig_ifd.tags if tag.tag_id != attribute_id]
-        new_ifd = ifd_cls(tags=preserved_tags, next=orig_ifd.next)
-
-        # Pack in new IFD bytes with null bytes (i.e., an empty IFD tag) appended to preserve pointers.
-        # Note: The pack_into method overrides the pre-existing bytes.
-        pack_into(
-            datatype=new_ifd, buffer=self.body_bytes, offset=corresponding_ifd_offset
-        )
-        pack_into(
-            datatype=IfdTag(tag_id=0, type=0, value_count=0, value_offset=0),
-            buffer=self.body_bytes,
-            offset=corresponding_ifd_offset + new_ifd.nbytes,
-        )
-
-        # Remove tag from parser tag dictionary.
-        del self.ifd_tags[attribute_id]
-        del self.tag_parent_ifd[attribute_id]
+            tag == "user_comment"
+        ):  # character code header followed by null-terminated ASCII string
+            return USER_COMMENT_CHARACTER_CODE_LEN_BYTES + len(value) + 1
 
-        # Regenerate information about existing tags.
-        self._parse_ifd_segments()
+        if tag_type == ExifType.ASCII:
+            return len(value) + 1  # add one for null termination
 
-    def _extract_thumbnail(self):
-        if 1 in self.ifd_pointers:  # IFD segment 1 contains thumbnail (if present)
-            hex_after_ifd1 = self.body_bytes[self.ifd_pointers[1] :]
-            try:
-                start_index = hex_after_ifd1.index(ExifMarkers.SOI)
-                end_index = hex_after_ifd1.index(ExifMarkers.EOI) + len(ExifMarkers.EOI)
-            except ValueError:  # pragma: no cover
-                pass  # no thumbnail
-            else:
-                self.thumbnail_bytes = hex_after_ifd1[start_index:end_index]
+        if tag_type in [ExifType.RATIONAL, ExifType.SRATIONAL] and isinstance(
+            value, tuple
+        ):
+            return len(value)
 
-    def get_segment_bytes(self) -> bytes:
-        """Get equivalent APP1 segment bytes."""
-        return bytes(self.header_bytes) + bytes(self.body_bytes)
+        return 1
 
     def get_tag_list(self, include_unknown: bool = True) -> List[str]:
         """Get a list of EXIF tag attributes present in the image object."""
@@ -462,128 +294,239 @@ class App1MetaData:
 
     def _iter_ifd_tags(self, ifd_key):
         ifd_offset = self.ifd_pointers[ifd_key]
-
-        if self.endianness == TiffByteOrder.BIG:
-            ifd_cls = Ifd
-        else:
-            ifd_cls = IfdLe
+        increment(IFDS_VISITED)
 
         try:
-            body_bytes_buffer = Buffer(self.body_bytes)
-            body_bytes_buffer.offset = ifd_offset
-            ifd_t = body_bytes_buffer.unpack(ifd_cls)
-        except UnpackError:
+            ifd_tags, next_ifd_offset = self.decoder.read_ifd(
+                self.body_view, ifd_offset
+            )
+        except struct.error:
             warnings.warn(f"skipping bad IFD {ifd_key}", RuntimeWarning)
             next_ifd_offset = 0
         else:
-            for tag_index in range(ifd_t.count):
-                tag_offset = (
-                    ifd_offset + 2 + tag_index * IfdTag.nbytes
-                )  # count is 2 bytes
-                tag_t = ifd_t.tags[tag_index]
-                tag_py_ins = self._tag_factory(tag_t, tag_offset)
-
-                if (
-                    ifd_key != 1 or tag_t.tag_id not in self.ifd_tags
+            tag_projection = self.tag_projection
+            ifd_tag_index = self.ifd_tags
+            tags_start = ifd_offset + self.decoder.ifd_count.size
+            ifd_tag_nbytes = self.decoder.ifd_tag.size
+
+            for tag_index, tag_t in enumerate(ifd_tags):
+                tag_offset = tags_start + tag_index * ifd_tag_nbytes
+
+                if tag_projection is not None and tag_t.tag_id not in tag_projection:
+                    pass  # skip tags that weren't requested
+                elif (
+                    ifd_key != 1 or tag_t.tag_id not in ifd_tag_index
                 ):  # don't let thumbnail tags override base image tags
-                    self.ifd_tags[tag_t.tag_id] = tag_py_ins
-                    self.tag_parent_ifd[tag_t.tag_id] = ifd_key
-
-                if tag_t.tag_id == ATTRIBUTE_ID_MAP["_exif_ifd_pointer"]:
-                    self.ifd_pointers["exif"] = tag_t.value_offset
-
-                if tag_t.tag_id == ATTRIBUTE_ID_MAP["_gps_ifd_pointer"]:
-                    self.ifd_pointers["gps"] = tag_t.value_offset
-
-                if tag_t.tag_id == ATTRIBUTE_ID_MAP["_interoperability_ifd_Pointer"]:
-                    self.ifd_pointers["interopt"] = tag_t.value_offset
+                    # Only record the tag's location since its parser is constructed when first accessed.
+                    ifd_tag_index.add(tag_t.tag_id, tag_t.type, tag_offset, ifd_key)
 
-            next_ifd_offset = ifd_t.next
+                sub_ifd_key = _SUB_IFD_KEYS.get(tag_t.tag_id)
+                if sub_ifd_key is not None:
+                    self.ifd_pointers[sub_ifd_key] = tag_t.value_offset
 
         return next_ifd_offset
 
+    @timed(PARSE_IFDS)
     def _parse_ifd_segments(self):
-        body_bytes_buffer = Buffer(self.body_bytes)
-        tiff_header = body_bytes_buffer.unpack(TiffHeader)
-        self.endianness = tiff_header.byte_order
+        if self.tag_projection is None:
+            parsed_ifds = None
+        else:
+            parsed_ifds = _get_projected_ifds(self.tag_projection)
 
         current_ifd = 0
-        current_ifd_offset = tiff_header.ifd_offset
+        (current_ifd_offset,) = self.decoder.uint32.unpack_from(
+            self.body_view, _TIFF_HEADER_IFD_OFFSET
+        )
 
         while current_ifd_offset:
             self.ifd_pointers[current_ifd] = current_ifd_offset
+
+            if current_ifd and parsed_ifds is not None and 1 not in parsed_ifds:
+                break  # skip IFD 1 onward (but keep its pointer to locate the thumbnail)
+
             current_ifd_offset = self._iter_ifd_tags(current_ifd)
             current_ifd += 1
 
-        if "exif" in self.ifd_pointers:
-            self._iter_ifd_tags("exif")
+        for ifd_key in ["exif", "gps"]:
+            if ifd_key in self.ifd_pointers and (
+                parsed_ifds is None or ifd_key in parsed_ifds
+            ):
+                self._iter_ifd_tags(ifd_key)
 
-        if "gps" in self.ifd_pointers:
-            self._iter_ifd_tags("gps")
+    def _tag_factory(self, tag_id, tag_type, offset):
+        increment(TAGS_BUILT)
 
-    def _tag_factory(self, tag_t, offset):  # pylint: disable=too-many-branches
-        if (
-            ATTRIBUTE_ID_MAP["xp_title"]
-            <= tag_t.tag_id
-            <= ATTRIBUTE_ID_MAP["xp_subject"]
-        ):  # legacy Windows XP tags
-            cls = WindowsXp
-        elif (
-            ATTRIBUTE_ID_MAP["exif_version"] == tag_t.tag_id
-        ):  # custom ASCII encoding without termination character
-            cls = ExifVersion
-        elif ATTRIBUTE_ID_MAP["user_comment"] == tag_t.tag_id:
-            cls = UserComment
-        elif tag_t.type == ExifType.BYTE:
-            cls = Byte
-        elif tag_t.type == ExifType.ASCII:
-            cls = Ascii
-        elif tag_t.type == ExifType.SHORT:
-            cls = Short
-        elif tag_t.type == ExifType.LONG:
-            cls = Long
-        elif tag_t.type == ExifType.RATIONAL:
-            cls = Rational
-        elif tag_t.type == ExifType.SLONG:
-            cls = Slong
-        elif tag_t.type == ExifType.SRATIONAL:
-            cls = Srational
-        elif tag_t.type == ExifType.SSHORT:
-            cls = Sshort
-        else:
-            cls = BaseIfdTag
+        try:
+            cls = _TAG_CLASSES[tag_id, tag_type]
+        except KeyError:  # unknown tag or nonstandard type
+            cls = _SPECIAL_TAG_CLASSES.get(
+                tag_id, _TYPE_TAG_CLASSES.get(tag_type, BaseIfdTag)
+            )
 
         return cls(offset, self)
 
-    def __init__(self, segment_bytes):
+    def __init__(self, segment_bytes, tag_projection: Optional[FrozenSet[int]] = None):
         self.header_bytes = bytearray(segment_bytes[:0xA])
-        self.body_bytes = bytearray(segment_bytes[0xA:])
+        self._body_bytes = DirtyRangeBytearray(segment_bytes[0xA:])
+        self._body_view = memoryview(self._body_bytes)
 
-        self.endianness = None
+        self.decoder = get_decoder(self.endianness)
+        self.ifd_pointers: Dict[IfdKey, int] = {}
+        self.ifd_tags = IfdTagIndex(self._tag_factory)
+        self.tag_projection: Optional[FrozenSet[int]] = tag_projection
+
+        self._parse_ifd_segments()
+
+    def load_all_tags(self) -> None:
+        """Parse every tag if only a subset of them was parsed (e.g., before modifying the APP1 body)."""
+        if self.tag_projection is None:
+            return
+
+        self.tag_projection = None
         self.ifd_pointers = {}
-        self.ifd_tags = {}
-        self.tag_parent_ifd = {}
-        self.thumbnail_bytes = None
+        self.ifd_tags = IfdTagIndex(self._tag_factory)
+        self._parse_ifd_segments()
+
+    def edit_tags(self, values: Dict[str, Any], deletions: Iterable[str] = ()) -> None:
+        """Modify, add, and delete multiple tags while rebuilding the APP1 body at most once.
+
+        Existing tags are modified in place. If any tags are added or deleted (including ASCII tags that are re-added
+        since their new value is longer), the APP1 body is serialized once with all of the changes and then re-parsed.
+        The changes are applied all-or-nothing (i.e., the APP1 metadata is restored if any of them fail).
+
+        :param values: new tag values keyed by tag name
+        :param deletions: names of tags to delete
+        :raises AttributeError: unknown tag, tag to delete is not present, or tag cannot be added
+        :raises ValueError: EXIF metadata would exceed the maximum APP1 segment size
+
+        """
+        self.load_all_tags()
 
+        header_bytes = bytes(self.header_bytes)
+        body_bytes = bytes(self._body_bytes)
+        dirty_ranges = self._body_bytes.get_dirty_ranges()
+        ifd_pointers = dict(self.ifd_pointers)
+        ifd_tags = self.ifd_tags
+
+        try:
+            self._edit_tags(values, deletions)
+        except Exception:
+            # Restore the metadata from before the edit (without releasing views other objects may hold).
+            self.header_bytes[:] = header_bytes
+            self._body_bytes = DirtyRangeBytearray(body_bytes)
+            self._body_view = memoryview(self._body_bytes)
+            for start, stop in dirty_ranges:
+                self._body_bytes.mark_dirty(start, stop)
+            self.ifd_pointers = ifd_pointers
+            self.ifd_tags = ifd_tags
+            raise
+
+    def _validate_edit(
+        self, values: Dict[str, Any], deletions: Iterable[str]
+    ) -> Dict[int, IfdKey]:
+        deleted_tag_ifds: Dict[int, IfdKey] = {}
+        for tag in deletions:
+            try:
+                attribute_id = ATTRIBUTE_ID_MAP[tag]
+            except KeyError:
+                raise AttributeError(f"unknown image attribute {tag}")
+
+            if attribute_id not in self.ifd_tags:
+                raise AttributeError(ERROR_IMG_NO_ATTR.format(tag))
+
+            deleted_tag_ifds[attribute_id] = self.ifd_tags.get_parent_ifd(attribute_id)
+
+        for tag in values:
+            try:
+                attribute_id = ATTRIBUTE_ID_MAP[tag]
+            except KeyError:
+                raise AttributeError(f"unknown image attribute {tag}")
+
+            is_added = (
+                attribute_id not in self.ifd_tags or attribute_id in deleted_tag_ifds
+            )
+            if is_added and tag not in ATTRIBUTE_TYPE_MAP:
+                raise AttributeError(f"cannot add attribute {tag} to image")
+
+        return deleted_tag_ifds
+
+    def _edit_tags(self, values: Dict[str, Any], deletions: Iterable[str]) -> None:
+        deleted_tag_ifds = self._validate_edit(values, deletions)
+
+        added_values = {}
+        for tag, value in values.items():
+            attribute_id = ATTRIBUTE_ID_MAP[tag]
+
+            if attribute_id not in self.ifd_tags or attribute_id in deleted_tag_ifds:
+                added_values[tag] = value
+                continue
+
+            try:
+                self.ifd_tags[attribute_id].modify(value)
+            except ValueError:  # e.g., if doesn't fit into tag, delete and re-add it
+                if ATTRIBUTE_TYPE_MAP.get(tag, (None,))[0] != ExifType.ASCII:
+                    raise
+
+                deleted_tag_ifds[attribute_id] = self.ifd_tags.get_parent_ifd(
+                    attribute_id
+                )
+                added_values[tag] = value
+
+        if not added_values and not deleted_tag_ifds:
+            return  # layout is unchanged
+
+        ifds = read_ifd_entries(self.body_view, self.ifd_pointers, self.endianness)
+
+        for attribute_id, ifd_key in deleted_tag_ifds.items():
+            ifds[ifd_key] = [
+                entry for entry in ifds[ifd_key] if entry.tag_id != attribute_id
+            ]
+
+        for tag, value in added_values.items():
+            tag_type, ifd_key = ATTRIBUTE_TYPE_MAP[tag]
+            value_count = self._get_value_count(tag, tag_type, value)
+            value_nbytes = max(get_value_nbytes(tag_type, value_count) or 0, 4)
+            ifds.setdefault(ifd_key, []).append(
+                IfdEntry(
+                    ATTRIBUTE_ID_MAP[tag], tag_type, value_count, bytes(value_nbytes)
+                )
+            )
+
+        body_bytes = serialize_ifds(ifds, self.body_view, self.endianness)
+
+        # Adjust the size of the APP1 header to reflect the new length.
+        app1_len = len(self.header_bytes) - len(ExifMarkers.APP1) + len(body_bytes)
+        if app1_len > MAX_APP1_SEGMENT_LENGTH:
+            raise ValueError(
+                f"EXIF metadata exceeds the maximum APP1 segment size ({app1_len} > {MAX_APP1_SEGMENT_LENGTH} bytes)"
+            )
+
+        uint16.view(self.header_bytes, offset=2).set(app1_len)
+
+        # Reload to pick up on new bytes arrangement and then modify the currently-zero values.
+        self._replace_body(body_bytes)
+        self.ifd_pointers = {}
+        self.ifd_tags = IfdTagIndex(self._tag_factory)
         self._parse_ifd_segments()
-        self._extract_thumbnail()
+
+        for tag, value in added_values.items():
+            self.ifd_tags[ATTRIBUTE_ID_MAP[tag]].modify(value)
+
+            # If the tag is a user comment, update its character code header to reflect ASCII encoding.
+            if tag == "user_comment":
+                self.ifd_tags[ATTRIBUTE_ID_MAP[tag]].set_character_code_to_ascii()
 
     def __delattr__(self, item):
         try:
             # Determine if attribute is an IFD tag accessor.
-            attribute_id = ATTRIBUTE_ID_MAP[item]
+            ATTRIBUTE_ID_MAP[item]
         except KeyError:  # pragma: no cover
             # Coverage and behavior tested by Image class.
             # Attribute is a class member. Delete natively.
             super(App1MetaData, self).__delattr__(item)
         else:
             # Attribute is not a class member. Delete EXIF tag value.
-            try:
-                self.ifd_tags[attribute_id]
-            except KeyError:
-                raise AttributeError(ERROR_IMG_NO_ATTR.format(item))
-
-            self._delete_ifd_tag(attribute_id)
+            self.edit_tags({}, [item])
 
     def __getattr__(self, item):
         """If attribute is not a class member, get the value of the EXIF tag of the same name."""
@@ -595,34 +538,27 @@ class App1MetaData:
         try:
             ifd_tag = self.ifd_tags[attribute_id]
         except KeyError:
+            if self.tag_projection is not None and (
+                attribute_id not in self.tag_projection
+            ):
+                raise AttributeError(
+                    f"attribute {item} was not requested when opening the image"
+                )
+
             raise AttributeError(ERROR_IMG_NO_ATTR.format(item))
 
-        return ifd_tag.read()
+        instrumentation = INSTRUMENTATION.get()
+        if instrumentation is None:
+            return ifd_tag.read()
+
+        return instrumentation.time(READ_TAG, ifd_tag.read)
 
     def __setattr__(self, key, value):
         try:
             # Determine if attribute is an IFD tag accessor.
-            attribute_id = ATTRIBUTE_ID_MAP[key]
+            ATTRIBUTE_ID_MAP[key]
         except KeyError:
             # Attribute is a class member. Set natively.
             super(App1MetaData, self).__setattr__(key, value)
         else:
-            try:
-                ifd_tag = self.ifd_tags[attribute_id]
-            except KeyError:
-                # Tag is not in image already.
-                self._add_tag(key, value)
-            else:
-                try:
-                    ifd_tag.modify(value)
-                except ValueError as exc:  # e.g., if doesn't fit into tag, try deleting and re-adding
-                    try:
-                        attr_exif_type = ATTRIBUTE_TYPE_MAP[key][0]
-                    except KeyError:
-                        raise exc
-
-                    if attr_exif_type == ExifType.ASCII:
-                        self._delete_ifd_tag(attribute_id)
-                        self._add_tag(key, value)
-                    else:
-                        raise exc
+            self.edit_tags({key: value})
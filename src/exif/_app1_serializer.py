@@ -0,0 +1,407 @@
+"""APP1 metadata body serializer module."""
+
+import struct
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+from exif._constants import (
+    ATTRIBUTE_ID_MAP,
+    EXIF_IFD_POINTER_TAG_ID,
+    GPS_IFD_POINTER_TAG_ID,
+    INTEROPERABILITY_IFD_POINTER_TAG_ID,
+    THUMBNAIL_LENGTH_TAG_ID,
+    THUMBNAIL_OFFSET_TAG_ID,
+)
+from exif._datatypes import ExifType
+from exif._ifd_decoder import IFD_TAG_VALUE_OFFSET, IfdDecoder, get_decoder
+from exif._instrumentation import SERIALIZE_IFDS, VALUES_RELOCATED, increment, timed
+
+IfdKey = Union[int, str]
+"""IFD number (for IFDs chained from IFD 0) or sub-IFD name (``"exif"``, ``"gps"``, or ``"interopt"``)."""
+
+EXIF_TYPE_NBYTES: Dict[int, int] = {
+    ExifType.BYTE: 1,
+    ExifType.ASCII: 1,
+    ExifType.SHORT: 2,
+    ExifType.LONG: 4,
+    ExifType.RATIONAL: 8,
+    6: 1,  # SBYTE
+    ExifType.UNDEFINED: 1,
+    ExifType.SSHORT: 2,
+    ExifType.SLONG: 4,
+    ExifType.SRATIONAL: 8,
+    11: 4,  # FLOAT
+    12: 8,  # DOUBLE
+}
+"""Number of bytes per value of each EXIF type."""
+
+SUB_IFD_POINTERS: Dict[str, Tuple[IfdKey, int]] = {
+    "exif": (0, EXIF_IFD_POINTER_TAG_ID),
+    "gps": (0, GPS_IFD_POINTER_TAG_ID),
+    "interopt": ("exif", INTEROPERABILITY_IFD_POINTER_TAG_ID),
+}
+"""Parent IFD and pointer tag ID of each sub-IFD."""
+
+TIFF_HEADER_NBYTES = 8
+INLINE_VALUE_NBYTES = 4
+
+_MAKER_NOTE_TAG_ID = ATTRIBUTE_ID_MAP["maker_note"]
+
+
+class IfdEntry(NamedTuple):
+
+    """IFD tag along with the bytes of its value."""
+
+    tag_id: int
+    """Tag ID"""
+
+    type: int
+    """EXIF type"""
+
+    value_count: int
+    """Number of values"""
+
+    value_bytes: bytes
+    """Value bytes (or the raw value offset field if the value fits inside the IFD tag itself)"""
+
+    value_offset: Optional[int] = None
+    """Original offset of the value within the APP1 body (or ``None`` if the value fits inside the IFD tag itself or
+    is new)"""
+
+    def is_opaque(self) -> bool:
+        """Determine if the value can't be relocated safely.
+
+        Maker notes (and other UNDEFINED values) are opaque blobs that vendors often address by absolute offset, and
+        the size of a value of an unknown type (i.e., whether the value offset field is a pointer) isn't known.
+
+        :returns: value resides at an original offset and can't be relocated
+
+        """
+        return self.value_offset is not None and (
+            self.tag_id == _MAKER_NOTE_TAG_ID
+            or self.type == ExifType.UNDEFINED
+            or self.type not in EXIF_TYPE_NBYTES
+        )
+
+
+def get_value_nbytes(tag_type: int, value_count: int) -> Optional[int]:
+    """Get the number of bytes occupied by a tag's value(s).
+
+    :param tag_type: EXIF type
+    :param value_count: number of values
+    :returns: number of bytes, or ``None`` if the type is unknown
+
+    """
+    try:
+        return EXIF_TYPE_NBYTES[tag_type] * value_count
+    except KeyError:
+        return None
+
+
+def _is_stored_externally(
+    ifd_key: IfdKey, tag_id: int, value_nbytes: Optional[int]
+) -> bool:
+    # Values that don't fit in the IFD tag (and the thumbnail that IFD 1 points to) reside after the IFD.
+    if ifd_key == 1 and tag_id == THUMBNAIL_OFFSET_TAG_ID:
+        return True
+
+    return value_nbytes is not None and value_nbytes > INLINE_VALUE_NBYTES
+
+
+def _get_external_nbytes(ifd_key: IfdKey, entry: IfdEntry) -> Optional[int]:
+    # Number of value bytes stored after the IFD (or None if the value fits inside the IFD tag itself).
+    if ifd_key == 1 and entry.tag_id == THUMBNAIL_OFFSET_TAG_ID:
+        return len(entry.value_bytes)
+
+    value_nbytes = get_value_nbytes(entry.type, entry.value_count)
+    if not _is_stored_externally(ifd_key, entry.tag_id, value_nbytes):
+        return None
+
+    return value_nbytes
+
+
+def read_ifd_entries(
+    body_bytes: Union[bytearray, memoryview],
+    ifd_pointers: Dict[IfdKey, int],
+    endianness: int,
+) -> Dict[IfdKey, List[IfdEntry]]:
+    """Read the tags of each IFD along with copies of their values.
+
+    :param body_bytes: APP1 body bytes (i.e., everything after the EXIF identifier code)
+    :param ifd_pointers: offset of each IFD keyed by IFD number or name
+    :param endianness: TIFF byte order
+    :returns: tags of each readable IFD keyed by IFD number or name (omitting sub-IFDs that can't be read along with
+        the tags pointing to them)
+
+    """
+    decoder = get_decoder(endianness)
+    ifds: Dict[IfdKey, List[IfdEntry]] = {}
+
+    for ifd_key, ifd_offset in ifd_pointers.items():
+        try:
+            ifd_tags, _ = decoder.read_ifd(body_bytes, ifd_offset)
+        except struct.error:
+            continue  # parser already warned about the bad IFD
+
+        thumbnail_nbytes = 0
+        for tag_t in ifd_tags:
+            if tag_t.tag_id == THUMBNAIL_LENGTH_TAG_ID:
+                thumbnail_nbytes = tag_t.value_offset
+
+        entries = []
+
+        for tag_index, tag_t in enumerate(ifd_tags):
+            value_nbytes = get_value_nbytes(tag_t.type, tag_t.value_count)
+
+            if ifd_key == 1 and tag_t.tag_id == THUMBNAIL_OFFSET_TAG_ID:
+                value_nbytes = thumbnail_nbytes
+
+            if value_nbytes is not None and _is_stored_externally(
+                ifd_key, tag_t.tag_id, value_nbytes
+            ):
+                value_start = tag_t.value_offset
+                value_offset: Optional[int] = tag_t.value_offset
+            else:
+                # Copy the IFD tag's value offset field itself (which, for a tag of an unknown type, may be a pointer
+                # to a value of unknown size).
+                value_start = (
+                    ifd_offset
+                    + decoder.ifd_count.size
+                    + tag_index * decoder.ifd_tag.size
+                    + IFD_TAG_VALUE_OFFSET
+                )
+                value_offset = tag_t.value_offset if value_nbytes is None else None
+                value_nbytes = INLINE_VALUE_NBYTES
+
+            entries.append(
+                IfdEntry(
+                    tag_t.tag_id,
+                    tag_t.type,
+                    tag_t.value_count,
+                    bytes(body_bytes[value_start : value_start + value_nbytes]),
+                    value_offset,
+                )
+            )
+
+        ifds[ifd_key] = entries
+
+    _drop_unreadable_sub_ifds(ifds, ifd_pointers)
+
+    return ifds
+
+
+def _drop_unreadable_sub_ifds(
+    ifds: Dict[IfdKey, List[IfdEntry]], ifd_pointers: Dict[IfdKey, int]
+) -> None:
+    # Remove the pointer to each sub-IFD that couldn't be read (or whose parent couldn't be read) so the serialized
+    # body doesn't point to bytes that are no longer there.
+    for ifd_key, (parent_ifd_key, pointer_tag_id) in SUB_IFD_POINTERS.items():
+        if ifd_key in ifd_pointers and (
+            ifd_key not in ifds or parent_ifd_key not in ifds
+        ):
+            ifds.pop(ifd_key, None)
+            if parent_ifd_key in ifds:
+                ifds[parent_ifd_key] = [
+                    entry
+                    for entry in ifds[parent_ifd_key]
+                    if entry.tag_id != pointer_tag_id
+                ]
+
+
+class _Layout(NamedTuple):
+
+    """Location of each IFD and value within a serialized APP1 body."""
+
+    ifd_keys: List[IfdKey]
+    """IFDs in the order they're packed"""
+
+    ifd_offsets: Dict[IfdKey, int]
+    """Offset of each IFD keyed by IFD number or name"""
+
+    value_offsets: Dict[IfdKey, List[Optional[int]]]
+    """Offset of each tag's value stored after its IFD (or ``None`` if it fits inside the IFD tag itself) in the
+    order of the IFD's tags, keyed by IFD number or name"""
+
+    next_ifd_offsets: Dict[IfdKey, int]
+    """Offset of the next IFD in the chain from IFD 0 (or 0 if none) keyed by IFD number or name"""
+
+    preserved_nbytes: int
+    """Number of leading bytes kept from the original APP1 body (to leave opaque values at their original offsets)"""
+
+
+def _add_sub_ifd_pointers(ifds: Dict[IfdKey, List[IfdEntry]]) -> None:
+    # Point to each sub-IFD from its parent (adding the pointer tag if it's a new sub-IFD).
+    for ifd_key, (parent_ifd_key, pointer_tag_id) in SUB_IFD_POINTERS.items():
+        if ifd_key in ifds:
+            parent_entries = ifds.setdefault(parent_ifd_key, [])
+            if all(entry.tag_id != pointer_tag_id for entry in parent_entries):
+                parent_entries.append(
+                    IfdEntry(pointer_tag_id, ExifType.LONG, 1, bytes(4))
+                )
+
+
+def _get_ifd_nbytes(decoder: IfdDecoder, tag_count: int) -> int:
+    # Tag count, tags, and next IFD offset.
+    return (
+        decoder.ifd_count.size + tag_count * decoder.ifd_tag.size + decoder.uint32.size
+    )
+
+
+def _get_preserved_nbytes(
+    ifds: Dict[IfdKey, List[IfdEntry]], original_body_nbytes: int
+) -> int:
+    # Keep the original body through the end of the last opaque value (or the whole body if an opaque value's size
+    # is unknown), or just the TIFF header if there aren't any.
+    preserved_nbytes = TIFF_HEADER_NBYTES
+
+    for entries in ifds.values():
+        for entry in entries:
+            if entry.is_opaque():
+                assert entry.value_offset is not None
+                value_nbytes = get_value_nbytes(entry.type, entry.value_count)
+                if value_nbytes is None:
+                    return original_body_nbytes
+
+                preserved_nbytes = max(
+                    preserved_nbytes, entry.value_offset + value_nbytes
+                )
+
+    return min(preserved_nbytes, original_body_nbytes)
+
+
+def _lay_out_ifds(
+    ifds: Dict[IfdKey, List[IfdEntry]], decoder: IfdDecoder, original_body_nbytes: int
+) -> _Layout:
+    # Determine the offset of each IFD (and each value stored after it) in a single pass before packing.
+    chained_ifd_keys = sorted(key for key in ifds if isinstance(key, int))
+    ifd_keys: List[IfdKey] = []
+    ifd_keys += chained_ifd_keys[:1]
+    ifd_keys += [key for key in ("exif", "interopt", "gps") if key in ifds]
+    ifd_keys += chained_ifd_keys[1:]
+
+    ifd_offsets: Dict[IfdKey, int] = {}
+    value_offsets: Dict[IfdKey, List[Optional[int]]] = {}
+    preserved_nbytes = _get_preserved_nbytes(ifds, original_body_nbytes)
+    cursor = preserved_nbytes + preserved_nbytes % 2
+
+    for ifd_key in ifd_keys:
+        ifd_offsets[ifd_key] = cursor
+        cursor += _get_ifd_nbytes(decoder, len(ifds[ifd_key]))
+
+        value_offsets[ifd_key] = []
+        for entry in ifds[ifd_key]:
+            value_nbytes = _get_external_nbytes(ifd_key, entry)
+
+            if value_nbytes is None:
+                value_offsets[ifd_key].append(None)
+            elif entry.is_opaque():
+                value_offsets[ifd_key].append(entry.value_offset)
+            else:
+                value_offsets[ifd_key].append(cursor)
+                cursor += (
+                    value_nbytes + value_nbytes % 2
+                )  # start values on word boundaries
+
+    # Link the IFDs that are actually present (e.g., IFD 0 to IFD 2 if IFD 1 couldn't be read).
+    next_ifd_offsets: Dict[IfdKey, int] = {}
+    for ifd_key, next_ifd_key in zip(chained_ifd_keys, chained_ifd_keys[1:]):
+        next_ifd_offsets[ifd_key] = ifd_offsets[next_ifd_key]
+
+    return _Layout(
+        ifd_keys, ifd_offsets, value_offsets, next_ifd_offsets, preserved_nbytes
+    )
+
+
+def _get_inline_value_field(entry: IfdEntry, decoder: IfdDecoder) -> int:
+    # Value offset field of a value that fits inside the IFD tag itself (padding a truncated value).
+    inline_bytes = entry.value_bytes[:INLINE_VALUE_NBYTES]
+    return decoder.uint32.unpack(inline_bytes.ljust(INLINE_VALUE_NBYTES, b"\x00"))[0]
+
+
+def _pack_ifds(
+    ifds: Dict[IfdKey, List[IfdEntry]],
+    layout: _Layout,
+    original_body_bytes: Union[bytes, bytearray, memoryview],
+    decoder: IfdDecoder,
+) -> bytearray:
+    # Pack each IFD followed by its values at the offsets determined by the layout (after the preserved bytes).
+    sub_ifd_pointer_tags = {
+        (parent_ifd_key, pointer_tag_id): ifd_key
+        for ifd_key, (parent_ifd_key, pointer_tag_id) in SUB_IFD_POINTERS.items()
+        if ifd_key in layout.ifd_offsets
+    }
+
+    body_bytes = bytearray(original_body_bytes[: layout.preserved_nbytes])
+    body_bytes[4:TIFF_HEADER_NBYTES] = decoder.uint32.pack(
+        layout.ifd_offsets[layout.ifd_keys[0]]
+    )
+    body_bytes += bytes(layout.ifd_offsets[layout.ifd_keys[0]] - len(body_bytes))
+    relocated_count = 0
+
+    for ifd_key in layout.ifd_keys:
+        entries = ifds[ifd_key]
+        body_bytes += decoder.ifd_count.pack(len(entries))
+        values = bytearray()
+
+        for entry, value_offset in zip(entries, layout.value_offsets[ifd_key]):
+            sub_ifd_key = sub_ifd_pointer_tags.get((ifd_key, entry.tag_id))
+
+            if sub_ifd_key is not None:
+                tag_value_offset = layout.ifd_offsets[sub_ifd_key]
+            elif value_offset is None:
+                tag_value_offset = _get_inline_value_field(entry, decoder)
+            elif entry.is_opaque():
+                tag_value_offset = value_offset
+            else:
+                tag_value_offset = value_offset
+                value_nbytes = _get_external_nbytes(ifd_key, entry)
+                assert value_nbytes is not None
+
+                # Pad missing value bytes (e.g., a truncated value) and align the next value to a word boundary.
+                values += entry.value_bytes[:value_nbytes].ljust(
+                    value_nbytes + value_nbytes % 2, b"\x00"
+                )
+                relocated_count += 1
+
+            body_bytes += decoder.ifd_tag.pack(
+                entry.tag_id, entry.type, entry.value_count, tag_value_offset
+            )
+
+        body_bytes += decoder.uint32.pack(layout.next_ifd_offsets.get(ifd_key, 0))
+        body_bytes += values
+
+    increment(VALUES_RELOCATED, relocated_count)
+
+    return body_bytes
+
+
+@timed(SERIALIZE_IFDS)
+def serialize_ifds(
+    ifds: Dict[IfdKey, List[IfdEntry]],
+    original_body_bytes: Union[bytes, bytearray, memoryview],
+    endianness: int,
+) -> bytearray:
+    """Serialize IFDs into a contiguous APP1 body.
+
+    Each IFD is immediately followed by the values that don't fit inside its tags (and IFD 1 by the thumbnail), so
+    the body contains no unreferenced bytes. Sub-IFD pointers, the pointers between IFDs 0, 1, etc., and the
+    thumbnail pointer are computed from the new layout, which is determined in a single pass before packing.
+
+    Opaque values (i.e., maker notes and other UNDEFINED values, which vendors often address by absolute offset, and
+    values of unknown types) are never relocated. If there are any, the original body is kept through the end of the
+    last one and the IFDs and other values are packed after it instead.
+
+    :param ifds: tags of each IFD keyed by IFD number or name (i.e., as returned by ``read_ifd_entries()``)
+    :param original_body_bytes: original APP1 body (or at least its TIFF header if there aren't any opaque values)
+    :param endianness: TIFF byte order
+    :returns: APP1 body bytes (i.e., everything after the EXIF identifier code)
+
+    """
+    decoder = get_decoder(endianness)
+
+    ifds = {ifd_key: list(entries) for ifd_key, entries in ifds.items()}
+    _add_sub_ifd_pointers(ifds)
+    for entries in ifds.values():
+        entries.sort(key=lambda entry: entry.tag_id)
+
+    layout = _lay_out_ifds(ifds, decoder, len(original_body_bytes))
+    return _pack_ifds(ifds, layout, original_body_bytes, decoder)
@@ -0,0 +1,185 @@
+"""Batch EXIF metadata extraction module."""
+
+import itertools
+import os
+import pickle
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+from exif._image import Image, get_tag_ids
+from exif._thumbnail import extract_thumbnail
+
+PathType = Union[str, "os.PathLike[str]"]  # pylint: disable=unsubscriptable-object
+
+
+class ReadResult(NamedTuple):
+
+    """EXIF metadata read from a single file by ``read_many()``."""
+
+    path: PathType
+    """File path (as specified by the caller)"""
+
+    tags: Dict[str, Any]
+    """Tag values keyed by tag name (empty if an error occurred)"""
+
+    error: Optional[BaseException]
+    """Exception raised while reading the file (or ``None`` if it was read successfully)"""
+
+
+class ThumbnailResult(NamedTuple):
+
+    """Thumbnail extracted from a single file by ``extract_thumbnails()``."""
+
+    path: PathType
+    """File path (as specified by the caller)"""
+
+    thumbnail: Optional[bytes]
+    """Thumbnail binary (or ``None`` if an error occurred)"""
+
+    error: Optional[BaseException]
+    """Exception raised while extracting the thumbnail (or ``None`` if it was extracted successfully)"""
+
+
+def _picklable_error(exc: BaseException) -> BaseException:
+    # Worker processes send results back by pickling them, so substitute exceptions that can't be pickled.
+    try:
+        pickle.dumps(exc)
+    except Exception:  # pylint: disable=broad-except
+        return RuntimeError(f"{type(exc).__name__}: {exc}")
+
+    return exc
+
+
+def _read_file(path: PathType, tags: Optional[FrozenSet[str]]) -> ReadResult:
+    try:
+        tag_values = Image(os.fspath(path), header_only=True, tags=tags).get_all()
+    except Exception as exc:  # pylint: disable=broad-except
+        return ReadResult(path, {}, _picklable_error(exc))
+
+    return ReadResult(path, tag_values, None)
+
+
+def _read_files(
+    paths: List[PathType], tags: Optional[FrozenSet[str]]
+) -> List[ReadResult]:
+    return [_read_file(path, tags) for path in paths]
+
+
+def _extract_file_thumbnail(path: PathType) -> ThumbnailResult:
+    try:
+        thumbnail = extract_thumbnail(path)
+    except Exception as exc:  # pylint: disable=broad-except
+        return ThumbnailResult(path, None, _picklable_error(exc))
+
+    return ThumbnailResult(path, thumbnail, None)
+
+
+def _extract_file_thumbnails(paths: List[PathType]) -> List[ThumbnailResult]:
+    return [_extract_file_thumbnail(path) for path in paths]
+
+
+def _iter_path_chunks(
+    paths: Iterable[PathType], chunk_size: int
+) -> Iterator[List[PathType]]:
+    path_iterator = iter(paths)
+
+    while True:
+        chunk = list(itertools.islice(path_iterator, chunk_size))
+        if not chunk:
+            break
+
+        yield chunk
+
+
+def _map_path_chunks(
+    func: Callable[..., List[Any]],
+    paths: Iterable[PathType],
+    workers: Optional[int],
+    chunk_size: int,
+    *args: Any,
+) -> Iterator[Any]:
+    path_chunks = _iter_path_chunks(paths, chunk_size)
+
+    if workers == 0:
+        for chunk in path_chunks:
+            yield from func(chunk, *args)
+        return
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Bound the number of chunks in flight so that arbitrarily many paths can be streamed through the pool.
+        pending = set()
+
+        for chunk in path_chunks:
+            pending.add(executor.submit(func, chunk, *args))
+
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+
+
+def read_many(
+    paths: Iterable[PathType],
+    tags: Optional[Iterable[str]] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = 16,
+) -> Iterator[ReadResult]:
+    """Read EXIF metadata from many image files using a pool of worker processes.
+
+    Files are opened with ``header_only=True`` (so image data is never read) and only the requested tags are parsed.
+    The files are distributed across the workers in chunks. Results are generated in completion order (i.e., not
+    necessarily in the order of ``paths``) as soon as each chunk is read. Errors reading a file are reported in its
+    result instead of interrupting the batch.
+
+    :param paths: image file paths (which may be a lazily-evaluated iterable)
+    :param tags: names of tags to read (defaults to all tags, i.e., the same as ``Image.get_all()``)
+    :param workers: number of worker processes (defaults to the number of CPUs), or 0 to read the files in the
+        calling process
+    :param chunk_size: number of files sent to a worker process at a time
+    :returns: result for each file
+    :raises ValueError: unknown tag name
+
+    """
+    tag_names = None if tags is None else frozenset(tags)
+    if tag_names is not None:
+        get_tag_ids(tag_names)  # validate the tag names before reading any files
+
+    yield from _map_path_chunks(_read_files, paths, workers, chunk_size, tag_names)
+
+
+def extract_thumbnails(
+    paths: Iterable[PathType], workers: Optional[int] = None, chunk_size: int = 16
+) -> Iterator[ThumbnailResult]:
+    """Extract the thumbnails from many image files using a pool of worker processes.
+
+    Each thumbnail is extracted using ``extract_thumbnail()`` (so only the byte ranges needed to locate it are read).
+    Like ``read_many()``, results are generated in completion order and errors (including files without a thumbnail)
+    are reported in each file's result instead of interrupting the batch.
+
+    :param paths: image file paths (which may be a lazily-evaluated iterable)
+    :param workers: number of worker processes (defaults to the number of CPUs), or 0 to read the files in the
+        calling process
+    :param chunk_size: number of files sent to a worker process at a time
+    :returns: result for each file
+
+    """
+    yield from _map_path_chunks(_extract_file_thumbnails, paths, workers, chunk_size)
@@ -0,0 +1,258 @@
+"""Persistent EXIF metadata cache module."""
+
+import os
+import pickle
+import sqlite3
+from collections import Counter
+from typing import Any, Dict, NamedTuple, Optional, Tuple, Union
+
+from exif._image import Image
+
+_EVICTION_BATCH_SIZE = 256
+_SQLITE_INT_RANGE = 1 << 64
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS metadata (
+    st_dev INTEGER NOT NULL,
+    st_ino INTEGER NOT NULL,
+    st_size INTEGER NOT NULL,
+    st_mtime_ns INTEGER NOT NULL,
+    tags BLOB NOT NULL,
+    nbytes INTEGER NOT NULL,
+    last_used INTEGER NOT NULL,
+    PRIMARY KEY (st_dev, st_ino)
+);
+CREATE INDEX IF NOT EXISTS metadata_last_used ON metadata (last_used);
+"""
+
+
+class _CacheSettings(NamedTuple):
+
+    """Size limits and commit interval of a cache."""
+
+    max_entries: Optional[int]
+    """Maximum number of cached images (unlimited if ``None``)"""
+
+    max_nbytes: Optional[int]
+    """Maximum total size of the cached tag values in bytes (unlimited if ``None``)"""
+
+    commit_interval: int
+    """Number of modifications between commits"""
+
+
+def _to_sqlite_int(value: int) -> int:
+    # SQLite integers are signed 64-bit, but device and inode numbers may be unsigned 64-bit.
+    return value - _SQLITE_INT_RANGE if value >= _SQLITE_INT_RANGE // 2 else value
+
+
+class MetadataCache:
+
+    """Cache of image EXIF metadata persisted in a SQLite database file.
+
+    Each image's tag values (i.e., the result of ``Image.get_all()``) are stored keyed by the device and inode numbers
+    of its file and validated against the file's size and modification time. Looking up an unchanged file only stats
+    it (the file is never opened). Files that are new or changed since they were cached are read with
+    ``header_only=True`` and cached. When a size limit is exceeded, the least recently used entries are evicted.
+
+    Tag values are stored using ``pickle``, so only open cache files from trusted sources. Modifications are committed
+    periodically and when the cache is closed (e.g., when exiting a ``with`` block).
+
+    :param path: SQLite database file path (created if it does not exist)
+    :param max_entries: maximum number of cached images (unlimited if ``None``)
+    :param max_nbytes: maximum total size of the cached tag values in bytes (unlimited if ``None``)
+    :param commit_interval: number of modifications (i.e., insertions and recency updates) between commits
+
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],  # pylint: disable=unsubscriptable-object
+        max_entries: Optional[int] = None,
+        max_nbytes: Optional[int] = None,
+        commit_interval: int = 1000,
+    ) -> None:
+        self._settings = _CacheSettings(max_entries, max_nbytes, commit_interval)
+        self._uncommitted_count = 0
+
+        self._connection = sqlite3.connect(os.fspath(path))
+        self._connection.executescript(_SCHEMA)
+
+        self._entry_count, self._nbytes, self._clock = self._connection.execute(
+            "SELECT COUNT(*), TOTAL(nbytes), COALESCE(MAX(last_used), 0) FROM metadata"
+        ).fetchone()
+        self._nbytes = int(self._nbytes)
+
+        self._lookup_counts: Counter = Counter()  # "hit" and "miss" counts
+
+        self._evict()
+
+    def __enter__(self) -> "MetadataCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._entry_count
+
+    @property
+    def hit_count(self) -> int:
+        """Number of lookups answered from the cache since it was opened."""
+        return self._lookup_counts["hit"]
+
+    @property
+    def miss_count(self) -> int:
+        """Number of lookups that read the image file since the cache was opened."""
+        return self._lookup_counts["miss"]
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the cached tag values in bytes."""
+        return self._nbytes
+
+    def _tick(self) -> int:
+        self._clock += 1
+        return self._clock
+
+    def _record_modification(self, count: int = 1) -> None:
+        self._uncommitted_count += count
+        if self._uncommitted_count >= self._settings.commit_interval:
+            self.commit()
+
+    def _is_over_limit(self) -> bool:
+        max_entries, max_nbytes, _ = self._settings
+        return (max_entries is not None and self._entry_count > max_entries) or (
+            max_nbytes is not None and self._nbytes > max_nbytes
+        )
+
+    def _evict(self) -> None:
+        # Delete the least recently used entries until the cache is within its limits.
+        if not self._is_over_limit():
+            return
+
+        # Other connections may have modified the table since the cache was opened, so lock it and recount first.
+        if not self._connection.in_transaction:
+            self._connection.execute("BEGIN IMMEDIATE")
+
+        self._entry_count, nbytes = self._connection.execute(
+            "SELECT COUNT(*), TOTAL(nbytes) FROM metadata"
+        ).fetchone()
+        self._nbytes = int(nbytes)
+
+        # Delete each batch at once and only count the deletions afterward (since committing would release the lock).
+        deleted_count = 0
+
+        while self._is_over_limit():
+            rows = self._connection.execute(
+                "SELECT rowid, nbytes FROM metadata ORDER BY last_used LIMIT ?",
+                (_EVICTION_BATCH_SIZE,),
+            ).fetchall()
+            if not rows:
+                break
+
+            rowids = []
+            for rowid, nbytes in rows:
+                if not self._is_over_limit():
+                    break
+
+                rowids.append(rowid)
+                self._entry_count -= 1
+                self._nbytes -= nbytes
+
+            self._connection.execute(
+                f"DELETE FROM metadata WHERE rowid IN ({', '.join('?' * len(rowids))})",
+                rowids,
+            )
+            deleted_count += len(rowids)
+
+        self._record_modification(deleted_count)
+
+    def _lookup(
+        self, key: Tuple[int, int], stat_result: os.stat_result
+    ) -> Optional[Dict[str, Any]]:
+        row = self._connection.execute(
+            "SELECT st_size, st_mtime_ns, tags FROM metadata WHERE st_dev = ? AND st_ino = ?",
+            key,
+        ).fetchone()
+
+        if row is None or row[:2] != (stat_result.st_size, stat_result.st_mtime_ns):
+            return None  # not cached or the file changed
+
+        self._connection.execute(
+            "UPDATE metadata SET last_used = ? WHERE st_dev = ? AND st_ino = ?",
+            (self._tick(),) + key,
+        )
+        self._record_modification()
+
+        return pickle.loads(row[2])
+
+    def _store(
+        self, key: Tuple[int, int], stat_result: os.stat_result, tags: Dict[str, Any]
+    ) -> None:
+        tags_bytes = pickle.dumps(tags, protocol=pickle.HIGHEST_PROTOCOL)
+
+        previous_row = self._connection.execute(
+            "SELECT nbytes FROM metadata WHERE st_dev = ? AND st_ino = ?", key
+        ).fetchone()
+        if previous_row is not None:
+            self._entry_count -= 1
+            self._nbytes -= previous_row[0]
+
+        self._connection.execute(
+            "INSERT OR REPLACE INTO metadata VALUES (?, ?, ?, ?, ?, ?, ?)",
+            key
+            + (
+                stat_result.st_size,
+                stat_result.st_mtime_ns,
+                tags_bytes,
+                len(tags_bytes),
+                self._tick(),
+            ),
+        )
+        self._entry_count += 1
+        self._nbytes += len(tags_bytes)
+        self._record_modification()
+
+        self._evict()
+
+    def get_all(
+        self,
+        path: Union[str, "os.PathLike[str]"],  # pylint: disable=unsubscriptable-object
+    ) -> Dict[str, Any]:
+        """Return dictionary containing all EXIF tag values keyed by tag name (the same as ``Image.get_all()``).
+
+        :param path: image file path
+        :returns: tag values (from the cache if the file is unchanged since it was cached)
+
+        """
+        path = os.fspath(path)
+        stat_result = os.stat(path)
+        key = (_to_sqlite_int(stat_result.st_dev), _to_sqlite_int(stat_result.st_ino))
+
+        tags = self._lookup(key, stat_result)
+        if tags is not None:
+            self._lookup_counts["hit"] += 1
+            return tags
+
+        self._lookup_counts["miss"] += 1
+        tags = Image(path, header_only=True).get_all()
+        self._store(key, stat_result, tags)
+        return tags
+
+    def clear(self) -> None:
+        """Delete every cached entry."""
+        self._connection.execute("DELETE FROM metadata")
+        self._connection.commit()
+        self._uncommitted_count = 0
+        self._entry_count = 0
+        self._nbytes = 0
+
+    def commit(self) -> None:
+        """Write pending modifications to the database file."""
+        self._connection.commit()
+        self._uncommitted_count = 0
+
+    def close(self) -> None:
+        """Commit pending modifications and close the database file."""
+        self.commit()
+        self._connection.close()
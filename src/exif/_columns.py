@@ -0,0 +1,405 @@
+"""Columnar batch EXIF metadata extraction module."""
+
+import logging
+import os
+import struct
+from array import array
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Union
+
+from exif._app1_metadata import App1MetaData
+from exif._app1_serializer import INLINE_VALUE_NBYTES, get_value_nbytes
+from exif._batch import PathType
+from exif._constants import ATTRIBUTE_ID_MAP, ATTRIBUTE_TYPE_MAP, TAG_VALUE_COUNTS
+from exif._datatypes import ExifType
+from exif._ifd_decoder import IFD_TAG_VALUE_OFFSET, divide_rationals
+from exif._image import Image, get_app1_metadata, get_tag_ids
+from exif.ifd_tag._user_comment import USER_COMMENT_CHARACTER_CODE_LEN_BYTES
+
+logger = logging.getLogger(__name__)
+
+FLOAT_COLUMN = "float"
+INT_COLUMN = "int"
+RATIONAL_COLUMN = "rational"
+STRING_COLUMN = "string"
+
+_INT_FORMATS: Dict[int, str] = {
+    ExifType.BYTE: "B",
+    ExifType.SHORT: "H",
+    ExifType.LONG: "I",
+    ExifType.SSHORT: "h",
+    ExifType.SLONG: "i",
+}
+"""``struct`` format character of each integer EXIF type."""
+
+_RATIONAL_TYPES = {ExifType.RATIONAL, ExifType.SRATIONAL}
+
+_EXIF_VERSION_TAG_ID = ATTRIBUTE_ID_MAP["exif_version"]
+_USER_COMMENT_TAG_ID = ATTRIBUTE_ID_MAP["user_comment"]
+_XP_TAG_IDS = range(ATTRIBUTE_ID_MAP["xp_title"], ATTRIBUTE_ID_MAP["xp_subject"] + 1)
+_STRING_TAG_IDS = {_EXIF_VERSION_TAG_ID, _USER_COMMENT_TAG_ID, *_XP_TAG_IDS}
+
+ColumnValues = Union[array, bytearray]
+
+
+class Column(NamedTuple):
+
+    """Values of a tag across many images read by ``read_columns()``.
+
+    Every member supports the buffer protocol, so a column converts to NumPy or Arrow arrays without copying it.
+
+    """
+
+    kind: str
+    """Column kind (``"float"``, ``"int"``, ``"rational"``, or ``"string"``)"""
+
+    width: int
+    """Number of values per image (e.g., 3 for GPS latitude degrees, minutes, and seconds)"""
+
+    values: ColumnValues
+    """Values of each image in row-major order as float64 or int64 ``array`` instances (zero if invalid, and with
+    the numerator and denominator of each value interleaved if a rational column), or concatenated UTF-8 encoded
+    strings as a ``bytearray``"""
+
+    offsets: Optional[array]
+    """Start of each image's string in ``values`` followed by the end of the last one as an int64 ``array`` (or
+    ``None`` if not a string column)"""
+
+    valid: bytearray
+    """Whether each image contains a readable value (one byte per image that is 1 if so and 0 if not)"""
+
+
+def _get_kind(tag_id: int, tag_type: int) -> Optional[str]:
+    if tag_type == ExifType.ASCII or tag_id in _STRING_TAG_IDS:
+        return STRING_COLUMN
+
+    if tag_type in _INT_FORMATS:
+        return INT_COLUMN
+
+    if tag_type in _RATIONAL_TYPES:
+        return FLOAT_COLUMN
+
+    return None
+
+
+def _read_numbers(
+    app1: App1MetaData,
+    tag_type: int,
+    value_offset: int,
+    width: int,
+    rational_pairs: bool,
+) -> Sequence[Union[int, float]]:
+    decoder = app1.decoder
+
+    if tag_type in _INT_FORMATS:
+        numbers = struct.unpack_from(
+            f"{decoder.byte_order}{width}{_INT_FORMATS[tag_type]}",
+            app1.body_view,
+            value_offset,
+        )
+
+        if rational_pairs:
+            return [field for number in numbers for field in (number, 1)]
+
+        return numbers
+
+    fields = decoder.read_rationals(
+        app1.body_view,
+        value_offset,
+        width,
+        signed=tag_type == ExifType.SRATIONAL,
+    )
+
+    return fields if rational_pairs else divide_rationals(fields)
+
+
+def _read_string(
+    app1: App1MetaData, tag_id: int, value_offset: int, value_nbytes: int
+) -> Optional[bytes]:
+    value_bytes = bytes(app1.body_view[value_offset : value_offset + value_nbytes])
+    if len(value_bytes) < value_nbytes:
+        return None  # truncated APP1 body
+
+    if tag_id in _XP_TAG_IDS:
+        try:
+            return value_bytes.decode("utf-16")[:-1].encode("utf-8")
+        except UnicodeDecodeError:
+            return None
+
+    if tag_id == _USER_COMMENT_TAG_ID:
+        value_bytes = value_bytes[USER_COMMENT_CHARACTER_CODE_LEN_BYTES:]
+    elif tag_id != _EXIF_VERSION_TAG_ID:
+        value_bytes = value_bytes.rstrip(b"\x00")
+
+    return value_bytes if value_bytes.isascii() else None
+
+
+class _ValueLocation(NamedTuple):
+
+    """Location of a tag's value within an APP1 body."""
+
+    tag_type: int
+    """EXIF type"""
+
+    value_count: int
+    """Number of values"""
+
+    value_offset: int
+    """Offset of the value within the APP1 body"""
+
+    value_nbytes: int
+    """Number of bytes occupied by the value"""
+
+
+def _locate_value(app1: App1MetaData, tag_id: int) -> Optional[_ValueLocation]:
+    try:
+        tag_type, tag_offset = app1.ifd_tags.get_tag_location(tag_id)
+    except KeyError:
+        return None
+
+    tag_t = app1.decoder.read_ifd_tag(app1.body_view, tag_offset)
+    value_nbytes = get_value_nbytes(tag_type, tag_t.value_count)
+
+    if value_nbytes is None:
+        return None
+
+    if value_nbytes <= INLINE_VALUE_NBYTES:
+        value_offset = tag_offset + IFD_TAG_VALUE_OFFSET
+    else:
+        value_offset = tag_t.value_offset
+
+    return _ValueLocation(tag_type, tag_t.value_count, value_offset, value_nbytes)
+
+
+class _ColumnBuilder:
+
+    """Pre-sized column that the values of each image are filled into."""
+
+    def __init__(self, tag_id: int, kind: str, row_count: int) -> None:
+        self.tag_id = tag_id
+        self.kind = kind
+        self.valid = bytearray(row_count)
+
+    def _accepts(self, kind: str) -> bool:
+        # Determine if values of a tag kind can be filled into the column.
+        return kind == self.kind
+
+    def _fill(self, row: int, app1: App1MetaData, location: _ValueLocation) -> bool:
+        raise NotImplementedError
+
+    def fill(self, row: int, app1: Optional[App1MetaData]) -> None:
+        """Fill in an image's value (or mark it invalid).
+
+        :param row: image index
+        :param app1: APP1 metadata of the image (or ``None`` if it has none or couldn't be read)
+
+        """
+        if app1 is None:
+            return
+
+        location = _locate_value(app1, self.tag_id)
+        if location is None:
+            return
+
+        kind = _get_kind(self.tag_id, location.tag_type)
+        if kind is not None and self._accepts(kind) and self._fill(row, app1, location):
+            self.valid[row] = 1
+
+    def build(self) -> Column:
+        """Get the filled column.
+
+        :returns: column
+
+        """
+        raise NotImplementedError
+
+
+class _StringColumnBuilder(_ColumnBuilder):
+
+    """Pre-sized string column with the offset of each image's string."""
+
+    def __init__(self, tag_id: int, row_count: int) -> None:
+        super().__init__(tag_id, STRING_COLUMN, row_count)
+        self.values = bytearray()
+        self.offsets = array("q", bytes(8 * (row_count + 1)))
+
+    def _fill(self, row: int, app1: App1MetaData, location: _ValueLocation) -> bool:
+        value_bytes = _read_string(
+            app1, self.tag_id, location.value_offset, location.value_nbytes
+        )
+        if value_bytes is None:
+            return False
+
+        self.values += value_bytes
+        return True
+
+    def fill(self, row: int, app1: Optional[App1MetaData]) -> None:
+        super().fill(row, app1)
+        self.offsets[row + 1] = len(self.values)
+
+    def build(self) -> Column:
+        return Column(self.kind, 1, self.values, self.offsets, self.valid)
+
+
+class _NumericColumnBuilder(_ColumnBuilder):
+
+    """Pre-sized float64 or int64 column with a fixed number of values per image."""
+
+    def __init__(self, tag_id: int, kind: str, row_count: int) -> None:
+        super().__init__(tag_id, kind, row_count)
+        self.width = TAG_VALUE_COUNTS.get(tag_id, 1)
+        self.typecode = "d" if kind == FLOAT_COLUMN else "q"
+        row_nvalues = 2 * self.width if kind == RATIONAL_COLUMN else self.width
+        self.values = array(self.typecode, bytes(8 * row_count * row_nvalues))
+
+    def _accepts(self, kind: str) -> bool:
+        if self.kind == INT_COLUMN:
+            return kind == INT_COLUMN
+
+        return kind in (FLOAT_COLUMN, INT_COLUMN)
+
+    def _fill(self, row: int, app1: App1MetaData, location: _ValueLocation) -> bool:
+        if location.value_count != self.width:
+            return False
+
+        try:
+            numbers = _read_numbers(
+                app1,
+                location.tag_type,
+                location.value_offset,
+                self.width,
+                self.kind == RATIONAL_COLUMN,
+            )
+        except (struct.error, ZeroDivisionError):  # truncated APP1 body or n/0
+            return False
+
+        # Pack the values directly into the column's buffer (in native byte order like the array itself).
+        row_nvalues = len(numbers)
+        struct.pack_into(
+            f"={row_nvalues}{self.typecode}",
+            self.values,
+            row * row_nvalues * self.values.itemsize,
+            *numbers,
+        )
+        return True
+
+    def build(self) -> Column:
+        return Column(self.kind, self.width, self.values, None, self.valid)
+
+
+def _create_builder(
+    tag_id: int, kind: str, row_count: int, rational_pairs: bool
+) -> _ColumnBuilder:
+    if kind == STRING_COLUMN:
+        return _StringColumnBuilder(tag_id, row_count)
+
+    if kind == FLOAT_COLUMN and rational_pairs:
+        kind = RATIONAL_COLUMN
+
+    return _NumericColumnBuilder(tag_id, kind, row_count)
+
+
+class _PendingColumnBuilder:
+
+    """Column of a tag whose type is unknown to this package (which follows the first image containing the tag)."""
+
+    def __init__(self, tag_id: int, row_count: int, rational_pairs: bool) -> None:
+        self.tag_id = tag_id
+        self.row_count = row_count
+        self.rational_pairs = rational_pairs
+        self.builder: Optional[_ColumnBuilder] = None
+
+    def fill(self, row: int, app1: Optional[App1MetaData]) -> None:
+        """Fill in an image's value (or mark it invalid).
+
+        :param row: image index
+        :param app1: APP1 metadata of the image (or ``None`` if it has none or couldn't be read)
+
+        """
+        if self.builder is None and app1 is not None:
+            try:
+                tag_type, _ = app1.ifd_tags.get_tag_location(self.tag_id)
+            except KeyError:
+                return
+
+            kind = _get_kind(self.tag_id, tag_type)
+            if kind is None:
+                return
+
+            # The images before this one don't contain the tag, so they're all invalid.
+            self.builder = _create_builder(
+                self.tag_id, kind, self.row_count, self.rational_pairs
+            )
+
+        if self.builder is not None:
+            self.builder.fill(row, app1)
+
+    def build(self) -> Column:
+        """Get the filled column.
+
+        :returns: column
+
+        """
+        if self.builder is None:
+            # Not found in any image.
+            self.builder = _create_builder(
+                self.tag_id, FLOAT_COLUMN, self.row_count, self.rational_pairs
+            )
+
+        return self.builder.build()
+
+
+def read_columns(
+    paths: Iterable[PathType], tags: Iterable[str], rational_pairs: bool = False
+) -> Dict[str, Column]:
+    """Read tag values from many image files into one typed column per tag.
+
+    Each tag's values are decoded directly into a pre-sized column (without constructing a Python object per image):
+    rational values into float64 columns, integer values (e.g., enumerations) into int64 columns, and strings into
+    UTF-8 encoded bytes with int64 offsets (i.e., the Arrow ``large_string`` layout). Each column's validity mask marks
+    the images that don't contain the tag or whose value couldn't be read (e.g., files that aren't valid images).
+
+    A tag's column kind follows its EXIF type. Tags with a fixed number of values (e.g., GPS latitude) occupy that many
+    values per image and images with a different number of values are invalid. The column kind of tags this package
+    can only read (i.e., not add) follows the first image containing the tag (defaulting to float if none do). Values
+    of other types (e.g., maker notes) are always invalid.
+
+    :param paths: image file paths (which may be a lazily-evaluated iterable)
+    :param tags: names of tags to read
+    :param rational_pairs: read rational values into int64 columns of undivided numerator and denominator pairs
+        (e.g., to divide them in bulk using NumPy) instead of float64 columns
+    :returns: column of each tag keyed by tag name (each with one row per path)
+    :raises ValueError: unknown tag name
+
+    """
+    tag_names = [tag.lower() for tag in tags]
+    get_tag_ids(tag_names)  # validate the tag names before reading any files
+    paths = list(paths)
+
+    builders: List[Union[_ColumnBuilder, _PendingColumnBuilder]] = []
+
+    for tag in tag_names:
+        tag_id = ATTRIBUTE_ID_MAP[tag]
+        kind = None
+
+        if tag in ATTRIBUTE_TYPE_MAP:
+            tag_type, _ = ATTRIBUTE_TYPE_MAP[tag]
+            kind = _get_kind(tag_id, tag_type)
+
+        if kind is None:
+            builders.append(_PendingColumnBuilder(tag_id, len(paths), rational_pairs))
+        else:
+            builders.append(_create_builder(tag_id, kind, len(paths), rational_pairs))
+
+    for row, path in enumerate(paths):
+        try:
+            image = Image(os.fspath(path), header_only=True, tags=tag_names)
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("unable to read image %r", path)
+            app1 = None
+        else:
+            app1 = get_app1_metadata(image)
+
+        for builder in builders:
+            builder.fill(row, app1)
+
+    return {tag: builder.build() for tag, builder in zip(tag_names, builders)}
@@ -2,6 +2,7 @@
 # pylint: disable=too-few-public-methods
 
 from enum import IntEnum
+from typing import Dict, Tuple, Union
 
 
 class ColorSpace(IntEnum):
@@ -510,104 +511,126 @@ ATTRIBUTE_ID_MAP = {
 
 ATTRIBUTE_NAME_MAP = {value: key for key, value in ATTRIBUTE_ID_MAP.items()}
 
-ATTRIBUTE_TYPE_MAP = (
-    {  # tuple of type ID and IFD number description used when adding new tags
-        "aperture_value": (int(ExifTypes.RATIONAL), "exif"),
-        "artist": (int(ExifTypes.ASCII), 0),
-        "body_serial_number": (int(ExifTypes.ASCII), "exif"),
-        "brightness_value": (int(ExifTypes.SRATIONAL), "exif"),
-        "color_space": (int(ExifTypes.SHORT), "exif"),
-        "contrast": (int(ExifTypes.SHORT), "exif"),
-        "copyright": (int(ExifTypes.ASCII), 0),
-        "custom_rendered": (int(ExifTypes.SHORT), "exif"),
-        "datetime": (int(ExifTypes.ASCII), 0),
-        "datetime_digitized": (int(ExifTypes.ASCII), "exif"),
-        "datetime_original": (int(ExifTypes.ASCII), "exif"),
-        "digital_zoom_ratio": (int(ExifTypes.RATIONAL), "exif"),
-        "exposure_bias_value": (int(ExifTypes.SRATIONAL), "exif"),
-        "exposure_index": (int(ExifTypes.RATIONAL), "exif"),
-        "exposure_mode": (int(ExifTypes.SHORT), "exif"),
-        "exposure_program": (int(ExifTypes.SHORT), "exif"),
-        "exposure_time": (int(ExifTypes.RATIONAL), "exif"),
-        "f_number": (int(ExifTypes.RATIONAL), "exif"),
-        "flash": (int(ExifTypes.SHORT), "exif"),
-        "flash_energy": (int(ExifTypes.RATIONAL), "exif"),
-        "focal_length": (int(ExifTypes.RATIONAL), "exif"),
-        "focal_length_in_35mm_film": (int(ExifTypes.SHORT), "exif"),
-        "focal_plane_resolution_unit": (int(ExifTypes.SHORT), "exif"),
-        "focal_plane_x_resolution": (int(ExifTypes.RATIONAL), "exif"),
-        "focal_plane_y_resolution": (int(ExifTypes.RATIONAL), "exif"),
-        "gain_control": (int(ExifTypes.RATIONAL), "exif"),
-        "gps_altitude": (int(ExifTypes.RATIONAL), "gps"),
-        "gps_altitude_ref": (int(ExifTypes.BYTE), "gps"),
-        "gps_datestamp": (int(ExifTypes.ASCII), "gps"),
-        "gps_dest_bearing": (int(ExifTypes.RATIONAL), "gps"),
-        "gps_dest_bearing_ref": (int(ExifTypes.ASCII), "gps"),
-        "gps_dest_distance": (int(ExifTypes.RATIONAL), "gps"),
-        "gps_dest_distance_ref": (int(ExifTypes.ASCII), "gps"),
-        "gps_dest_latitude": (int(ExifTypes.RATIONAL), "gps"),
-        "gps_dest_latitude_ref": (int(ExifTypes.ASCII), "gps"),
-        "gps_dest_longitude": (int(ExifTypes.RATIONAL), "gps"),
-        "gps_dest_longitude_ref": (int(ExifTypes.ASCII), "gps"),
-        "gps_differential": (int(ExifTypes.SHORT), "gps"),
-        "gps_dop": (int(ExifTypes.RATIONAL), "gps"),
-        "gps_img_direction": (int(ExifTypes.RATIONAL), "gps"),
-        "gps_img_direction_ref": (int(ExifTypes.ASCII), "gps"),
-        "gps_latitude": (int(ExifTypes.RATIONAL), "gps"),
-        "gps_latitude_ref": (int(ExifTypes.ASCII), "gps"),
-        "gps_longitude": (int(ExifTypes.RATIONAL), "gps"),
-        "gps_longitude_ref": (int(ExifTypes.ASCII), "gps"),
-        "gps_map_datum": (int(ExifTypes.ASCII), "gps"),
-        "gps_measure_mode": (int(ExifTypes.ASCII), "gps"),
-        "gps_satellites": (int(ExifTypes.ASCII), "gps"),
-        "gps_speed": (int(ExifTypes.RATIONAL), "gps"),
-        "gps_speed_ref": (int(ExifTypes.ASCII), "gps"),
-        "gps_status": (int(ExifTypes.ASCII), "gps"),
-        "gps_timestamp": (int(ExifTypes.RATIONAL), "gps"),
-        "gps_track": (int(ExifTypes.RATIONAL), "gps"),
-        "gps_track_ref": (int(ExifTypes.ASCII), "gps"),
-        "gps_version_id": (int(ExifTypes.BYTE), "gps"),
-        "image_description": (int(ExifTypes.ASCII), 0),
-        "image_unique_id": (int(ExifTypes.ASCII), "exif"),
-        "iso_speed": (int(ExifTypes.SHORT), "exif"),
-        "lens_specification": (int(ExifTypes.RATIONAL), "exif"),
-        "lens_make": (int(ExifTypes.ASCII), "exif"),
-        "lens_model": (int(ExifTypes.ASCII), "exif"),
-        "lens_serial_number": (int(ExifTypes.ASCII), "exif"),
-        "light_source": (int(ExifTypes.SHORT), "exif"),
-        "make": (int(ExifTypes.ASCII), 0),
-        "max_aperture_value": (int(ExifTypes.RATIONAL), 0),
-        "metering_mode": (int(ExifTypes.SHORT), "exif"),
-        "model": (int(ExifTypes.ASCII), 0),
-        "rating": (int(ExifTypes.SHORT), "exif"),
-        "rating_percent": (int(ExifTypes.SHORT), "exif"),
-        "orientation": (int(ExifTypes.SHORT), 0),
-        "pixel_x_dimension": (int(ExifTypes.SHORT), "exif"),
-        "pixel_y_dimension": (int(ExifTypes.SHORT), "exif"),
-        "saturation": (int(ExifTypes.SHORT), "exif"),
-        "scene_capture_type": (int(ExifTypes.SHORT), "exif"),
-        "sensing_method": (int(ExifTypes.SHORT), "exif"),
-        "shutter_speed_value": (int(ExifTypes.SRATIONAL), "exif"),
-        "software": (int(ExifTypes.ASCII), 0),
-        "sharpness": (int(ExifTypes.SHORT), "exif"),
-        "spectral_sensitivity": (int(ExifTypes.ASCII), "exif"),
-        "photographic_sensitivity": (int(ExifTypes.SHORT), "exif"),
-        "subsec_time": (int(ExifTypes.ASCII), "exif"),
-        "subsec_time_original": (int(ExifTypes.ASCII), "exif"),
-        "subsec_time_digitized": (int(ExifTypes.ASCII), "exif"),
-        "subject_distance": (int(ExifTypes.RATIONAL), "exif"),
-        "subject_distance_range": (int(ExifTypes.SHORT), "exif"),
-        "subject_location": (int(ExifTypes.SHORT), "exif"),
-        "user_comment": (
-            7,
-            "exif",
-        ),  # 7 is UNDEFINED (if packed in enum, it would cause downstream issues)
-        "white_balance": (int(ExifTypes.SHORT), "exif"),
-        "_exif_ifd_pointer": (int(ExifTypes.LONG), 0),
-        "_gps_ifd_pointer": (int(ExifTypes.LONG), 0),
-        "_interoperability_ifd_Pointer": (int(ExifTypes.LONG), "exif"),
-    }
-)
+EXIF_IFD_POINTER_TAG_ID = ATTRIBUTE_ID_MAP["_exif_ifd_pointer"]
+GPS_IFD_POINTER_TAG_ID = ATTRIBUTE_ID_MAP["_gps_ifd_pointer"]
+INTEROPERABILITY_IFD_POINTER_TAG_ID = ATTRIBUTE_ID_MAP["_interoperability_ifd_Pointer"]
+THUMBNAIL_OFFSET_TAG_ID = ATTRIBUTE_ID_MAP["jpeg_interchange_format"]
+THUMBNAIL_LENGTH_TAG_ID = ATTRIBUTE_ID_MAP["jpeg_interchange_format_length"]
+
+TAG_VALUE_COUNTS = {
+    ATTRIBUTE_ID_MAP["bits_per_sample"]: 3,
+    ATTRIBUTE_ID_MAP["gps_dest_latitude"]: 3,
+    ATTRIBUTE_ID_MAP["gps_dest_longitude"]: 3,
+    ATTRIBUTE_ID_MAP["gps_latitude"]: 3,
+    ATTRIBUTE_ID_MAP["gps_longitude"]: 3,
+    ATTRIBUTE_ID_MAP["gps_timestamp"]: 3,
+    ATTRIBUTE_ID_MAP["gps_version_id"]: 4,
+    ATTRIBUTE_ID_MAP["lens_specification"]: 4,
+    ATTRIBUTE_ID_MAP["primary_chromaticities"]: 6,
+    ATTRIBUTE_ID_MAP["reference_black_white"]: 6,
+    ATTRIBUTE_ID_MAP["subsampling_ratio_of_y_to_c"]: 2,
+    ATTRIBUTE_ID_MAP["white_point"]: 2,
+}
+"""Number of values of numeric tags with a fixed number of values other than one (keyed by tag ID)."""
+
+ATTRIBUTE_TYPE_MAP: Dict[
+    str, Tuple[int, Union[int, str]]
+] = {  # tuple of type ID and IFD number description used when adding new tags
+    "aperture_value": (int(ExifTypes.RATIONAL), "exif"),
+    "artist": (int(ExifTypes.ASCII), 0),
+    "body_serial_number": (int(ExifTypes.ASCII), "exif"),
+    "brightness_value": (int(ExifTypes.SRATIONAL), "exif"),
+    "color_space": (int(ExifTypes.SHORT), "exif"),
+    "contrast": (int(ExifTypes.SHORT), "exif"),
+    "copyright": (int(ExifTypes.ASCII), 0),
+    "custom_rendered": (int(ExifTypes.SHORT), "exif"),
+    "datetime": (int(ExifTypes.ASCII), 0),
+    "datetime_digitized": (int(ExifTypes.ASCII), "exif"),
+    "datetime_original": (int(ExifTypes.ASCII), "exif"),
+    "digital_zoom_ratio": (int(ExifTypes.RATIONAL), "exif"),
+    "exposure_bias_value": (int(ExifTypes.SRATIONAL), "exif"),
+    "exposure_index": (int(ExifTypes.RATIONAL), "exif"),
+    "exposure_mode": (int(ExifTypes.SHORT), "exif"),
+    "exposure_program": (int(ExifTypes.SHORT), "exif"),
+    "exposure_time": (int(ExifTypes.RATIONAL), "exif"),
+    "f_number": (int(ExifTypes.RATIONAL), "exif"),
+    "flash": (int(ExifTypes.SHORT), "exif"),
+    "flash_energy": (int(ExifTypes.RATIONAL), "exif"),
+    "focal_length": (int(ExifTypes.RATIONAL), "exif"),
+    "focal_length_in_35mm_film": (int(ExifTypes.SHORT), "exif"),
+    "focal_plane_resolution_unit": (int(ExifTypes.SHORT), "exif"),
+    "focal_plane_x_resolution": (int(ExifTypes.RATIONAL), "exif"),
+    "focal_plane_y_resolution": (int(ExifTypes.RATIONAL), "exif"),
+    "gain_control": (int(ExifTypes.RATIONAL), "exif"),
+    "gps_altitude": (int(ExifTypes.RATIONAL), "gps"),
+    "gps_altitude_ref": (int(ExifTypes.BYTE), "gps"),
+    "gps_datestamp": (int(ExifTypes.ASCII), "gps"),
+    "gps_dest_bearing": (int(ExifTypes.RATIONAL), "gps"),
+    "gps_dest_bearing_ref": (int(ExifTypes.ASCII), "gps"),
+    "gps_dest_distance": (int(ExifTypes.RATIONAL), "gps"),
+    "gps_dest_distance_ref": (int(ExifTypes.ASCII), "gps"),
+    "gps_dest_latitude": (int(ExifTypes.RATIONAL), "gps"),
+    "gps_dest_latitude_ref": (int(ExifTypes.ASCII), "gps"),
+    "gps_dest_longitude": (int(ExifTypes.RATIONAL), "gps"),
+    "gps_dest_longitude_ref": (int(ExifTypes.ASCII), "gps"),
+    "gps_differential": (int(ExifTypes.SHORT), "gps"),
+    "gps_dop": (int(ExifTypes.RATIONAL), "gps"),
+    "gps_img_direction": (int(ExifTypes.RATIONAL), "gps"),
+    "gps_img_direction_ref": (int(ExifTypes.ASCII), "gps"),
+    "gps_latitude": (int(ExifTypes.RATIONAL), "gps"),
+    "gps_latitude_ref": (int(ExifTypes.ASCII), "gps"),
+    "gps_longitude": (int(ExifTypes.RATIONAL), "gps"),
+    "gps_longitude_ref": (int(ExifTypes.ASCII), "gps"),
+    "gps_map_datum": (int(ExifTypes.ASCII), "gps"),
+    "gps_measure_mode": (int(ExifTypes.ASCII), "gps"),
+    "gps_satellites": (int(ExifTypes.ASCII), "gps"),
+    "gps_speed": (int(ExifTypes.RATIONAL), "gps"),
+    "gps_speed_ref": (int(ExifTypes.ASCII), "gps"),
+    "gps_status": (int(ExifTypes.ASCII), "gps"),
+    "gps_timestamp": (int(ExifTypes.RATIONAL), "gps"),
+    "gps_track": (int(ExifTypes.RATIONAL), "gps"),
+    "gps_track_ref": (int(ExifTypes.ASCII), "gps"),
+    "gps_version_id": (int(ExifTypes.BYTE), "gps"),
+    "image_description": (int(ExifTypes.ASCII), 0),
+    "image_unique_id": (int(ExifTypes.ASCII), "exif"),
+    "iso_speed": (int(ExifTypes.SHORT), "exif"),
+    "lens_specification": (int(ExifTypes.RATIONAL), "exif"),
+    "lens_make": (int(ExifTypes.ASCII), "exif"),
+    "lens_model": (int(ExifTypes.ASCII), "exif"),
+    "lens_serial_number": (int(ExifTypes.ASCII), "exif"),
+    "light_source": (int(ExifTypes.SHORT), "exif"),
+    "make": (int(ExifTypes.ASCII), 0),
+    "max_aperture_value": (int(ExifTypes.RATIONAL), 0),
+    "metering_mode": (int(ExifTypes.SHORT), "exif"),
+    "model": (int(ExifTypes.ASCII), 0),
+    "rating": (int(ExifTypes.SHORT), "exif"),
+    "rating_percent": (int(ExifTypes.SHORT), "exif"),
+    "orientation": (int(ExifTypes.SHORT), 0),
+    "pixel_x_dimension": (int(ExifTypes.SHORT), "exif"),
+    "pixel_y_dimension": (int(ExifTypes.SHORT), "exif"),
+    "saturation": (int(ExifTypes.SHORT), "exif"),
+    "scene_capture_type": (int(ExifTypes.SHORT), "exif"),
+    "sensing_method": (int(ExifTypes.SHORT), "exif"),
+    "shutter_speed_value": (int(ExifTypes.SRATIONAL), "exif"),
+    "software": (int(ExifTypes.ASCII), 0),
+    "sharpness": (int(ExifTypes.SHORT), "exif"),
+    "spectral_sensitivity": (int(ExifTypes.ASCII), "exif"),
+    "photographic_sensitivity": (int(ExifTypes.SHORT), "exif"),
+    "subsec_time": (int(ExifTypes.ASCII), "exif"),
+    "subsec_time_original": (int(ExifTypes.ASCII), "exif"),
+    "subsec_time_digitized": (int(ExifTypes.ASCII), "exif"),
+    "subject_distance": (int(ExifTypes.RATIONAL), "exif"),
+    "subject_distance_range": (int(ExifTypes.SHORT), "exif"),
+    "subject_location": (int(ExifTypes.SHORT), "exif"),
+    "user_comment": (
+        7,
+        "exif",
+    ),  # 7 is UNDEFINED (if packed in enum, it would cause downstream issues)
+    "white_balance": (int(ExifTypes.SHORT), "exif"),
+    "_exif_ifd_pointer": (int(ExifTypes.LONG), 0),
+    "_gps_ifd_pointer": (int(ExifTypes.LONG), 0),
+    "_interoperability_ifd_Pointer": (int(ExifTypes.LONG), "exif"),
+}
 
 
 ERROR_IMG_NO_ATTR = "image does not have attribute {0}"
@@ -0,0 +1,206 @@
+"""Batch GPS coordinate extraction module."""
+
+import logging
+import os
+import struct
+from array import array
+from typing import Dict, Iterable, List, NamedTuple, Optional, Union
+
+from exif._batch import PathType
+from exif._constants import ATTRIBUTE_ID_MAP, GPS_IFD_POINTER_TAG_ID, GpsAltitudeRef
+from exif._datatypes import ExifType
+from exif._ifd_decoder import IfdDecoder, IfdTagEntry, divide_rationals
+from exif._positioned_read import (
+    ReadAt,
+    find_app1_body,
+    get_file_reader,
+    read_ifd,
+    read_tiff_header,
+)
+
+logger = logging.getLogger(__name__)
+
+_LATITUDE_REF_TAG_ID = ATTRIBUTE_ID_MAP["gps_latitude_ref"]
+_LATITUDE_TAG_ID = ATTRIBUTE_ID_MAP["gps_latitude"]
+_LONGITUDE_REF_TAG_ID = ATTRIBUTE_ID_MAP["gps_longitude_ref"]
+_LONGITUDE_TAG_ID = ATTRIBUTE_ID_MAP["gps_longitude"]
+_ALTITUDE_REF_TAG_ID = ATTRIBUTE_ID_MAP["gps_altitude_ref"]
+_ALTITUDE_TAG_ID = ATTRIBUTE_ID_MAP["gps_altitude"]
+
+_COORDINATE_SIGNS = {
+    _LATITUDE_REF_TAG_ID: {ord("N"): 1, ord("S"): -1},
+    _LONGITUDE_REF_TAG_ID: {ord("E"): 1, ord("W"): -1},
+}
+"""Sign of each coordinate reference character keyed by reference tag ID."""
+
+
+class GpsArrays(NamedTuple):
+
+    """GPS coordinates of many images read by ``read_gps_many()`` (one row per image).
+
+    Every member supports the buffer protocol, so it converts to a NumPy or Arrow array without copying it.
+
+    """
+
+    latitude: array
+    """Latitude of each image in signed decimal degrees (north is positive) as a float64 ``array`` (zero if invalid)"""
+
+    longitude: array
+    """Longitude of each image in signed decimal degrees (east is positive) as a float64 ``array`` (zero if invalid)"""
+
+    altitude: array
+    """Altitude of each image in meters relative to sea level as a float64 ``array`` (zero if invalid)"""
+
+    valid: bytearray
+    """Whether each image contains a readable latitude and longitude (one byte per image that is 1 if so and 0 if
+    not)"""
+
+    altitude_valid: bytearray
+    """Whether each image contains a readable altitude (one byte per image that is 1 if so and 0 if not)"""
+
+
+class _GpsIfd(NamedTuple):
+
+    """GPS IFD tags of an image along with how to decode their values."""
+
+    decoder: IfdDecoder
+    """Decoder for the TIFF byte order"""
+
+    body_offset: int
+    """Offset of the APP1 body (i.e., the TIFF header) within the image"""
+
+    tags: Dict[int, IfdTagEntry]
+    """GPS IFD tags keyed by tag ID"""
+
+
+def _read_gps_ifd(read_at: ReadAt) -> Optional[_GpsIfd]:
+    body_offset = find_app1_body(read_at)
+    if body_offset is None:
+        return None
+
+    decoder, ifd0_offset = read_tiff_header(read_at, body_offset)
+    ifd0_tags, _ = read_ifd(read_at, decoder, body_offset + ifd0_offset)
+
+    for tag_t in ifd0_tags:
+        if tag_t.tag_id == GPS_IFD_POINTER_TAG_ID:
+            gps_tags, _ = read_ifd(read_at, decoder, body_offset + tag_t.value_offset)
+            return _GpsIfd(
+                decoder,
+                body_offset,
+                {gps_tag_t.tag_id: gps_tag_t for gps_tag_t in gps_tags},
+            )
+
+    return None
+
+
+def _read_inline_byte(gps_ifd: _GpsIfd, tag_id: int, tag_type: int) -> Optional[int]:
+    # References (e.g., N for north) fit within the IFD tag's value offset field itself.
+    tag_t = gps_ifd.tags.get(tag_id)
+    if tag_t is None or tag_t.type != tag_type or not 1 <= tag_t.value_count <= 4:
+        return None
+
+    return gps_ifd.decoder.uint32.pack(tag_t.value_offset)[0]
+
+
+def _read_rational_values(
+    read_at: ReadAt, gps_ifd: _GpsIfd, tag_id: int, count: int
+) -> Optional[List[Union[int, float]]]:
+    tag_t = gps_ifd.tags.get(tag_id)
+    if tag_t is None or tag_t.type != ExifType.RATIONAL or tag_t.value_count != count:
+        return None
+
+    decoder = gps_ifd.decoder
+    rational_bytes = read_at(
+        gps_ifd.body_offset + tag_t.value_offset, count * decoder.rational.size
+    )
+
+    try:
+        return divide_rationals(decoder.read_rationals(rational_bytes, 0, count))
+    except ZeroDivisionError:
+        return None
+
+
+def _read_coordinate(
+    read_at: ReadAt, gps_ifd: _GpsIfd, tag_id: int, ref_tag_id: int
+) -> Optional[float]:
+    ref = _read_inline_byte(gps_ifd, ref_tag_id, ExifType.ASCII)
+    if ref not in _COORDINATE_SIGNS[ref_tag_id]:
+        return None
+
+    values = _read_rational_values(read_at, gps_ifd, tag_id, 3)
+    if values is None:
+        return None
+
+    degrees, minutes, seconds = values
+    return _COORDINATE_SIGNS[ref_tag_id][ref] * (
+        degrees + minutes / 60 + seconds / 3600
+    )
+
+
+def _read_altitude(read_at: ReadAt, gps_ifd: _GpsIfd) -> Optional[float]:
+    values = _read_rational_values(read_at, gps_ifd, _ALTITUDE_TAG_ID, 1)
+    if values is None:
+        return None
+
+    (altitude,) = values
+    ref = _read_inline_byte(gps_ifd, _ALTITUDE_REF_TAG_ID, ExifType.BYTE)
+
+    # The reference defaults to above sea level if absent.
+    return -altitude if ref == GpsAltitudeRef.BELOW_SEA_LEVEL else altitude
+
+
+def read_gps_many(paths: Iterable[PathType]) -> GpsArrays:
+    """Read the GPS coordinates of many image files into contiguous arrays.
+
+    Only the TIFF header, IFD 0, the GPS IFD, and the latitude, longitude, and altitude values are read from each file
+    (without parsing the rest of its EXIF metadata). Each coordinate's degrees, minutes, and seconds are combined with
+    its reference (e.g., south) into signed decimal degrees. Images without a latitude, longitude, and their references
+    (or that couldn't be read) are marked invalid, as are images without an altitude (separately).
+
+    :param paths: image file paths (which may be a lazily-evaluated iterable)
+    :returns: coordinate arrays and validity masks (each with one row per path)
+
+    """
+    paths = list(paths)
+    row_count = len(paths)
+
+    gps_arrays = GpsArrays(
+        latitude=array("d", bytes(8 * row_count)),
+        longitude=array("d", bytes(8 * row_count)),
+        altitude=array("d", bytes(8 * row_count)),
+        valid=bytearray(row_count),
+        altitude_valid=bytearray(row_count),
+    )
+
+    for row, path in enumerate(paths):
+        try:
+            with open(os.fspath(path), "rb") as image_file:
+                read_at = get_file_reader(image_file)
+
+                gps_ifd = _read_gps_ifd(read_at)
+                if gps_ifd is None:
+                    continue
+
+                latitude = _read_coordinate(
+                    read_at, gps_ifd, _LATITUDE_TAG_ID, _LATITUDE_REF_TAG_ID
+                )
+                longitude = _read_coordinate(
+                    read_at, gps_ifd, _LONGITUDE_TAG_ID, _LONGITUDE_REF_TAG_ID
+                )
+                altitude = _read_altitude(read_at, gps_ifd)
+        except OSError:
+            logger.warning("unable to read image %r", path)
+            continue
+        except (struct.error, ValueError):
+            continue  # truncated or invalid EXIF metadata
+
+        if latitude is not None and longitude is not None:
+            gps_arrays.latitude[row] = latitude
+            gps_arrays.longitude[row] = longitude
+            gps_arrays.valid[row] = 1
+
+        if altitude is not None:
+            gps_arrays.altitude[row] = altitude
+            gps_arrays.altitude_valid[row] = 1
+
+    return gps_arrays
@@ -0,0 +1,188 @@
+"""Fast IFD decoding module (using ``struct`` instead of plum structures)."""
+
+import struct
+from typing import Dict, List, NamedTuple, Sequence, Tuple, Union
+
+from exif._datatypes import TiffByteOrder
+
+IFD_TAG_VALUE_COUNT_OFFSET = 4
+"""Offset of the value count field within an IFD tag (i.e., after the tag ID and type)."""
+
+IFD_TAG_VALUE_OFFSET = 8
+"""Offset of the value offset field within an IFD tag (i.e., after the tag ID, type, and value count)."""
+
+_MAX_PRECOMPILED_RATIONAL_COUNT = 8
+"""Maximum number of RATIONAL values (e.g., 4 for lens specification) decoded using a precompiled structure."""
+
+
+class IfdTagEntry(NamedTuple):
+
+    """Decoded IFD tag."""
+
+    tag_id: int
+    """Tag ID"""
+
+    type: int
+    """EXIF type"""
+
+    value_count: int
+    """Number of values"""
+
+    value_offset: int
+    """Value offset field (i.e., a pointer or the value itself if it fits within the IFD tag)"""
+
+
+class IfdDecoder(NamedTuple):
+
+    """Precompiled structures for decoding IFDs and tag values of a particular TIFF byte order.
+
+    Use ``get_decoder()`` to get the shared instance for a byte order.
+
+    """
+
+    byte_order: str
+    """``struct`` byte order character"""
+
+    ifd_count: struct.Struct
+    """Number of tags in an IFD"""
+
+    ifd_tag: struct.Struct
+    """Tag ID, type, value count, and value offset field of an IFD tag"""
+
+    uint8: struct.Struct
+    """BYTE value"""
+
+    uint16: struct.Struct
+    """SHORT value"""
+
+    uint32: struct.Struct
+    """LONG value"""
+
+    sint16: struct.Struct
+    """SSHORT value"""
+
+    rational: struct.Struct
+    """RATIONAL value (i.e., numerator and denominator)"""
+
+    srational: struct.Struct
+    """SRATIONAL value (i.e., numerator and denominator)"""
+
+    rational_arrays: Tuple[List[struct.Struct], List[struct.Struct]]
+    """Consecutive RATIONAL and SRATIONAL values, respectively, indexed by number of values"""
+
+    def read_ifd(self, buffer, offset: int) -> Tuple[List[IfdTagEntry], int]:
+        """Decode the tags of an IFD.
+
+        :param buffer: APP1 body bytes
+        :param offset: offset of the IFD
+        :returns: IFD tags and offset of the next IFD (or 0 if it's the last IFD)
+        :raises struct.error: IFD extends beyond the end of the buffer
+
+        """
+        (tag_count,) = self.ifd_count.unpack_from(buffer, offset)
+        tags_start = offset + self.ifd_count.size
+        tags_stop = tags_start + tag_count * self.ifd_tag.size
+
+        (next_ifd_offset,) = self.uint32.unpack_from(buffer, tags_stop)
+        tags = [
+            IfdTagEntry(*fields)
+            for fields in self.ifd_tag.iter_unpack(buffer[tags_start:tags_stop])
+        ]
+
+        return tags, next_ifd_offset
+
+    def read_ifd_tag(self, buffer, offset: int) -> IfdTagEntry:
+        """Decode a single IFD tag.
+
+        :param buffer: APP1 body bytes
+        :param offset: offset of the IFD tag
+        :returns: IFD tag
+
+        """
+        return IfdTagEntry(*self.ifd_tag.unpack_from(buffer, offset))
+
+    def read_rationals(
+        self, buffer, offset: int, count: int, signed: bool = False
+    ) -> Tuple[int, ...]:
+        """Decode consecutive RATIONAL (or SRATIONAL) values at once.
+
+        :param buffer: APP1 body bytes
+        :param offset: offset of the first value
+        :param count: number of values
+        :param signed: decode SRATIONAL values instead of RATIONAL values
+        :returns: numerator and denominator of each value (interleaved)
+        :raises struct.error: values extend beyond the end of the buffer
+
+        """
+        rational_arrays = self.rational_arrays[signed]
+
+        if count >= len(rational_arrays):  # uncommonly many values
+            return struct.unpack_from(
+                f"{self.byte_order}{2 * count}{'i' if signed else 'I'}", buffer, offset
+            )
+
+        return rational_arrays[count].unpack_from(buffer, offset)
+
+
+def divide_rationals(fields: Sequence[int]) -> List[Union[int, float]]:
+    """Divide the numerator of each rational value by its denominator.
+
+    EXIF 2.3 Specification: "When a value is unknown, the notation is 0/0" (e.g., lens specification), so 0/0 is
+    decoded as 0.
+
+    :param fields: numerator and denominator of each value (interleaved, e.g., from ``IfdDecoder.read_rationals()``)
+    :returns: value of each rational
+    :raises ZeroDivisionError: denominator of 0 with a non-zero numerator
+
+    """
+    values = []
+
+    for index in range(0, len(fields), 2):
+        numerator = fields[index]
+        denominator = fields[index + 1]
+        values.append(numerator / denominator if numerator or denominator else 0)
+
+    return values
+
+
+def _compile_rational_arrays(byte_order: str, format_char: str) -> List[struct.Struct]:
+    # Structures for 0 through the maximum precompiled number of consecutive rational values.
+    return [
+        struct.Struct(f"{byte_order}{2 * count}{format_char}")
+        for count in range(_MAX_PRECOMPILED_RATIONAL_COUNT + 1)
+    ]
+
+
+def _create_decoder(endianness: int) -> IfdDecoder:
+    byte_order = ">" if endianness == TiffByteOrder.BIG else "<"
+
+    return IfdDecoder(
+        byte_order=byte_order,
+        ifd_count=struct.Struct(byte_order + "H"),
+        ifd_tag=struct.Struct(byte_order + "HHII"),
+        uint8=struct.Struct(byte_order + "B"),
+        uint16=struct.Struct(byte_order + "H"),
+        uint32=struct.Struct(byte_order + "I"),
+        sint16=struct.Struct(byte_order + "h"),
+        rational=struct.Struct(byte_order + "II"),
+        srational=struct.Struct(byte_order + "ii"),
+        rational_arrays=(
+            _compile_rational_arrays(byte_order, "I"),
+            _compile_rational_arrays(byte_order, "i"),
+        ),
+    )
+
+
+_DECODERS: Dict[int, IfdDecoder] = {
+    byte_order: _create_decoder(byte_order) for byte_order in TiffByteOrder
+}
+
+
+def get_decoder(endianness: int) -> IfdDecoder:
+    """Get the (shared) decoder for a TIFF byte order.
+
+    :param endianness: TIFF byte order
+    :returns: decoder instance
+
+    """
+    return _DECODERS[endianness]
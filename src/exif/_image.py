@@ -1,85 +1,246 @@
 """Image EXIF metadata interface module."""
 
+import contextlib
 import logging
+import mmap
 import os
+import shutil
+import socket
+import tempfile
 import warnings
-from typing import Any, BinaryIO, Dict, List, Union
-
-from plum.bigendian import uint16
-
-from exif._constants import ATTRIBUTE_ID_MAP, ExifMarkers
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from exif._constants import ATTRIBUTE_ID_MAP, ERROR_IMG_NO_ATTR, ExifMarkers
 from exif._app1_create import generate_empty_app1_bytes
 from exif._app1_metadata import App1MetaData
+from exif._instrumentation import (
+    BYTES_SCANNED,
+    GET_FILE,
+    PARSE_SEGMENTS,
+    increment,
+    timed,
+)
+from exif._jpeg_segments import (
+    JpegSegment,
+    is_exif_app1,
+    is_header_complete,
+    walk_segments,
+)
 
 logger = logging.getLogger(__name__)
 
+HEADER_CHUNK_SIZE = 0x4000
+"""Number of bytes requested per read when only loading the image header."""
 
-class Image:
+_DELETED = object()
+"""Placeholder value of tags deleted within an ``Image.edit()`` block."""
 
-    """Image EXIF metadata interface class.
 
-    :param img_file: image file with EXIF metadata
-    :type image_file: str (file path), bytes (already-read contents), or File
+def _read_header_bytes(
+    img_file: BinaryIO, chunk_size: int = HEADER_CHUNK_SIZE
+) -> bytes:
+    """Read image bytes in chunks until the end of the APP1 segment.
+
+    Segments are traversed using their length fields, so reading stops shortly after the APP1 segment (or at the
+    start of scan if there is no APP1 segment) without ever loading the entropy-coded image data.
+
+    :param img_file: image file object positioned at the start of the image
+    :param chunk_size: number of bytes to request per read
+    :returns: image bytes up to and including the first segment prefix after the APP1 segment
 
     """
+    header_bytes = bytearray()
 
-    def _parse_segments(self, img_bytes: bytes) -> None:
-        cursor = 0
+    while True:
+        chunk = img_file.read(chunk_size)
+        if not chunk:
+            break
 
-        # Traverse hexadecimal string until EXIF APP1 segment found.
-        while img_bytes[cursor : cursor + len(ExifMarkers.APP1)] != ExifMarkers.APP1:
-            cursor += len(ExifMarkers.APP1)
-            if cursor > len(img_bytes):
-                self._has_exif = False
-                cursor = 2  # should theoretically go after SOI marker (if adding)
-                break
+        header_bytes += chunk
 
-        self._segments["preceding"] = img_bytes[:cursor]
-        app1_start_index = cursor
+        if is_header_complete(header_bytes):
+            break
 
-        if self._has_exif:
-            # Determine the expected length of the APP1 segment.
-            app1_len = uint16.unpack(
-                img_bytes[app1_start_index + 2 : app1_start_index + 4]
-            )
-            cursor += app1_len + 2  # skip APP1 marker and all data
+    return bytes(header_bytes)
 
-            # If the expected length stops early, keep traversing until another section is found.
-            while img_bytes[cursor : cursor + 1] != ExifMarkers.SEG_PREFIX:
-                cursor += 1
-                # raise IOError("no subsequent EXIF segment found, is this an EXIF-encoded JPEG?")
-                if cursor > len(img_bytes):
-                    self._has_exif = False
-                    break
 
-        if self._has_exif:
-            # Instantiate an APP1 segment object to create an EXIF tag interface.
-            self._segments["APP1"] = App1MetaData(img_bytes[app1_start_index:cursor])
-            self._segments["succeeding"] = img_bytes[cursor:]
-        else:
-            # Store the remainder of the image so that it can be reconstructed when exporting.
-            self._segments["succeeding"] = img_bytes[app1_start_index:]
+def get_tag_ids(tags: Iterable[str]) -> FrozenSet[int]:
+    """Get the IDs of tags.
+
+    :param tags: tag names
+    :returns: tag IDs
+    :raises ValueError: unknown tag name
+
+    """
+    try:
+        return frozenset(ATTRIBUTE_ID_MAP[tag.lower()] for tag in tags)
+    except KeyError as exc:
+        raise ValueError(f"unknown image attribute {exc.args[0]}")
+
+
+def _write_at(
+    image_file: BinaryIO, data: Union[bytes, bytearray, memoryview], offset: int
+) -> None:
+    """Write bytes at the specified file offset."""
+    if hasattr(os, "pwrite"):
+        remaining_data = memoryview(data)
+        while remaining_data:
+            bytes_written = os.pwrite(image_file.fileno(), remaining_data, offset)
+            remaining_data = remaining_data[bytes_written:]
+            offset += bytes_written
+    else:  # pragma: no cover
+        image_file.seek(offset)
+        image_file.write(data)
+
+
+class _MemoryMap(NamedTuple):
+
+    """Memory map of an image file."""
+
+    file: BinaryIO
+    """Image file (kept open so that unmodified regions can be sent directly from it, e.g., to sockets)"""
+
+    mapping: mmap.mmap
+    """Read-only memory map of the entire file"""
+
+
+class _SourceFile(NamedTuple):
+
+    """File path an image was opened from."""
+
+    path: str
+    """Absolute file path"""
+
+    app1_segment: Optional[JpegSegment]
+    """Location of the EXIF APP1 segment within the file (or ``None`` if the file has no EXIF metadata)"""
+
+
+class Image:
+
+    """Image EXIF metadata interface class.
+
+    :param img_file: image file with EXIF metadata
+    :type image_file: str (file path), bytes (already-read contents), or File
+    :param bool header_only: only read the image up to the end of its EXIF metadata (the image is then read-only and
+        cannot be exported with ``get_file()``)
+    :param bool memory_map: memory map the image file (only applicable to file paths) instead of reading it into
+        memory, in which case call ``close()`` to release the mapping when finished with the image
+    :param tags: names of the only tags to parse (defaults to all tags), skipping IFDs that cannot contain them (all
+        tags are parsed before modifying the image)
+    :type tags: iterable of str
+    :raises ValueError: unknown tag name
+
+    """
 
     def __init__(
         self,
         img_file: Union[BinaryIO, bytes, str],  # pylint: disable=unsubscriptable-object
+        header_only: bool = False,
+        memory_map: bool = False,
+        tags: Optional[Iterable[str]] = None,
     ) -> None:
         self._has_exif = True
-        self._segments: Dict[
-            str, Union[App1MetaData, bytes]  # pylint: disable=unsubscriptable-object
-        ] = {}
+        self._header_only = header_only
+        self._memory_map: Optional[_MemoryMap] = None
+        self._segments: Dict[str, Union[App1MetaData, bytes, memoryview]] = {}
+        self._segment_table: List[JpegSegment] = []
+        self._source: Optional[_SourceFile] = None
+        self._staged_edits: Optional[Dict[str, Any]] = None
+
+        tag_projection = None if tags is None else get_tag_ids(tags)
+
+        if memory_map and not isinstance(img_file, str):
+            raise ValueError("memory mapping requires a file path as str")
+
+        self._parse_segments(
+            self._load_image(img_file, header_only, memory_map), tag_projection
+        )
 
+        if isinstance(img_file, str):
+            self._set_source_path(img_file)
+
+    def _load_image(
+        self,
+        img_file: Union[BinaryIO, bytes, str],  # pylint: disable=unsubscriptable-object
+        header_only: bool,
+        memory_map: bool,
+    ) -> Union[bytes, mmap.mmap]:
+        # Read the image (or only its header) unless already read, or memory map it.
         if hasattr(img_file, "read"):
-            img_bytes = img_file.read()  # type: ignore
-        elif isinstance(img_file, bytes):
-            img_bytes = img_file
-        elif os.path.isfile(img_file):  # type: ignore
-            with open(img_file, "rb") as file_descriptor:  # type: ignore
-                img_bytes = file_descriptor.read()
-        else:  # pragma: no cover
+            if header_only:
+                return _read_header_bytes(img_file)  # type: ignore
+
+            return img_file.read()  # type: ignore
+
+        if isinstance(img_file, bytes):
+            return img_file
+
+        if not os.path.isfile(img_file):  # pragma: no cover
             raise ValueError("expected file object, file path as str, or bytes")
 
-        self._parse_segments(img_bytes)
+        if memory_map:
+            mmap_file = open(img_file, "rb")  # pylint: disable=consider-using-with
+            self._memory_map = _MemoryMap(
+                mmap_file, mmap.mmap(mmap_file.fileno(), 0, access=mmap.ACCESS_READ)
+            )
+            return self._memory_map.mapping
+
+        with open(img_file, "rb") as file_descriptor:
+            if header_only:
+                return _read_header_bytes(file_descriptor)
+
+            return file_descriptor.read()
+
+    @timed(PARSE_SEGMENTS)
+    def _parse_segments(
+        self,
+        img_bytes: Union[bytes, mmap.mmap],
+        tag_projection: Optional[FrozenSet[int]],
+    ) -> None:
+        # Traverse segments by their length fields (up to the start of scan) instead of scanning image data.
+        self._segment_table, _ = walk_segments(img_bytes)
+        if self._segment_table:
+            increment(BYTES_SCANNED, self._segment_table[-1].end)
+
+        # Slice memory-mapped files into zero-copy views instead of copying them onto the heap.
+        if isinstance(img_bytes, mmap.mmap):
+            img_slicer: Union[bytes, memoryview] = memoryview(img_bytes)
+        else:
+            img_slicer = img_bytes
+
+        for segment in self._segment_table:
+            if is_exif_app1(img_bytes, segment):
+                self._has_exif = True
+
+                # Instantiate an APP1 segment object to create an EXIF tag interface.
+                self._segments["preceding"] = img_slicer[: segment.offset]
+                self._segments["APP1"] = App1MetaData(
+                    img_slicer[segment.offset : segment.end], tag_projection
+                )
+                succeeding_start_index = segment.end
+                break
+        else:
+            self._has_exif = False
+
+            # Position any added APP1 segment directly after the SOI marker.
+            self._segments["preceding"] = img_slicer[: len(ExifMarkers.SOI)]
+            succeeding_start_index = len(ExifMarkers.SOI)
+
+        if not self._header_only:
+            # Store the remainder of the image so that it can be reconstructed when exporting.
+            self._segments["succeeding"] = img_slicer[succeeding_start_index:]
 
     def __dir__(self) -> List[str]:
         members = [
@@ -109,6 +270,12 @@ class Image:
         except KeyError:
             super(Image, self).__setattr__(key, value)
         else:
+            self._check_writable()
+
+            if self._staged_edits is not None:
+                self._staged_edits[key.lower()] = value
+                return
+
             if not self._has_exif:
                 self._segments["APP1"] = App1MetaData(generate_empty_app1_bytes())
                 self._has_exif = True
@@ -121,8 +288,25 @@ class Image:
         except KeyError:
             super(Image, self).__delattr__(item)
         else:
+            self._check_writable()
+
+            if self._staged_edits is not None:
+                if self._staged_edits.get(
+                    item, _DELETED
+                ) is not _DELETED and not self._has_tag(item):
+                    del self._staged_edits[item]  # cancel the staged addition
+                else:
+                    self._staged_edits[item] = _DELETED
+                return
+
             delattr(self._segments["APP1"], item)
 
+    def __enter__(self) -> "Image":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def __getitem__(self, item):
         return self.__getattr__(item)
 
@@ -132,6 +316,47 @@ class Image:
     def __delitem__(self, key):
         self.__delattr__(key)
 
+    def _has_tag(self, tag: str) -> bool:
+        # Determine if the image contains a tag (disregarding staged edits).
+        if not self._has_exif:
+            return False
+
+        app1_segment = self._segments["APP1"]
+        assert isinstance(app1_segment, App1MetaData)
+        return ATTRIBUTE_ID_MAP[tag] in app1_segment.ifd_tags
+
+    def _check_exportable(self) -> None:
+        if self._memory_map is not None and self._memory_map.mapping.closed:
+            raise ValueError("cannot get file contents of a closed image")
+
+        if self._header_only:
+            raise RuntimeError(
+                "cannot get file contents of an image opened with header_only=True"
+            )
+
+    def _check_writable(self) -> None:
+        if self._header_only:
+            raise RuntimeError("cannot modify an image opened with header_only=True")
+
+        # Parse the tags excluded by a tag projection so that modifications see (and preserve) every tag.
+        if self._has_exif:
+            assert isinstance(self._segments["APP1"], App1MetaData)
+            self._segments["APP1"].load_all_tags()
+
+    def close(self) -> None:
+        """Release the memory map of an image opened with ``memory_map=True``.
+
+        Afterwards, the image data is no longer accessible (i.e., ``get_file()`` raises a ``ValueError``).
+
+        """
+        if self._memory_map is not None and not self._memory_map.mapping.closed:
+            for segment in self._segments.values():
+                if isinstance(segment, memoryview):
+                    segment.release()
+
+            self._memory_map.mapping.close()
+            self._memory_map.file.close()
+
     def delete(self, attribute: str) -> None:
         """Remove the specified attribute from the image.
 
@@ -142,18 +367,69 @@ class Image:
 
     def delete_all(self) -> None:
         """Remove all EXIF tags from the image."""
+        self._check_writable()
+
         for _ in range(
             2
         ):  # iterate twice to delete thumbnail tags the second time around
             assert isinstance(self._segments["APP1"], App1MetaData)
-            for tag in self._segments["APP1"].get_tag_list():
-                if not tag in ["_exif_ifd_pointer", "_gps_ifd_pointer", "exif_version"]:
-                    try:
-                        delattr(self, tag)
-                    except AttributeError:
-                        warnings.warn("could not delete tag " + tag, RuntimeWarning)
+            with self.edit():
+                for tag in self._segments["APP1"].get_tag_list():
+                    if not tag in [
+                        "_exif_ifd_pointer",
+                        "_gps_ifd_pointer",
+                        "exif_version",
+                    ]:
+                        try:
+                            delattr(self, tag)
+                        except AttributeError:
+                            warnings.warn("could not delete tag " + tag, RuntimeWarning)
+
+    @contextlib.contextmanager
+    def edit(self) -> Iterator["Image"]:
+        """Batch tag modifications, additions, and deletions.
+
+        Within the ``with`` block, setting and deleting tags (using any syntax) is deferred. When the block exits, the
+        changes are applied together so that the EXIF metadata's layout is rebuilt at most once instead of once per
+        added or deleted tag. Reading tags within the block returns their values from before the edit. The deferred
+        changes are discarded if the block raises an exception.
+
+        :returns: this image
+        :raises RuntimeError: image was opened with ``header_only=True`` or is already being edited
+
+        """
+        self._check_writable()
+
+        if self._staged_edits is not None:
+            raise RuntimeError("image is already being edited")
+
+        self._staged_edits = {}
+        try:
+            yield self
+            staged_edits = self._staged_edits
+        finally:
+            self._staged_edits = None
 
-            self._parse_segments(self.get_file())
+        values = {
+            tag: value for tag, value in staged_edits.items() if value is not _DELETED
+        }
+        deletions = [tag for tag, value in staged_edits.items() if value is _DELETED]
+
+        if not self._has_exif:
+            if deletions:
+                raise AttributeError(ERROR_IMG_NO_ATTR.format(deletions[0]))
+
+            if not values:
+                return
+
+            app1_segment = App1MetaData(generate_empty_app1_bytes())
+            app1_segment.edit_tags(values, deletions)
+            self._segments["APP1"] = app1_segment
+            self._has_exif = True
+            return
+
+        assert isinstance(self._segments["APP1"], App1MetaData)
+        self._segments["APP1"].edit_tags(values, deletions)
 
     def get(self, attribute: str, default: Any = None) -> Any:
         """Return the value of the specified tag.
@@ -188,32 +464,40 @@ class Image:
 
         return all_tags
 
+    @timed(GET_FILE)
     def get_file(self) -> bytes:
         """Generate equivalent binary file contents.
 
         :returns: image binary with EXIF metadata
+        :raises RuntimeError: image was opened with ``header_only=True``
+        :raises ValueError: memory-mapped image was closed
 
         """
-        assert isinstance(self._segments["preceding"], bytes)
-        img_bytes = self._segments["preceding"]
-
-        if self._has_exif:
-            assert isinstance(self._segments["APP1"], App1MetaData)
-            img_bytes += self._segments["APP1"].get_segment_bytes()
-
-        assert isinstance(self._segments["succeeding"], bytes)
-        img_bytes += self._segments["succeeding"]
-
-        return img_bytes
+        return b"".join(self.iter_chunks())
 
     def get_thumbnail(self) -> bytes:
         """Extract thumbnail binary contained in EXIF metadata.
 
+        The thumbnail is located using the offset and length tags in IFD 1.
+
         :returns: thumbnail binary
         :raises RuntimeError: image does not contain thumbnail
 
         """
-        thumbnail_bytes = None
+        return bytes(self.get_thumbnail_view())
+
+    def get_thumbnail_view(self) -> memoryview:
+        """Extract thumbnail binary contained in EXIF metadata without copying it.
+
+        Like ``get_thumbnail()`` except the thumbnail is returned as a view of the EXIF metadata bytes. The view
+        reflects subsequent modifications to the EXIF metadata (and is invalid once they're rebuilt or the image is
+        closed), so copy it with ``bytes()`` if it must outlive them.
+
+        :returns: view of thumbnail binary
+        :raises RuntimeError: image does not contain thumbnail
+
+        """
+        thumbnail_view = None
 
         try:
             app1_segment = self._segments["APP1"]
@@ -221,18 +505,61 @@ class Image:
             pass
         else:
             assert isinstance(app1_segment, App1MetaData)
-            thumbnail_bytes = app1_segment.thumbnail_bytes
+            thumbnail_view = app1_segment.thumbnail_bytes
 
-        if not thumbnail_bytes:
+        if not thumbnail_view:
             raise RuntimeError("image does not contain thumbnail")
 
-        return thumbnail_bytes
+        return thumbnail_view
 
     @property
     def has_exif(self) -> bool:
         """Report whether or not the image currently has EXIF metadata."""
         return self._has_exif
 
+    def iter_chunks(self) -> Iterator[Union[bytes, memoryview]]:
+        """Generate equivalent binary file contents as a sequence of chunks.
+
+        Unlike ``get_file()``, the chunks are not concatenated, so the image data is never copied (e.g., the chunks of
+        a memory-mapped image are views of the mapped file).
+
+        :returns: image binary chunks (i.e., the segments preceding, comprising, and succeeding the EXIF metadata)
+        :raises RuntimeError: image was opened with ``header_only=True``
+
+        """
+        for chunk, _ in self._iter_chunks_with_source_offsets():
+            yield chunk
+
+    def _iter_chunks_with_source_offsets(
+        self,
+    ) -> Iterator[Tuple[Union[bytes, memoryview], Optional[int]]]:
+        # Pair each chunk with its offset in the memory-mapped source file (if it is an unmodified view of the file).
+        self._check_exportable()
+
+        preceding = self._segments["preceding"]
+        assert isinstance(preceding, (bytes, memoryview))
+        yield preceding, 0 if self._is_memory_mapped(preceding) else None
+
+        if self._has_exif:
+            assert isinstance(self._segments["APP1"], App1MetaData)
+            yield self._segments["APP1"].get_segment_bytes(), None
+
+        succeeding = self._segments["succeeding"]
+        assert isinstance(succeeding, (bytes, memoryview))
+        if self._is_memory_mapped(succeeding):
+            assert self._memory_map is not None
+            # Runs to the end of the file.
+            yield succeeding, len(self._memory_map.mapping) - len(succeeding)
+        else:
+            yield succeeding, None
+
+    def _is_memory_mapped(self, chunk: Union[bytes, memoryview]) -> bool:
+        return (
+            self._memory_map is not None
+            and isinstance(chunk, memoryview)
+            and chunk.obj is self._memory_map.mapping
+        )
+
     def list_all(self) -> List[str]:
         """List all EXIF tags contained in the image."""
         tags_list = []
@@ -243,6 +570,109 @@ class Image:
 
         return tags_list
 
+    def save(self, path: Optional[str] = None) -> None:
+        """Write the image to a file.
+
+        When saving an image back to the file it was opened from, only the modified byte ranges of the EXIF metadata
+        are written in place if its layout did not change (e.g., after modifying existing tags with values of the same
+        size). Otherwise, the entire file is rewritten.
+
+        :param path: file path to write to (defaults to the file path the image was opened from)
+        :raises RuntimeError: image was opened with ``header_only=True``
+        :raises ValueError: no path specified for an image that was not opened from a file path
+
+        """
+        self._check_writable()
+
+        if path is None:
+            if self._source is None:
+                raise ValueError(
+                    "must specify a path to save an image not opened from a file path"
+                )
+            path = self._source.path
+
+        if (
+            self._source is not None
+            and os.path.isfile(path)
+            and os.path.samefile(path, self._source.path)
+        ):
+            if not self._patch_source_file():
+                self._rewrite_source_file()
+        else:
+            with open(path, "wb") as image_file:
+                self.write_to(image_file)
+
+    def _patch_source_file(self) -> bool:
+        # Write only the modified APP1 byte ranges if the segment's size and location in the source file are unchanged.
+        app1_segment = self._segments.get("APP1")
+
+        if not self._has_exif or self._source is None:
+            return False
+
+        source_app1_segment = self._source.app1_segment
+        if source_app1_segment is None:
+            return False
+
+        assert isinstance(app1_segment, App1MetaData)
+        segment_len = len(app1_segment.header_bytes) + len(app1_segment.body_bytes)
+        if segment_len != source_app1_segment.end - source_app1_segment.offset:
+            return False
+
+        body_offset = source_app1_segment.offset + len(app1_segment.header_bytes)
+
+        with open(self._source.path, "r+b") as image_file:
+            for start, stop in app1_segment.body_bytes.get_dirty_ranges():
+                _write_at(
+                    image_file, app1_segment.body_bytes[start:stop], body_offset + start
+                )
+
+        app1_segment.body_bytes.clear_dirty_ranges()
+        return True
+
+    def _rewrite_source_file(self) -> None:
+        # Write a new file and then replace the source file since memory-mapped segments may still be read from it.
+        assert self._source is not None
+        file_descriptor, temp_path = tempfile.mkstemp(
+            dir=os.path.dirname(self._source.path)
+        )
+
+        try:
+            with os.fdopen(file_descriptor, "wb") as temp_file:
+                self.write_to(temp_file)
+
+            shutil.copymode(self._source.path, temp_path)
+            os.replace(temp_path, self._source.path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+        # Subsequent changes are relative to the newly-written file.
+        if self._has_exif:
+            app1_segment = self._segments["APP1"]
+            assert isinstance(app1_segment, App1MetaData)
+            app1_segment.body_bytes.clear_dirty_ranges()
+
+        self._set_source_path(self._source.path)
+
+    def _set_source_path(self, path: str) -> None:
+        # Remember where the EXIF metadata resides in the source file so that it can be patched in place.
+        source_app1_segment = None
+
+        if self._has_exif:
+            app1_segment = self._segments["APP1"]
+            assert isinstance(app1_segment, App1MetaData)
+            preceding = self._segments["preceding"]
+            assert isinstance(preceding, (bytes, memoryview))
+            source_app1_segment = JpegSegment(
+                ExifMarkers.APP1,
+                len(preceding),
+                len(app1_segment.header_bytes)
+                + len(app1_segment.body_bytes)
+                - len(ExifMarkers.APP1),
+            )
+
+        self._source = _SourceFile(os.path.abspath(path), source_app1_segment)
+
     def set(self, attribute: str, value) -> None:
         """Set the value of the specified attribute.
 
@@ -252,3 +682,59 @@ class Image:
 
         """
         setattr(self, attribute, value)
+
+    def set_many(self, values: Dict[str, Any]) -> None:
+        """Set the values of multiple attributes at once.
+
+        Equivalent to setting each attribute within an ``edit()`` block (i.e., the EXIF metadata's layout is rebuilt
+        at most once even if several tags are added).
+
+        :param values: tag values keyed by image EXIF attribute name
+
+        """
+        with self.edit():
+            for attribute, value in values.items():
+                self.set(attribute, value)
+
+    def write_to(self, file_obj: Union[BinaryIO, socket.socket]) -> int:
+        """Write equivalent binary file contents to a file object or socket.
+
+        Chunks are written one after another instead of first concatenating them like ``get_file()``. When writing a
+        memory-mapped image to a socket, regions unchanged from the source file are sent using ``os.sendfile()`` where
+        the platform supports it.
+
+        :param file_obj: file object opened in binary write mode or connected socket
+        :returns: number of bytes written
+        :raises RuntimeError: image was opened with ``header_only=True``
+
+        """
+        bytes_written = 0
+
+        for chunk, source_offset in self._iter_chunks_with_source_offsets():
+            if isinstance(file_obj, socket.socket):
+                if source_offset is None:
+                    file_obj.sendall(chunk)
+                else:
+                    assert self._memory_map is not None
+                    file_obj.sendfile(self._memory_map.file, source_offset, len(chunk))
+            else:
+                file_obj.write(chunk)
+
+            bytes_written += len(chunk)
+
+        return bytes_written
+
+
+def get_app1_metadata(image: Image) -> Optional[App1MetaData]:
+    """Get the parsed EXIF metadata of an image (e.g., to decode tag values without constructing tag parsers).
+
+    :param image: image
+    :returns: APP1 metadata (or ``None`` if the image does not contain EXIF metadata)
+
+    """
+    if not image.has_exif:
+        return None
+
+    app1_segment = image._segments["APP1"]  # pylint: disable=protected-access
+    assert isinstance(app1_segment, App1MetaData)
+    return app1_segment
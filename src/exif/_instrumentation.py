@@ -0,0 +1,174 @@
+"""Opt-in performance instrumentation module."""
+
+import functools
+import time
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, TypeVar
+
+_T = TypeVar("_T")
+
+PARSE_SEGMENTS = "parse_segments"
+"""Phase traversing the JPEG segments of an image (including parsing its IFDs)."""
+
+PARSE_IFDS = "parse_ifds"
+"""Phase recording the location of each tag in the IFDs of the APP1 body."""
+
+READ_TAG = "read_tag"
+"""Phase reading a tag's value."""
+
+SERIALIZE_IFDS = "serialize_ifds"
+"""Phase rebuilding the APP1 body after adding or deleting tags."""
+
+GET_FILE = "get_file"
+"""Phase concatenating the image's segments into the file contents."""
+
+BYTES_SCANNED = "bytes_scanned"
+"""Counter of image bytes traversed while locating the EXIF APP1 segment."""
+
+IFDS_VISITED = "ifds_visited"
+"""Counter of IFDs decoded."""
+
+TAGS_BUILT = "tags_built"
+"""Counter of tag parsers constructed (i.e., the first time each tag is accessed)."""
+
+VALUES_RELOCATED = "values_relocated"
+"""Counter of tag values (stored after their IFD) written to a new location when rebuilding the APP1 body."""
+
+INSTRUMENTATION: ContextVar[Optional["Instrumentation"]] = ContextVar(
+    "exif_instrumentation", default=None
+)
+"""Instrumentation collecting measurements in the current context (or ``None`` if disabled)."""
+
+
+class PhaseStats(NamedTuple):
+
+    """Wall time and call count of a phase."""
+
+    call_count: int = 0
+    """Number of times the phase ran"""
+
+    seconds: float = 0.0
+    """Total wall time of the phase in seconds"""
+
+
+class Instrumentation:
+
+    """Collector of per-phase wall times and call counts along with work counters.
+
+    Within a ``with`` block, this package records measurements in the collector for the current thread or
+    ``asyncio`` task (i.e., using a context variable). Phase times are inclusive of nested phases (e.g., parsing
+    segments includes parsing IFDs). When no collector is active, the instrumented code paths only check the context
+    variable.
+
+    Phases are ``"parse_segments"``, ``"parse_ifds"``, ``"read_tag"``, ``"serialize_ifds"``, and ``"get_file"``.
+    Counters are ``"bytes_scanned"``, ``"ifds_visited"``, ``"tags_built"``, and ``"values_relocated"``.
+
+    :param on_phase: callable accepting a phase name and wall time in seconds that is called each time a phase ends
+        (e.g., to forward measurements to a metrics system)
+
+    """
+
+    def __init__(self, on_phase: Optional[Callable[[str, float], None]] = None) -> None:
+        self.phases: Dict[str, PhaseStats] = {}
+        """Wall time and call count keyed by phase name"""
+
+        self.counters: Dict[str, int] = {}
+        """Count keyed by counter name"""
+
+        self._on_phase = on_phase
+        self._tokens: List[Token] = []
+
+    def __enter__(self) -> "Instrumentation":
+        self._tokens.append(INSTRUMENTATION.set(self))
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        INSTRUMENTATION.reset(self._tokens.pop())
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Get the measurements as a dictionary (e.g., to serialize as JSON).
+
+        :returns: call count and wall time of each phase (under ``"phases"``) and each counter (under ``"counters"``)
+
+        """
+        return {
+            "phases": {
+                phase: {"call_count": stats.call_count, "seconds": stats.seconds}
+                for phase, stats in self.phases.items()
+            },
+            "counters": dict(self.counters),
+        }
+
+    def increment(self, counter: str, amount: int = 1) -> None:
+        """Increment a counter.
+
+        :param counter: counter name
+        :param amount: amount to add
+
+        """
+        self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    def record(self, phase: str, seconds: float) -> None:
+        """Record that a phase ran.
+
+        :param phase: phase name
+        :param seconds: wall time of the phase in seconds
+
+        """
+        stats = self.phases.get(phase, PhaseStats())
+        self.phases[phase] = PhaseStats(stats.call_count + 1, stats.seconds + seconds)
+
+        if self._on_phase is not None:
+            self._on_phase(phase, seconds)
+
+    def time(self, phase: str, func: Callable[..., _T], *args: Any) -> _T:
+        """Call a function and record its wall time as a phase.
+
+        :param phase: phase name
+        :param func: function to call
+        :param args: positional arguments to call the function with
+        :returns: function return value
+
+        """
+        start = time.perf_counter()
+
+        try:
+            return func(*args)
+        finally:
+            self.record(phase, time.perf_counter() - start)
+
+
+def increment(counter: str, amount: int = 1) -> None:
+    """Increment a counter of the active instrumentation (if any).
+
+    :param counter: counter name
+    :param amount: amount to add
+
+    """
+    instrumentation = INSTRUMENTATION.get()
+    if instrumentation is not None:
+        instrumentation.increment(counter, amount)
+
+
+def timed(
+    phase: str,
+) -> Callable[[Callable[..., _T]], Callable[..., _T]]:
+    """Decorate a function to record its wall time as a phase of the active instrumentation (if any).
+
+    :param phase: phase name
+    :returns: decorator
+
+    """
+
+    def decorator(func: Callable[..., _T]) -> Callable[..., _T]:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            instrumentation = INSTRUMENTATION.get()
+            if instrumentation is None:
+                return func(*args, **kwargs)
+
+            return instrumentation.time(phase, functools.partial(func, *args, **kwargs))
+
+        return wrapper
+
+    return decorator
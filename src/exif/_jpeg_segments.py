@@ -0,0 +1,150 @@
+"""JPEG marker segment traversal module."""
+
+import mmap
+import struct
+from typing import List, NamedTuple, Optional, Tuple, Union
+
+from exif._constants import ExifMarkers
+
+EXIF_IDENTIFIER = b"Exif\x00\x00"
+"""Identifier code that begins the payload of APP1 segments containing EXIF metadata."""
+
+STANDALONE_MARKERS = frozenset(
+    [ExifMarkers.SOI, ExifMarkers.EOI, ExifMarkers.SEG_PREFIX + b"\x01"]
+    + [ExifMarkers.SEG_PREFIX + bytes([0xD0 + index]) for index in range(8)]
+)
+"""Markers without a subsequent length field (i.e., SOI, EOI, TEM, and RST0 through RST7)."""
+
+_SEGMENT_LENGTH = struct.Struct(">H")
+
+ImageBytes = Union[bytes, bytearray, mmap.mmap]
+"""Image bytes (or the portion read so far) as read, accumulated while reading, or memory mapped."""
+
+
+class JpegSegment(NamedTuple):
+
+    """JPEG marker segment location within the image bytes."""
+
+    marker: bytes
+    """Two-byte segment marker (e.g., ``ExifMarkers.APP1``)"""
+
+    offset: int
+    """Offset of the segment marker"""
+
+    length: int
+    """Number of bytes following the marker (i.e., the value of the segment's length field)"""
+
+    @property
+    def end(self) -> int:
+        """Offset immediately after the segment."""
+        return self.offset + len(self.marker) + self.length
+
+
+def read_segment(
+    img_bytes: Union[ImageBytes, memoryview], offset: int
+) -> Optional[JpegSegment]:
+    """Read the location of the marker segment at the specified offset.
+
+    Fill bytes (i.e., repeated segment prefixes) preceding the marker are skipped.
+
+    :param img_bytes: image bytes (or the portion read so far)
+    :param offset: offset of the segment marker
+    :returns: segment location, or ``None`` if more bytes are needed to read the marker and length
+    :raises ValueError: no segment marker at the specified offset
+
+    """
+    while img_bytes[offset : offset + 2] == ExifMarkers.SEG_PREFIX * 2:
+        offset += 1  # skip fill byte
+
+    if len(img_bytes) < offset + 2:
+        if img_bytes[offset : offset + 1] not in (ExifMarkers.SEG_PREFIX, b""):
+            raise ValueError(f"no segment marker at offset {offset}")
+        return None
+
+    marker = bytes(img_bytes[offset : offset + 2])
+    if marker[:1] != ExifMarkers.SEG_PREFIX:
+        raise ValueError(f"no segment marker at offset {offset}")
+
+    if marker in STANDALONE_MARKERS:
+        return JpegSegment(marker, offset, 0)
+
+    if len(img_bytes) < offset + 4:
+        return None
+
+    return JpegSegment(
+        marker, offset, _SEGMENT_LENGTH.unpack_from(img_bytes, offset + 2)[0]
+    )
+
+
+def is_exif_app1(
+    img_bytes: Union[ImageBytes, memoryview], segment: JpegSegment
+) -> bool:
+    """Determine if a segment is an APP1 segment containing EXIF metadata.
+
+    :param img_bytes: image bytes containing the segment
+    :param segment: segment location
+    :returns: segment is an EXIF APP1 segment
+
+    """
+    payload_offset = segment.offset + 4  # skip marker and length
+    return (
+        segment.marker == ExifMarkers.APP1
+        and img_bytes[payload_offset : payload_offset + len(EXIF_IDENTIFIER)]
+        == EXIF_IDENTIFIER
+    )
+
+
+def walk_segments(img_bytes: ImageBytes) -> Tuple[List[JpegSegment], bool]:
+    """Traverse marker segments from the start of the image up to and including the start of scan.
+
+    Segments are traversed by their length fields, so the entropy-coded image data is never scanned. If an EXIF APP1
+    segment's length stops early, the segment is extended to the next segment prefix.
+
+    :param img_bytes: image bytes (or the portion read so far)
+    :returns: segment table and whether or not more bytes are needed to continue the traversal
+
+    """
+    segments: List[JpegSegment] = []
+    offset = 0
+
+    while True:
+        try:
+            segment = read_segment(img_bytes, offset)
+        except ValueError:
+            return segments, False  # not a JPEG or no subsequent segment
+
+        if segment is None:
+            return segments, True
+
+        if segment.marker == ExifMarkers.APP1:
+            if len(img_bytes) < segment.offset + 4 + len(EXIF_IDENTIFIER):
+                return segments, True
+
+            if is_exif_app1(img_bytes, segment):
+                next_prefix_offset = img_bytes.find(ExifMarkers.SEG_PREFIX, segment.end)
+                if next_prefix_offset == -1:
+                    return segments, True
+
+                segment = segment._replace(
+                    length=next_prefix_offset - segment.offset - len(segment.marker)
+                )
+
+        segments.append(segment)
+
+        if segment.marker in (ExifMarkers.SOS, ExifMarkers.EOI):
+            return segments, False
+
+        offset = segment.end
+
+
+def is_header_complete(img_bytes: ImageBytes) -> bool:
+    """Determine whether enough of an image has been read to parse its EXIF metadata.
+
+    :param img_bytes: image bytes read so far
+    :returns: whether the EXIF APP1 segment (or the start of scan if there is none) has been fully read
+
+    """
+    segments, needs_more_bytes = walk_segments(img_bytes)
+    return not needs_more_bytes or any(
+        is_exif_app1(img_bytes, segment) for segment in segments
+    )
@@ -0,0 +1,138 @@
+"""Positioned EXIF metadata read module."""
+
+import struct
+from typing import BinaryIO, Callable, List, Optional, Tuple, Union
+
+from exif._constants import ExifMarkers
+from exif._datatypes import TiffByteOrder
+from exif._ifd_decoder import IfdDecoder, IfdTagEntry, get_decoder
+from exif._jpeg_segments import EXIF_IDENTIFIER, is_exif_app1, read_segment
+
+_TIFF_BYTE_ORDER = struct.Struct(">H")  # byte order indicator reads the same either way
+_TIFF_HEADER_NBYTES = 8
+
+ReadAt = Callable[[int, int], Union[bytes, memoryview]]
+"""Callable accepting an offset and number of bytes and returning the bytes read at that offset of the image (or a
+view of them)."""
+
+
+def get_bytes_reader(img_bytes: bytes) -> ReadAt:
+    """Get a positioned reader of already-read image bytes (which returns views instead of copies).
+
+    :param img_bytes: image bytes
+    :returns: positioned reader
+
+    """
+    img_view = memoryview(img_bytes)
+    return lambda offset, nbytes: img_view[offset : offset + nbytes]
+
+
+def get_file_reader(img_file: BinaryIO) -> ReadAt:
+    """Get a positioned reader of an image file (with offsets relative to the file's current position).
+
+    :param img_file: seekable image file opened in binary mode
+    :returns: positioned reader
+
+    """
+    start = img_file.tell()
+
+    def read_at(offset: int, nbytes: int) -> bytes:
+        img_file.seek(start + offset)
+        return img_file.read(nbytes)
+
+    return read_at
+
+
+def find_app1_body_range(read_at: ReadAt) -> Optional[Tuple[int, int]]:
+    """Locate the body of the EXIF APP1 segment (i.e., from the TIFF header to the end of the segment).
+
+    Segments are traversed by their length fields, reading only each segment's marker, length, and identifier code.
+
+    :param read_at: positioned reader of the image
+    :returns: offsets of the start and end of the APP1 body within the image (or ``None`` if there isn't an EXIF APP1
+        segment)
+
+    """
+    offset = 0
+
+    while True:
+        segment_bytes = read_at(offset, 4 + len(EXIF_IDENTIFIER))
+
+        try:
+            segment = read_segment(segment_bytes, 0)
+        except ValueError:
+            return None  # not a JPEG or no subsequent segment
+
+        if segment is None or segment.marker in (ExifMarkers.SOS, ExifMarkers.EOI):
+            return None  # no EXIF APP1 segment precedes the image data
+
+        if is_exif_app1(segment_bytes, segment):
+            return (
+                offset + segment.offset + 4 + len(EXIF_IDENTIFIER),
+                offset + segment.end,
+            )
+
+        offset += segment.end
+
+
+def find_app1_body(read_at: ReadAt) -> Optional[int]:
+    """Locate the body of the EXIF APP1 segment (i.e., the TIFF header).
+
+    :param read_at: positioned reader of the image
+    :returns: offset of the APP1 body within the image (or ``None`` if there isn't an EXIF APP1 segment)
+
+    """
+    body_range = find_app1_body_range(read_at)
+    return None if body_range is None else body_range[0]
+
+
+def read_ifd_tag_count(read_at: ReadAt, decoder: IfdDecoder, offset: int) -> int:
+    """Read the number of tags in an IFD.
+
+    :param read_at: positioned reader of the image
+    :param decoder: decoder for the TIFF byte order
+    :param offset: offset of the IFD within the image
+    :returns: number of tags
+    :raises struct.error: IFD extends beyond the end of the image
+
+    """
+    return decoder.ifd_count.unpack_from(read_at(offset, decoder.ifd_count.size))[0]
+
+
+def read_ifd(
+    read_at: ReadAt, decoder: IfdDecoder, offset: int
+) -> Tuple[List[IfdTagEntry], int]:
+    """Read an IFD's tags and next IFD offset (reading only the IFD's bytes).
+
+    :param read_at: positioned reader of the image
+    :param decoder: decoder for the TIFF byte order
+    :param offset: offset of the IFD within the image
+    :returns: IFD tags and offset of the next IFD within the APP1 body (or 0 if there isn't one)
+    :raises struct.error: IFD extends beyond the end of the image
+
+    """
+    tag_count = read_ifd_tag_count(read_at, decoder, offset)
+    ifd_bytes = read_at(
+        offset,
+        decoder.ifd_count.size
+        + tag_count * decoder.ifd_tag.size
+        + decoder.uint32.size,  # include the next IFD offset
+    )
+    return decoder.read_ifd(ifd_bytes, 0)
+
+
+def read_tiff_header(read_at: ReadAt, body_offset: int) -> Tuple[IfdDecoder, int]:
+    """Read the TIFF header at the start of the APP1 body.
+
+    :param read_at: positioned reader of the image
+    :param body_offset: offset of the APP1 body within the image
+    :returns: decoder for the TIFF byte order and offset of IFD 0 within the APP1 body
+    :raises struct.error: TIFF header extends beyond the end of the image
+    :raises ValueError: invalid byte order indicator
+
+    """
+    tiff_header_bytes = read_at(body_offset, _TIFF_HEADER_NBYTES)
+    (byte_order,) = _TIFF_BYTE_ORDER.unpack_from(tiff_header_bytes)
+    decoder = get_decoder(TiffByteOrder(byte_order))
+    (ifd0_offset,) = decoder.uint32.unpack_from(tiff_header_bytes, 4)
+    return decoder, ifd0_offset
@@ -0,0 +1,118 @@
+"""Incremental (push-style) EXIF metadata parser module."""
+
+from typing import Iterable, Optional
+
+from exif._app1_metadata import MAX_APP1_SEGMENT_LENGTH
+from exif._constants import ExifMarkers
+from exif._image import Image, get_tag_ids
+from exif._jpeg_segments import EXIF_IDENTIFIER, is_exif_app1, read_segment
+
+
+class ExifStreamParser:
+
+    """Parser that extracts EXIF metadata from image bytes as they arrive (e.g., from a network stream).
+
+    Feed the image to the parser chunk by chunk. Segments preceding the EXIF APP1 segment are skipped without being
+    buffered, so the parser holds at most the APP1 segment (plus the unprocessed remainder of the latest chunk) in
+    memory and never accumulates the full image. The metadata is returned as soon as the APP1 segment is complete.
+
+    :param tags: names of the only tags to parse (defaults to all tags)
+    :type tags: iterable of str
+    :raises ValueError: unknown tag name
+
+    """
+
+    def __init__(self, tags: Optional[Iterable[str]] = None) -> None:
+        self._tags = None if tags is None else frozenset(tags)
+        self._buffer = bytearray()
+        self._skip_nbytes = 0
+        self._done = False
+        self._metadata: Optional[Image] = None
+
+        if self._tags is not None:
+            get_tag_ids(
+                self._tags
+            )  # validate the tag names before receiving the APP1 segment
+
+    @property
+    def done(self) -> bool:
+        """Report whether the EXIF metadata was found or determined to be absent (i.e., more bytes are unneeded)."""
+        return self._done
+
+    @property
+    def metadata(self) -> Optional[Image]:
+        """EXIF metadata (or ``None`` if it has not been received yet or the image does not contain any)."""
+        return self._metadata
+
+    def feed(self, chunk: bytes) -> Optional[Image]:
+        """Process the next chunk of image bytes.
+
+        :param chunk: image bytes following the previously-fed chunks
+        :returns: read-only image containing the EXIF metadata if its APP1 segment was completed by this chunk
+            (``None`` otherwise)
+
+        """
+        if self._done:
+            return None
+
+        view = memoryview(chunk)
+
+        # Discard the remainder of a skipped segment without buffering it.
+        skipped_nbytes = min(self._skip_nbytes, len(view))
+        self._skip_nbytes -= skipped_nbytes
+        self._buffer += view[skipped_nbytes:]
+
+        while self._buffer and not self._skip_nbytes:
+            try:
+                segment = read_segment(self._buffer, 0)
+            except ValueError:
+                self._finish()  # not a JPEG or no subsequent segment
+                break
+
+            if segment is None:
+                break  # wait for the rest of the marker and length
+
+            if segment.marker in (ExifMarkers.SOS, ExifMarkers.EOI):
+                self._finish()  # no EXIF APP1 segment precedes the image data
+                break
+
+            if segment.marker == ExifMarkers.APP1:
+                if len(self._buffer) < segment.offset + 4 + len(EXIF_IDENTIFIER):
+                    break  # wait for the identifier code
+
+                if is_exif_app1(self._buffer, segment):
+                    # Like when parsing a whole image, extend the segment to the next segment prefix in case its
+                    # length field stops early (but give up on finding one after the maximum segment length).
+                    max_end = (
+                        segment.offset + len(segment.marker) + MAX_APP1_SEGMENT_LENGTH
+                    )
+                    end = self._buffer.find(ExifMarkers.SEG_PREFIX, segment.end)
+
+                    if end == -1:
+                        if len(self._buffer) < max_end:
+                            break  # wait for the rest of the segment
+
+                        end = max_end
+
+                    # Wrap the segment in a minimal JPEG so that it's parsed the same as a whole image.
+                    img_bytes = (
+                        ExifMarkers.SOI
+                        + bytes(self._buffer[segment.offset : end])
+                        + ExifMarkers.EOI
+                    )
+                    self._finish()
+                    self._metadata = Image(img_bytes, header_only=True, tags=self._tags)
+                    return self._metadata
+
+            if segment.end > len(self._buffer):
+                self._skip_nbytes = segment.end - len(self._buffer)
+                self._buffer.clear()
+            else:
+                del self._buffer[: segment.end]
+
+        return None
+
+    def _finish(self) -> None:
+        self._done = True
+        self._buffer = bytearray()
+        self._skip_nbytes = 0
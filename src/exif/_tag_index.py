@@ -0,0 +1,140 @@
+"""Lazily-constructed IFD tag index module."""
+
+from array import array
+from collections.abc import Mapping
+from typing import NamedTuple
+
+
+class _TagColumns(NamedTuple):
+
+    """Parallel arrays with one row per tag."""
+
+    tag_ids: array
+    """Tag ID of each tag"""
+
+    tag_types: array
+    """EXIF type of each tag"""
+
+    tag_offsets: array
+    """Offset of each IFD tag within the APP1 body"""
+
+    parent_ifd_indices: array
+    """Index of the IFD key of each tag's parent IFD"""
+
+
+class IfdTagIndex(Mapping):
+
+    """IFD tag parsers keyed by tag ID that are only constructed when first accessed.
+
+    Parsing an IFD only records the ID, type, location, and parent IFD of each tag in parallel arrays (instead of
+    dictionaries of Python objects) to keep the memory footprint of parsed images small, along with each tag's position
+    in the arrays keyed by tag ID for constant-time lookups. The corresponding parser instance (e.g., ``Ascii``) is
+    constructed by the factory the first time the tag is looked up and then reused.
+
+    :param factory: callable accepting a tag ID, EXIF type, and tag offset and returning an IFD tag parser instance
+
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        # Parent IFD indices are 32-bit since IFD chains (and so the number of IFD keys) are only bounded by the APP1
+        # body size.
+        self._columns = _TagColumns(array("H"), array("H"), array("I"), array("I"))
+        self._parent_ifd_keys = []
+        self._parent_ifd_key_indices = {}
+        self._positions = {}
+        self._tags = {}
+
+    def __contains__(self, tag_id):
+        return tag_id in self._positions
+
+    def __delitem__(self, tag_id):
+        position = self._get_position(tag_id)
+
+        for column in self._columns:
+            del column[position]
+
+        del self._positions[tag_id]
+        for subsequent_tag_id in self._columns.tag_ids[position:]:
+            self._positions[subsequent_tag_id] -= 1
+
+        self._tags.pop(tag_id, None)
+
+    def __getitem__(self, tag_id):
+        try:
+            return self._tags[tag_id]
+        except KeyError:
+            position = self._get_position(tag_id)
+
+        tag = self._factory(
+            tag_id,
+            self._columns.tag_types[position],
+            self._columns.tag_offsets[position],
+        )
+        self._tags[tag_id] = tag
+        return tag
+
+    def __iter__(self):
+        return iter(self._columns.tag_ids)
+
+    def __len__(self):
+        return len(self._columns.tag_ids)
+
+    def _get_position(self, tag_id):
+        return self._positions[tag_id]
+
+    def add(self, tag_id, tag_type, tag_offset, ifd_key):
+        """Record the location of a tag (replacing any previously-recorded tag with the same ID).
+
+        :param int tag_id: tag ID
+        :param int tag_type: EXIF type
+        :param int tag_offset: offset of the IFD tag within the APP1 body
+        :param ifd_key: number or name of the IFD containing the tag
+        :type ifd_key: int or str
+
+        """
+        try:
+            parent_ifd_index = self._parent_ifd_key_indices[ifd_key]
+        except KeyError:
+            parent_ifd_index = self._parent_ifd_key_indices[ifd_key] = len(
+                self._parent_ifd_keys
+            )
+            self._parent_ifd_keys.append(ifd_key)
+
+        row = (tag_id, tag_type, tag_offset, parent_ifd_index)
+        position = self._positions.get(tag_id)
+
+        if position is None:
+            self._positions[tag_id] = len(self._columns.tag_ids)
+            for column, value in zip(self._columns, row):
+                column.append(value)
+        else:
+            for column, value in zip(self._columns, row):
+                column[position] = value
+
+            self._tags.pop(tag_id, None)
+
+    def get_parent_ifd(self, tag_id):
+        """Get the IFD containing a tag.
+
+        :param int tag_id: tag ID
+        :returns: IFD number or name
+        :rtype: int or str
+        :raises KeyError: tag is not present
+
+        """
+        return self._parent_ifd_keys[
+            self._columns.parent_ifd_indices[self._get_position(tag_id)]
+        ]
+
+    def get_tag_location(self, tag_id):
+        """Get the EXIF type and location of a tag without constructing its parser.
+
+        :param int tag_id: tag ID
+        :returns: EXIF type and offset of the IFD tag within the APP1 body
+        :rtype: tuple of int
+        :raises KeyError: tag is not present
+
+        """
+        position = self._get_position(tag_id)
+        return self._columns.tag_types[position], self._columns.tag_offsets[position]
@@ -0,0 +1,128 @@
+"""Thumbnail-only extraction module."""
+
+import os
+import struct
+from typing import BinaryIO, List, Optional, Tuple, Union
+
+from exif._constants import (
+    THUMBNAIL_LENGTH_TAG_ID,
+    THUMBNAIL_OFFSET_TAG_ID,
+    ExifMarkers,
+)
+from exif._ifd_decoder import IfdTagEntry
+from exif._positioned_read import (
+    ReadAt,
+    find_app1_body_range,
+    get_bytes_reader,
+    get_file_reader,
+    read_ifd,
+    read_ifd_tag_count,
+    read_tiff_header,
+)
+
+
+def _read_ifd1(
+    read_at: ReadAt, body_offset: int
+) -> Optional[Tuple[int, List[IfdTagEntry]]]:
+    # Read IFD 1 (which describes the thumbnail) and its offset within the APP1 body.
+    try:
+        decoder, ifd0_offset = read_tiff_header(read_at, body_offset)
+
+        # Only read IFD 0's tag count and next IFD offset to locate IFD 1.
+        ifd0_tag_count = read_ifd_tag_count(read_at, decoder, body_offset + ifd0_offset)
+        next_offset_bytes = read_at(
+            body_offset
+            + ifd0_offset
+            + decoder.ifd_count.size
+            + ifd0_tag_count * decoder.ifd_tag.size,
+            decoder.uint32.size,
+        )
+        (ifd1_offset,) = decoder.uint32.unpack_from(next_offset_bytes)
+        if not ifd1_offset:
+            return None  # no IFD 1
+
+        ifd1_tags, _ = read_ifd(read_at, decoder, body_offset + ifd1_offset)
+    except (struct.error, ValueError):
+        return None  # truncated or invalid EXIF metadata
+
+    return ifd1_offset, ifd1_tags
+
+
+def _read_thumbnail(read_at: ReadAt) -> Optional[bytes]:
+    body_range = find_app1_body_range(read_at)
+    if body_range is None:
+        return None
+
+    # Like when parsing the whole APP1 segment, only read the thumbnail from within the APP1 body.
+    body_offset, body_end = body_range
+    body_nbytes = body_end - body_offset
+
+    ifd1 = _read_ifd1(read_at, body_offset)
+    if ifd1 is None:
+        return None
+
+    ifd1_offset, ifd1_tags = ifd1
+    thumbnail_offset = None
+    thumbnail_nbytes = None
+
+    for tag_t in ifd1_tags:
+        if tag_t.tag_id == THUMBNAIL_OFFSET_TAG_ID:
+            thumbnail_offset = tag_t.value_offset
+        elif tag_t.tag_id == THUMBNAIL_LENGTH_TAG_ID:
+            thumbnail_nbytes = tag_t.value_offset
+
+    if (
+        thumbnail_offset is not None
+        and thumbnail_nbytes is not None
+        and thumbnail_offset + thumbnail_nbytes <= body_nbytes
+    ):
+        thumbnail_bytes = bytes(
+            read_at(body_offset + thumbnail_offset, thumbnail_nbytes)
+        )
+        if (
+            len(thumbnail_bytes) == thumbnail_nbytes
+            and thumbnail_bytes[: len(ExifMarkers.SOI)] == ExifMarkers.SOI
+        ):
+            return thumbnail_bytes
+
+    # Like when parsing the whole APP1 segment, fall back to scanning for the markers after IFD 1.
+    after_ifd1_bytes = bytes(
+        read_at(body_offset + ifd1_offset, max(body_nbytes - ifd1_offset, 0))
+    )
+    start_index = after_ifd1_bytes.find(ExifMarkers.SOI)
+    end_index = after_ifd1_bytes.find(ExifMarkers.EOI)
+    if start_index == -1 or end_index == -1:
+        return None
+
+    return after_ifd1_bytes[start_index : end_index + len(ExifMarkers.EOI)]
+
+
+def extract_thumbnail(
+    img_file: Union[
+        BinaryIO, bytes, str, "os.PathLike[str]"
+    ]  # pylint: disable=unsubscriptable-object
+) -> bytes:
+    """Extract the thumbnail contained in an image's EXIF metadata without parsing the rest of it.
+
+    Only the TIFF header, IFD 0's tag count and next IFD offset, and IFD 1 are read to locate the thumbnail using the
+    offset and length tags in IFD 1. When reading a file, only those byte ranges and the thumbnail itself are read
+    (i.e., the file is never read in its entirety).
+
+    :param img_file: image file
+    :type img_file: str or path-like (file path), bytes (already-read contents), or File (seekable)
+    :returns: thumbnail binary
+    :raises RuntimeError: image does not contain thumbnail
+
+    """
+    if hasattr(img_file, "read"):
+        thumbnail_bytes = _read_thumbnail(get_file_reader(img_file))  # type: ignore
+    elif isinstance(img_file, (bytes, bytearray, memoryview)):
+        thumbnail_bytes = _read_thumbnail(get_bytes_reader(img_file))
+    else:
+        with open(os.fspath(img_file), "rb") as file_descriptor:
+            thumbnail_bytes = _read_thumbnail(get_file_reader(file_descriptor))
+
+    if not thumbnail_bytes:
+        raise RuntimeError("image does not contain thumbnail")
+
+    return thumbnail_bytes
@@ -42,3 +42,61 @@ def value_fits_in_ifd_tag(tag_dt):
     # RATIONAL and SRATIONAL are never in ifd tag itself
 
     return is_value_in_ifd_tag_itself
+
+
+class DirtyRangeBytearray(bytearray):
+
+    """Byte array that records the ranges modified by item assignment (e.g., by plum views)."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._dirty_ranges = []
+
+    def __setitem__(self, key, value):
+        previous_len = len(self)
+        super().__setitem__(key, value)
+
+        if isinstance(key, slice):
+            start, stop, _ = key.indices(previous_len)
+            if len(self) != previous_len:
+                stop = len(self)  # all subsequent bytes shifted
+        else:
+            start = range(previous_len)[key]
+            stop = start + 1
+
+        if stop > start:
+            self._dirty_ranges.append((start, stop))
+
+    def clear_dirty_ranges(self):
+        """Forget previously-recorded modifications."""
+        self._dirty_ranges = []
+
+    def get_dirty_ranges(self):
+        """Get sorted, non-overlapping byte ranges modified since the ranges were last cleared.
+
+        :returns: start (inclusive) and stop (exclusive) indices of modified ranges
+        :rtype: list of tuple
+
+        """
+        merged_ranges = []
+
+        for start, stop in sorted(self._dirty_ranges):
+            if merged_ranges and start <= merged_ranges[-1][1]:
+                merged_ranges[-1] = (
+                    merged_ranges[-1][0],
+                    max(stop, merged_ranges[-1][1]),
+                )
+            else:
+                merged_ranges.append((start, stop))
+
+        return merged_ranges
+
+    def mark_dirty(self, start, stop):
+        """Record a modified byte range.
+
+        :param int start: start index (inclusive)
+        :param int stop: stop index (exclusive)
+
+        """
+        if stop > start:
+            self._dirty_ranges.append((start, stop))
@@ -0,0 +1,171 @@
+"""Read and write images within an ``asyncio`` event loop without blocking it.
+
+Image files are read in bounded chunks through asynchronous file objects (e.g., those returned by ``aiofiles.open()``
+or an ``asyncio.StreamReader``), and the CPU-bound parsing and serialization run in an executor.
+
+"""
+
+import asyncio
+import functools
+import os
+from concurrent.futures import Executor
+from typing import Any, Callable, Iterable, Optional
+
+from exif._image import HEADER_CHUNK_SIZE, Image
+from exif._jpeg_segments import is_header_complete
+
+READ_CHUNK_SIZE = 0x10000
+"""Number of bytes requested per read when loading the entire image."""
+
+
+async def _run_in_executor(
+    executor: Optional[Executor], func: Callable[[], Any]
+) -> Any:
+    return await asyncio.get_running_loop().run_in_executor(executor, func)
+
+
+class _ExecutorFile:
+
+    """Asynchronous file object that performs the blocking file operations in an executor.
+
+    :param path: file path
+    :param mode: file mode
+    :param executor: executor to run file operations in (defaults to the event loop's default executor)
+
+    """
+
+    def __init__(
+        self, path: str, mode: str, executor: Optional[Executor] = None
+    ) -> None:
+        self._path = path
+        self._mode = mode
+        self._executor = executor
+        self._file = None
+
+    async def __aenter__(self) -> "_ExecutorFile":
+        self._file = await _run_in_executor(
+            self._executor, functools.partial(open, self._path, self._mode)
+        )
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        assert self._file is not None
+        await _run_in_executor(self._executor, self._file.close)
+
+    async def read(self, size: int = -1) -> bytes:
+        """Read up to the specified number of bytes.
+
+        :param size: maximum number of bytes to read (or -1 to read until EOF)
+        :returns: bytes read (empty at EOF)
+
+        """
+        assert self._file is not None
+        return await _run_in_executor(
+            self._executor, functools.partial(self._file.read, size)
+        )
+
+
+async def _read_image_bytes(reader, header_only: bool, chunk_size: int) -> bytes:
+    img_bytes = bytearray()
+
+    while True:
+        chunk = await reader.read(chunk_size)
+        if not chunk:
+            break
+
+        img_bytes += chunk
+
+        if header_only and is_header_complete(img_bytes):
+            break
+
+    return bytes(img_bytes)
+
+
+class AsyncImage(Image):
+
+    """Image EXIF metadata interface class with coroutines for saving the image without blocking the event loop.
+
+    Use ``open_image()`` to construct instances. Tags are accessed and modified the same as with ``Image``.
+
+    """
+
+    def __init__(
+        self,
+        img_bytes: bytes,
+        header_only: bool = False,
+        tags: Optional[Iterable[str]] = None,
+        source_path: Optional[str] = None,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        super().__init__(img_bytes, header_only=header_only, tags=tags)
+        self._executor = executor
+
+        if source_path is not None:
+            self._set_source_path(source_path)
+
+    async def async_save(self, path: Optional[str] = None) -> None:
+        """Write the image to a file without blocking the event loop.
+
+        The image is serialized and written in the executor the image was opened with. Otherwise, equivalent to
+        ``save()`` (e.g., only modified bytes are written when saving back to the file the image was opened from).
+
+        :param path: file path to write to (defaults to the file path the image was opened from)
+        :raises RuntimeError: image was opened with ``header_only=True``
+        :raises ValueError: no path specified for an image that was not opened from a file path
+
+        """
+        await _run_in_executor(self._executor, functools.partial(self.save, path))
+
+
+async def open_image(  # pylint: disable=too-many-arguments
+    source: Any,
+    *,
+    header_only: bool = False,
+    tags: Optional[Iterable[str]] = None,
+    opener: Optional[Callable[[str, str], Any]] = None,
+    executor: Optional[Executor] = None,
+    chunk_size: Optional[int] = None,
+) -> AsyncImage:
+    """Read and parse an image without blocking the event loop.
+
+    :param source: file path or asynchronous reader (i.e., an object with a ``read(size)`` coroutine such as an
+        ``asyncio.StreamReader`` or a file opened with ``aiofiles.open()``)
+    :param header_only: only read the image up to the end of its EXIF metadata (see ``Image``)
+    :param tags: names of the only tags to parse (see ``Image``)
+    :param opener: callable accepting a file path and mode and returning an asynchronous context manager that provides
+        an asynchronous reader (e.g., ``aiofiles.open``), defaults to running blocking file operations in the executor
+    :param executor: executor to parse the image and run blocking file operations in (defaults to the event loop's
+        default executor), which must be a thread pool since the parsed image is returned from it
+    :param chunk_size: maximum number of bytes requested per read (defaults to ``HEADER_CHUNK_SIZE`` when only
+        reading the header and ``READ_CHUNK_SIZE`` otherwise)
+    :returns: parsed image
+    :raises ValueError: unknown tag name
+
+    """
+    source_path = None
+
+    if chunk_size is None:
+        chunk_size = HEADER_CHUNK_SIZE if header_only else READ_CHUNK_SIZE
+
+    if hasattr(source, "read"):
+        img_bytes = await _read_image_bytes(source, header_only, chunk_size)
+    else:
+        source_path = os.fspath(source)
+
+        if opener is None:
+            opener = functools.partial(_ExecutorFile, executor=executor)
+
+        async with opener(source_path, "rb") as img_file:
+            img_bytes = await _read_image_bytes(img_file, header_only, chunk_size)
+
+    return await _run_in_executor(
+        executor,
+        functools.partial(
+            AsyncImage,
+            img_bytes,
+            header_only=header_only,
+            tags=tags,
+            source_path=source_path,
+            executor=executor,
+        ),
+    )
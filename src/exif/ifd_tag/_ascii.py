@@ -3,13 +3,11 @@
 import warnings
 
 from plum.exceptions import UnpackError
-from plum.bigendian import uint32
 from plum.dump import Record
-from plum.littleendian import uint32 as uint32_le
 from plum.str import StrX
 from plum.utilities import getbytes
 
-from exif._datatypes import TiffByteOrder
+from exif._ifd_decoder import IFD_TAG_VALUE_OFFSET
 from exif.ifd_tag._base import Base as BaseIfdTag
 
 ascii_str = StrX(encoding="ascii", name="ascii_str")
@@ -24,13 +22,7 @@ intra_ifd_ascii_str = StrX(
 class Ascii(BaseIfdTag):
     """IFD ASCII tag structure parser class."""
 
-    def __init__(self, tag_offset, app1_ref):
-        super().__init__(tag_offset, app1_ref)
-
-        if self._app1_ref.endianness == TiffByteOrder.BIG:
-            self._uint32_cls = uint32
-        else:
-            self._uint32_cls = uint32_le
+    __slots__ = ()
 
     def modify(self, value):
         """Modify tag value.
@@ -39,48 +31,36 @@ class Ascii(BaseIfdTag):
         :type value: corresponding Python type
 
         """
+        tag_t = self._decode()
+
         if (
-            len(value) > self.tag_view.value_count - 1
+            len(value) > tag_t.value_count - 1
         ):  # subtract 1 to account for null termination character
             raise ValueError("string must be no longer than original")
 
-        if self.tag_view.value_count <= 4:
-            ascii_str_bytes = intra_ifd_ascii_str.pack(value)
-            self.tag_view.value_offset = self._uint32_cls.unpack(ascii_str_bytes)
+        if tag_t.value_count <= 4:
+            self._write_value_field(intra_ifd_ascii_str.pack(value))
 
         else:  # existing ASCII value offset is a pointer
             ifd_tag_str_target = StrX(
                 encoding="ascii",
                 zero_termination=True,
-                nbytes=self.tag_view.value_count,
+                nbytes=tag_t.value_count,
                 pad=b"\x00",
                 name="ifd_tag_str_target",
             )
 
             if len(value) < 4:  # put into IFD tag instead
                 # Wipe existing value at pointer-specified offset.
-                ascii_str_bytes = bytearray(b"\x00" * self.tag_view.value_count)
-                ascii_replace_stop_index = (
-                    self.tag_view.value_offset + self.tag_view.value_count
-                )
-                self._app1_ref.body_bytes[
-                    self.tag_view.value_offset : ascii_replace_stop_index
-                ] = ascii_str_bytes
+                self._app1_ref.write(tag_t.value_offset, bytes(tag_t.value_count))
 
                 # Generate intra-IFD tag bytes.
-                ascii_str_bytes = intra_ifd_ascii_str.pack(value)
-                self.tag_view.value_offset = self._uint32_cls.unpack(ascii_str_bytes)
+                self._write_value_field(intra_ifd_ascii_str.pack(value))
 
             else:  # modify existing ASCII string at offset
-                ascii_str_bytes = ifd_tag_str_target.pack(value)
-                ascii_replace_stop_index = (
-                    self.tag_view.value_offset + self.tag_view.value_count
-                )
-                self._app1_ref.body_bytes[
-                    self.tag_view.value_offset : ascii_replace_stop_index
-                ] = ascii_str_bytes
-
-        self.tag_view.value_count = (
+                self._app1_ref.write(tag_t.value_offset, ifd_tag_str_target.pack(value))
+
+        self._write_value_count(
             len(value) + 1
         )  # add 1 to account for null termination character
 
@@ -93,22 +73,24 @@ class Ascii(BaseIfdTag):
         :rtype: corresponding Python type
 
         """
-        if self.tag_view.value_count <= 4:
+        tag_t = self._decode()
+
+        if tag_t.value_count <= 4:
             # Value fits into the 4 bytes within IFD tag itself.
             value_bytes, _ = getbytes(
                 buffer=self._app1_ref.body_bytes,
-                offset=self.tag_view.value_offset.__offset__,
+                offset=self._tag_offset + IFD_TAG_VALUE_OFFSET,
                 dump=Record(),
-                nbytes=int(self.tag_view.value_count),
+                nbytes=tag_t.value_count,
             )
 
         else:
             # Value is too large to fit in the IFD tag itself, so it's a pointer.
             value_bytes, _ = getbytes(
                 buffer=self._app1_ref.body_bytes,
-                offset=int(self.tag_view.value_offset),
+                offset=tag_t.value_offset,
                 dump=Record(),
-                nbytes=int(self.tag_view.value_count),
+                nbytes=tag_t.value_count,
             )
 
         try:
@@ -131,9 +113,7 @@ class Ascii(BaseIfdTag):
 
     def wipe(self):
         """Wipe value pointer target bytes to null."""
-        if self.tag_view.value_count > 4:
-            start_index = self.tag_view.value_offset
-            stop_index = start_index + self.tag_view.value_count
-            self._app1_ref.body_bytes[start_index:stop_index] = (
-                b"\x00" * self.tag_view.value_count
-            )
+        tag_t = self._decode()
+
+        if tag_t.value_count > 4:
+            self._app1_ref.write(tag_t.value_offset, bytes(tag_t.value_count))
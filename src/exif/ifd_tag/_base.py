@@ -1,25 +1,56 @@
 """Base IFD tag structure parser module."""
 
-from exif._datatypes import IfdTag, IfdTagLe, TiffByteOrder
+import struct
+
+from exif._constants import ATTRIBUTE_NAME_MAP
+from exif._ifd_decoder import (
+    IFD_TAG_VALUE_COUNT_OFFSET,
+    IFD_TAG_VALUE_OFFSET,
+    IfdTagEntry,
+)
 
 
 class Base:
 
     """Base IFD tag structure parser class."""
 
+    __slots__ = ("_tag_offset", "_app1_ref")
+
     def __init__(self, tag_offset, app1_ref):
         self._tag_offset = tag_offset
         self._app1_ref = app1_ref
 
-        if self._app1_ref.endianness == TiffByteOrder.BIG:
-            self._ifd_tag_cls = IfdTag
-        else:
-            self._ifd_tag_cls = IfdTagLe
+    def _decode(self) -> IfdTagEntry:
+        # Decode the IFD tag's fields directly from the shared view of the APP1 body.
+        return self._app1_ref.decoder.read_ifd_tag(
+            self._app1_ref.body_view, self._tag_offset
+        )
+
+    def _pack(self, struct_fmt, *values):
+        # Pack a new value, reporting values out of the type's range in terms of the tag instead of its struct format.
+        try:
+            return struct_fmt.pack(*values)
+        except struct.error as exc:
+            tag_id = self._decode().tag_id
+            tag = ATTRIBUTE_NAME_MAP.get(tag_id, f"<unknown EXIF tag {tag_id}>")
+            raise ValueError(f"invalid value for {tag} ({exc})") from exc
+
+    def _unpack_value_field(self, struct_fmt):
+        # Unpack a scalar value that fits within the IFD tag's value offset field.
+        return struct_fmt.unpack_from(
+            self._app1_ref.body_view, self._tag_offset + IFD_TAG_VALUE_OFFSET
+        )[0]
 
-        self.tag_view = self._ifd_tag_cls.view(
-            self._app1_ref.body_bytes, self._tag_offset
+    def _write_value_count(self, value_count):
+        self._app1_ref.write(
+            self._tag_offset + IFD_TAG_VALUE_COUNT_OFFSET,
+            self._app1_ref.decoder.uint32.pack(value_count),
         )
 
+    def _write_value_field(self, value_bytes):
+        # Overwrite (the start of) the IFD tag's value offset field (i.e., a pointer or the value itself).
+        self._app1_ref.write(self._tag_offset + IFD_TAG_VALUE_OFFSET, value_bytes)
+
     def __repr__(self):  # pragma: no cover
         return f"exif.ifd_tag.Base(tag_offset={self._tag_offset})"
 
@@ -1,10 +1,6 @@
 """IFD BYTE tag structure parser module."""
 
-from plum.bigendian import uint8
-from plum.littleendian import uint8 as uint8_le
-
 from exif._constants import ATTRIBUTE_ID_MAP, GpsAltitudeRef
-from exif._datatypes import TiffByteOrder
 from exif.ifd_tag._base import Base as BaseIfdTag
 
 
@@ -12,18 +8,12 @@ class Byte(BaseIfdTag):
 
     """IFD BYTE tag structure parser class."""
 
+    __slots__ = ()
+
     ENUMS_MAP = {
         ATTRIBUTE_ID_MAP["gps_altitude_ref"]: GpsAltitudeRef,
     }
 
-    def __init__(self, tag_offset, app1_ref):
-        super().__init__(tag_offset, app1_ref)
-
-        if self._app1_ref.endianness == TiffByteOrder.BIG:
-            self._uint8_cls = uint8
-        else:
-            self._uint8_cls = uint8_le
-
     def modify(self, value):
         """Modify tag value.
 
@@ -34,9 +24,7 @@ class Byte(BaseIfdTag):
         :type value: corresponding Python type
 
         """
-        self._uint8_cls.view(
-            self._app1_ref.body_bytes, self.tag_view.value_offset.__offset__
-        ).set(int(value))
+        self._write_value_field(self._pack(self._app1_ref.decoder.uint8, int(value)))
 
     def read(self):
         """Read tag value.
@@ -48,13 +36,10 @@ class Byte(BaseIfdTag):
         :rtype: corresponding Python type
 
         """
-        retval = int(
-            self._uint8_cls.view(
-                self._app1_ref.body_bytes, self.tag_view.value_offset.__offset__
-            )
-        )
-
-        if int(self.tag_view.tag_id) in self.ENUMS_MAP:
-            retval = self.ENUMS_MAP[int(self.tag_view.tag_id)](retval)
+        tag_id = self._decode().tag_id
+        retval = self._unpack_value_field(self._app1_ref.decoder.uint8)
+
+        if tag_id in self.ENUMS_MAP:
+            retval = self.ENUMS_MAP[tag_id](retval)
 
         return retval
@@ -2,6 +2,7 @@
 
 from plum.str import StrX
 
+from exif._ifd_decoder import IFD_TAG_VALUE_OFFSET
 from exif.ifd_tag._base import Base as BaseIfdTag
 
 
@@ -9,6 +10,8 @@ class ExifVersion(BaseIfdTag):
 
     """Custom ASCII tag (non-terminated) structure parser class for EXIF version tag."""
 
+    __slots__ = ()
+
     def modify(self, value):  # pragma: no cover
         """Modify tag value.
 
@@ -25,6 +28,7 @@ class ExifVersion(BaseIfdTag):
         :rtype: corresponding Python type
 
         """
+        value_field_offset = self._tag_offset + IFD_TAG_VALUE_OFFSET
         return StrX(encoding="ascii", name="ascii_str").unpack(
-            self.tag_view.value_offset.pack()
+            self._app1_ref.body_view[value_field_offset : value_field_offset + 4]
         )
@@ -7,6 +7,8 @@ class Long(BaseIfdTag):
 
     """IFD LONG tag structure parser class."""
 
+    __slots__ = ()
+
     def modify(self, value):
         """Modify tag value.
 
@@ -14,7 +16,7 @@ class Long(BaseIfdTag):
         :type value: corresponding Python type
 
         """
-        self.tag_view.value_offset.set(value)
+        self._write_value_field(self._pack(self._app1_ref.decoder.uint32, value))
 
     def read(self):
         """Read tag value.
@@ -26,4 +28,4 @@ class Long(BaseIfdTag):
         :rtype: corresponding Python type
 
         """
-        return int(self.tag_view.value_offset)
+        return self._decode().value_offset
@@ -1,8 +1,5 @@
 """IFD SHORT tag structure parser module."""
 
-from plum.bigendian import uint16
-from plum.littleendian import uint16 as uint16_le
-
 from exif._constants import (
     ATTRIBUTE_ID_MAP,
     ColorSpace,
@@ -18,7 +15,7 @@ from exif._constants import (
     Sharpness,
     WhiteBalance,
 )
-from exif._datatypes import Flash, TiffByteOrder
+from exif._datatypes import Flash
 from exif.ifd_tag._base import Base as BaseIfdTag
 
 
@@ -26,6 +23,8 @@ class Short(BaseIfdTag):
 
     """IFD SHORT tag structure parser class."""
 
+    __slots__ = ()
+
     CUSTOM_TYPES_MAP = {
         ATTRIBUTE_ID_MAP["flash"]: Flash,
     }
@@ -45,14 +44,6 @@ class Short(BaseIfdTag):
         ATTRIBUTE_ID_MAP["white_balance"]: WhiteBalance,
     }
 
-    def __init__(self, tag_offset, app1_ref):
-        super().__init__(tag_offset, app1_ref)
-
-        if self._app1_ref.endianness == TiffByteOrder.BIG:
-            self._uint16_cls = uint16
-        else:
-            self._uint16_cls = uint16_le
-
     def modify(self, value):
         """Modify tag value.
 
@@ -63,9 +54,7 @@ class Short(BaseIfdTag):
         :type value: corresponding Python type
 
         """
-        self._uint16_cls.view(
-            self._app1_ref.body_bytes, self.tag_view.value_offset.__offset__
-        ).set(int(value))
+        self._write_value_field(self._pack(self._app1_ref.decoder.uint16, int(value)))
 
     def read(self):
         """Read tag value.
@@ -77,17 +66,14 @@ class Short(BaseIfdTag):
         :rtype: corresponding Python type
 
         """
-        as_int = int(
-            self._uint16_cls.view(
-                self._app1_ref.body_bytes, self.tag_view.value_offset.__offset__
-            )
-        )
+        tag_id = self._decode().tag_id
+        as_int = self._unpack_value_field(self._app1_ref.decoder.uint16)
 
         try:
-            enum_type = self.ENUMS_MAP[int(self.tag_view.tag_id)]
+            enum_type = self.ENUMS_MAP[tag_id]
         except KeyError:
             try:
-                custom_type = self.CUSTOM_TYPES_MAP[int(self.tag_view.tag_id)]
+                custom_type = self.CUSTOM_TYPES_MAP[tag_id]
             except KeyError:
                 retval = as_int  # leave return value as-is
             else:
@@ -7,6 +7,8 @@ class Slong(BaseIfdTag):
 
     """IFD SLONG tag structure parser class."""
 
+    __slots__ = ()
+
     def modify(self, value):  # pragma: no cover
         """Modify tag value.
 
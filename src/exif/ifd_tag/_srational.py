@@ -2,41 +2,15 @@
 
 from fractions import Fraction
 
-from plum.bigendian import sint32
-from plum.littleendian import sint32 as sint32_le
-from plum.structure import member, Structure
-
-from exif._datatypes import TiffByteOrder
+from exif._ifd_decoder import divide_rationals
 from exif.ifd_tag._base import Base as BaseIfdTag
 
 
-class SrationalDtype(Structure):
-
-    """SRATIONAL Datatype"""
-
-    numerator: int = member(fmt=sint32)
-    denominator: int = member(fmt=sint32)
-
-
-class SrationalDtypeLe(Structure):
-
-    """SRATIONAL Datatype (Little Endian)"""
-
-    numerator: int = member(fmt=sint32_le)
-    denominator: int = member(fmt=sint32_le)
-
-
 class Srational(BaseIfdTag):
 
     """IFD SRATIONAL tag structure parser class."""
 
-    def __init__(self, tag_offset, app1_ref):
-        super().__init__(tag_offset, app1_ref)
-
-        if self._app1_ref.endianness == TiffByteOrder.BIG:
-            self.srational_dtype_cls = SrationalDtype
-        else:
-            self.srational_dtype_cls = SrationalDtypeLe
+    __slots__ = ()
 
     def modify(self, value):
         """Modify tag value.
@@ -45,30 +19,29 @@ class Srational(BaseIfdTag):
         :type value: corresponding Python type
 
         """
+        tag_t = self._decode()
+        srational_struct = self._app1_ref.decoder.srational
+
         # If IFD tag contains multiple values, ensure value is a tuple of appropriate length.
         if isinstance(value, tuple):
-            assert len(value) == int(self.tag_view.value_count)
+            assert len(value) == tag_t.value_count
         else:
-            assert int(self.tag_view.value_count) == 1
+            assert tag_t.value_count == 1
             value = (value,)
 
-        for rational_index in range(int(self.tag_view.value_count)):
-            current_offset = (
-                int(self.tag_view.value_offset)
-                + rational_index * self.srational_dtype_cls.nbytes
-            )
-            rational_view = self.srational_dtype_cls.view(
-                self._app1_ref.body_bytes, current_offset
-            )
+        for rational_index in range(tag_t.value_count):
+            current_offset = tag_t.value_offset + rational_index * srational_struct.size
 
             if isinstance(value[rational_index], int) and value[rational_index] == 0:
                 # EXIF 2.3 Specification: "When a value is unknown, the notation is 0/0" (e.g., lens specification).
-                rational_view.numerator.set(0)
-                rational_view.denominator.set(0)
+                rational_bytes = srational_struct.pack(0, 0)
             else:
                 fraction = Fraction(value[rational_index]).limit_denominator()
-                rational_view.numerator.set(fraction.numerator)
-                rational_view.denominator.set(fraction.denominator)
+                rational_bytes = self._pack(
+                    srational_struct, fraction.numerator, fraction.denominator
+                )
+
+            self._app1_ref.write(current_offset, rational_bytes)
 
     def read(self):
         """Read tag value.
@@ -77,22 +50,15 @@ class Srational(BaseIfdTag):
         :rtype: corresponding Python type
 
         """
-        retvals = []
-
-        for rational_index in range(int(self.tag_view.value_count)):
-            current_offset = (
-                int(self.tag_view.value_offset)
-                + rational_index * self.srational_dtype_cls.nbytes
-            )
-            rational_view = self.srational_dtype_cls.view(
-                self._app1_ref.body_bytes, current_offset
+        tag_t = self._decode()
+        retvals = divide_rationals(
+            self._app1_ref.decoder.read_rationals(
+                self._app1_ref.body_view,
+                tag_t.value_offset,
+                tag_t.value_count,
+                signed=True,
             )
-
-            if rational_view.numerator == 0 and rational_view.denominator == 0:
-                # EXIF 2.3 Specification: "When a value is unknown, the notation is 0/0" (e.g., lens specification).
-                retvals.append(0)
-            else:
-                retvals.append(rational_view.numerator / rational_view.denominator)
+        )
 
         if len(retvals) == 1:
             retval = retvals[0]
@@ -103,14 +69,8 @@ class Srational(BaseIfdTag):
 
     def wipe(self):
         """Wipe value pointer target bytes to null."""
-        for rational_index in range(int(self.tag_view.value_count)):
-            current_offset = (
-                int(self.tag_view.value_offset)
-                + rational_index * self.srational_dtype_cls.nbytes
-            )
-            rational_view = self.srational_dtype_cls.view(
-                self._app1_ref.body_bytes, current_offset
-            )
-
-            rational_view.numerator.set(0)
-            rational_view.denominator.set(0)
+        tag_t = self._decode()
+        self._app1_ref.write(
+            tag_t.value_offset,
+            bytes(tag_t.value_count * self._app1_ref.decoder.srational.size),
+        )
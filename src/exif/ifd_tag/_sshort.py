@@ -1,9 +1,5 @@
 """IFD SSHORT tag structure parser module."""
 
-from plum.bigendian import sint16
-from plum.littleendian import sint16 as sint16_le
-
-from exif._datatypes import TiffByteOrder
 from exif.ifd_tag._short import Short
 from exif.ifd_tag._base import Base as BaseIfdTag
 
@@ -12,15 +8,9 @@ class Sshort(BaseIfdTag):
 
     """IFD SHORT tag structure parser class."""
 
-    ENUMS_MAP = Short.ENUMS_MAP
-
-    def __init__(self, tag_offset, app1_ref):
-        super().__init__(tag_offset, app1_ref)
+    __slots__ = ()
 
-        if self._app1_ref.endianness == TiffByteOrder.BIG:
-            self._int16_cls = sint16
-        else:
-            self._int16_cls = sint16_le
+    ENUMS_MAP = Short.ENUMS_MAP
 
     def modify(self, value):  # pragma: no cover
         """Modify tag value.
@@ -45,13 +35,10 @@ class Sshort(BaseIfdTag):
         :rtype: corresponding Python type
 
         """
-        retval = int(
-            self._int16_cls.view(
-                self._app1_ref.body_bytes, self.tag_view.value_offset.__offset__
-            )
-        )
+        tag_id = self._decode().tag_id
+        retval = self._unpack_value_field(self._app1_ref.decoder.sint16)
 
-        if int(self.tag_view.tag_id) in self.ENUMS_MAP:
-            retval = self.ENUMS_MAP[int(self.tag_view.tag_id)](retval)
+        if tag_id in self.ENUMS_MAP:
+            retval = self.ENUMS_MAP[tag_id](retval)
 
         return retval
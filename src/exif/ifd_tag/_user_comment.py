@@ -13,6 +13,8 @@ class UserComment(BaseIfdTag):
 
     """IFD ASCII tag structure parser class."""
 
+    __slots__ = ()
+
     def modify(self, value):
         """Modify tag value.
 
@@ -20,34 +22,24 @@ class UserComment(BaseIfdTag):
         :type value: corresponding Python type
 
         """
-        if (
-            len(value) + USER_COMMENT_CHARACTER_CODE_LEN_BYTES
-            > self.tag_view.value_count
-        ):
+        tag_t = self._decode()
+
+        if len(value) + USER_COMMENT_CHARACTER_CODE_LEN_BYTES > tag_t.value_count:
             raise ValueError("comment must be no longer than original")
 
         ifd_tag_str_target = StrX(
             encoding="ascii",
             zero_termination=True,
-            nbytes=self.tag_view.value_count - USER_COMMENT_CHARACTER_CODE_LEN_BYTES,
+            nbytes=tag_t.value_count - USER_COMMENT_CHARACTER_CODE_LEN_BYTES,
             pad=b"\x00",
             name="ifd_tag_str_target",
         )
-
-        ascii_str_bytes = ifd_tag_str_target.pack(value)
-        ascii_replace_start_index = (
-            int(self.tag_view.value_offset) + USER_COMMENT_CHARACTER_CODE_LEN_BYTES
-        )
-        ascii_replace_stop_index = (
-            ascii_replace_start_index
-            + self.tag_view.value_count
-            - USER_COMMENT_CHARACTER_CODE_LEN_BYTES
+        self._app1_ref.write(
+            tag_t.value_offset + USER_COMMENT_CHARACTER_CODE_LEN_BYTES,
+            ifd_tag_str_target.pack(value),
         )
-        self._app1_ref.body_bytes[
-            ascii_replace_start_index:ascii_replace_stop_index
-        ] = ascii_str_bytes
 
-        self.tag_view.value_count = len(value) + USER_COMMENT_CHARACTER_CODE_LEN_BYTES
+        self._write_value_count(len(value) + USER_COMMENT_CHARACTER_CODE_LEN_BYTES)
 
     def read(self):
         """Read tag value.
@@ -60,12 +52,9 @@ class UserComment(BaseIfdTag):
 
         """
         # The string value (not null-terminated) occurs after the character code designation. (All decodable as ASCII.)
-        string_value_offset = (
-            int(self.tag_view.value_offset) + USER_COMMENT_CHARACTER_CODE_LEN_BYTES
-        )
-        string_len = (
-            int(self.tag_view.value_count) - USER_COMMENT_CHARACTER_CODE_LEN_BYTES
-        )
+        tag_t = self._decode()
+        string_value_offset = tag_t.value_offset + USER_COMMENT_CHARACTER_CODE_LEN_BYTES
+        string_len = tag_t.value_count - USER_COMMENT_CHARACTER_CODE_LEN_BYTES
 
         value_bytes, _ = getbytes(
             buffer=self._app1_ref.body_bytes,
@@ -77,10 +66,4 @@ class UserComment(BaseIfdTag):
 
     def set_character_code_to_ascii(self):
         """Set the character code header to ASCII."""
-        header_replace_start_index = int(self.tag_view.value_offset)
-        header_replace_stop_index = (
-            int(self.tag_view.value_offset) + USER_COMMENT_CHARACTER_CODE_LEN_BYTES
-        )
-        self._app1_ref.body_bytes[
-            header_replace_start_index:header_replace_stop_index
-        ] = b"ASCII\x00\x00\x00"
+        self._app1_ref.write(self._decode().value_offset, b"ASCII\x00\x00\x00")
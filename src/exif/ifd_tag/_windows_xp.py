@@ -10,6 +10,8 @@ class WindowsXp(BaseIfdTag):
 
     """Legacy Windows XP style tag structure parser class."""
 
+    __slots__ = ()
+
     def modify(self, value):  # pragma: no cover
         """Modify tag value.
 
@@ -31,11 +33,12 @@ class WindowsXp(BaseIfdTag):
         :rtype: corresponding Python type
 
         """
+        tag_t = self._decode()
         dereferenced_bytes, _ = getbytes(
             buffer=self._app1_ref.body_bytes,
-            offset=int(self.tag_view.value_offset),
+            offset=tag_t.value_offset,
             dump=Record(),
-            nbytes=int(self.tag_view.value_count),
+            nbytes=tag_t.value_count,
         )
 
         return dereferenced_bytes.decode("utf-16")[:-1]  # discard null terminator
@@ -0,0 +1,338 @@
+"""Generate synthetic images with EXIF metadata (e.g., for benchmarking and fuzzing at scale).
+
+Images are generated deterministically from a seed, so a corpus of any size can be regenerated offline instead of
+being stored. Each image contains an EXIF APP1 segment (serialized the same way as when adding tags to an image)
+followed by a minimal start of scan segment and filler image data.
+
+"""
+
+import os
+import random
+from typing import Dict, Iterator, List, Optional, Union
+
+from exif._app1_metadata import MAX_APP1_SEGMENT_LENGTH
+from exif._app1_serializer import IfdEntry, IfdKey, serialize_ifds
+from exif._constants import (
+    ATTRIBUTE_ID_MAP,
+    ATTRIBUTE_NAME_MAP,
+    ATTRIBUTE_TYPE_MAP,
+    EXIF_IFD_POINTER_TAG_ID,
+    GPS_IFD_POINTER_TAG_ID,
+    INTEROPERABILITY_IFD_POINTER_TAG_ID,
+    TAG_VALUE_COUNTS,
+    THUMBNAIL_LENGTH_TAG_ID,
+    THUMBNAIL_OFFSET_TAG_ID,
+    ExifMarkers,
+)
+from exif._datatypes import ExifType, TiffByteOrder
+from exif._ifd_decoder import IfdDecoder, get_decoder
+from exif._jpeg_segments import EXIF_IDENTIFIER
+from exif.ifd_tag import Short
+
+_EXCLUDED_TAG_IDS = {
+    EXIF_IFD_POINTER_TAG_ID,
+    GPS_IFD_POINTER_TAG_ID,
+    INTEROPERABILITY_IFD_POINTER_TAG_ID,
+    THUMBNAIL_LENGTH_TAG_ID,
+    THUMBNAIL_OFFSET_TAG_ID,
+}
+"""IDs of tags whose values are generated from the layout instead of randomly (i.e., pointers)."""
+
+_KNOWN_TAGS = sorted(
+    (ATTRIBUTE_ID_MAP[tag], tag_type, ifd_key)
+    for tag, (tag_type, ifd_key) in ATTRIBUTE_TYPE_MAP.items()
+    if ATTRIBUTE_ID_MAP[tag] not in _EXCLUDED_TAG_IDS
+)
+"""ID, EXIF type, and IFD of each tag that can be generated with a random value."""
+
+_UNKNOWN_TAG_IDS = [
+    tag_id for tag_id in range(0xC000, 0x10000) if tag_id not in ATTRIBUTE_NAME_MAP
+]
+"""Private tag IDs (not known to this package) used to pad images to the requested number of tags."""
+
+_UNKNOWN_TAG_TYPES = [
+    ExifType.ASCII,
+    ExifType.SHORT,
+    ExifType.LONG,
+    ExifType.RATIONAL,
+    ExifType.UNDEFINED,
+]
+
+_UNKNOWN_TAG_IFD_KEYS: List[IfdKey] = [0, "exif"]
+"""IFDs that private tags are added to."""
+
+_GPS_REFS = {
+    ATTRIBUTE_ID_MAP["gps_dest_latitude_ref"]: "NS",
+    ATTRIBUTE_ID_MAP["gps_dest_longitude_ref"]: "EW",
+    ATTRIBUTE_ID_MAP["gps_latitude_ref"]: "NS",
+    ATTRIBUTE_ID_MAP["gps_longitude_ref"]: "EW",
+}
+"""Valid reference characters of GPS coordinate tags (so that coordinates can be converted to decimal degrees)."""
+
+_EXIF_VERSION = IfdEntry(
+    ATTRIBUTE_ID_MAP["exif_version"], ExifType.UNDEFINED, 4, b"0230"
+)
+_USER_COMMENT_TAG_ID = ATTRIBUTE_ID_MAP["user_comment"]
+_MAKER_NOTE_TAG_ID = ATTRIBUTE_ID_MAP["maker_note"]
+_ASCII_CHARACTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789 "
+_SOS_SEGMENT = ExifMarkers.SOS + b"\x00\x02"  # start of scan with an empty header
+
+
+def _random_bytes(rng: random.Random, nbytes: int) -> bytes:
+    if not nbytes:
+        return b""  # getrandbits(0) raises a ValueError before Python 3.9
+
+    # Exclude segment prefixes so that the bytes never resemble a JPEG marker.
+    random_bytes = rng.getrandbits(8 * nbytes).to_bytes(nbytes, "little")
+    return random_bytes.replace(ExifMarkers.SEG_PREFIX, b"\x00")
+
+
+def _random_ascii(rng: random.Random, nbytes: int) -> bytes:
+    return "".join(rng.choice(_ASCII_CHARACTERS) for _ in range(nbytes)).encode("ascii")
+
+
+def _random_entry(
+    rng: random.Random,
+    decoder: IfdDecoder,
+    tag_id: int,
+    tag_type: int,
+    ascii_nbytes: int,
+) -> IfdEntry:
+    # pylint: disable=too-many-return-statements
+    if tag_id == _USER_COMMENT_TAG_ID:
+        value_bytes = b"ASCII\x00\x00\x00" + _random_ascii(rng, ascii_nbytes) + b"\x00"
+        return IfdEntry(tag_id, tag_type, len(value_bytes), value_bytes)
+
+    if tag_id in _GPS_REFS:
+        value_bytes = rng.choice(_GPS_REFS[tag_id]).encode("ascii") + b"\x00"
+        return IfdEntry(tag_id, tag_type, len(value_bytes), value_bytes)
+
+    if tag_type == ExifType.ASCII:
+        value_bytes = _random_ascii(rng, ascii_nbytes) + b"\x00"
+        return IfdEntry(tag_id, tag_type, len(value_bytes), value_bytes)
+
+    if tag_type == ExifType.UNDEFINED:
+        value_bytes = _random_bytes(rng, ascii_nbytes)
+        return IfdEntry(tag_id, tag_type, len(value_bytes), value_bytes)
+
+    if tag_type == ExifType.BYTE:
+        return IfdEntry(tag_id, tag_type, 1, decoder.uint8.pack(rng.randrange(2)))
+
+    if tag_type == ExifType.SHORT:
+        value: int
+
+        if tag_id in Short.ENUMS_MAP:
+            value = rng.choice(list(Short.ENUMS_MAP[tag_id]))
+        elif tag_id in Short.CUSTOM_TYPES_MAP:
+            value = rng.randrange(
+                0x100
+            )  # custom types (e.g., flash) only occupy the lower byte
+        else:
+            value = rng.randrange(0x10000)
+
+        return IfdEntry(tag_id, tag_type, 1, decoder.uint16.pack(value))
+
+    if tag_type == ExifType.LONG:
+        return IfdEntry(tag_id, tag_type, 1, decoder.uint32.pack(rng.getrandbits(32)))
+
+    value_count = TAG_VALUE_COUNTS.get(tag_id, 1)
+
+    if tag_type == ExifType.SRATIONAL:
+        value_bytes = b"".join(
+            decoder.srational.pack(
+                rng.randrange(-0x10000, 0x10000), rng.randrange(1, 0x10000)
+            )
+            for _ in range(value_count)
+        )
+    else:
+        value_bytes = b"".join(
+            decoder.rational.pack(rng.randrange(0x10000), rng.randrange(1, 0x10000))
+            for _ in range(value_count)
+        )
+
+    return IfdEntry(tag_id, tag_type, value_count, value_bytes)
+
+
+def _generate_thumbnail(rng: random.Random, nbytes: int) -> bytes:
+    filler_nbytes = max(nbytes - len(ExifMarkers.SOI) - len(ExifMarkers.EOI), 0)
+    return ExifMarkers.SOI + _random_bytes(rng, filler_nbytes) + ExifMarkers.EOI
+
+
+def generate_image(
+    seed: Union[int, str] = 0,
+    *,
+    tag_count: int = 64,
+    byte_order: Optional[int] = TiffByteOrder.BIG,
+    ascii_nbytes: int = 32,
+    maker_note_nbytes: int = 0,
+    thumbnail_nbytes: int = 0,
+    extra_ifd_count: int = 0,
+    image_data_nbytes: int = 1024,
+) -> bytes:
+    """Generate a synthetic JPEG image with EXIF metadata.
+
+    The tags are sampled from the tags this package supports adding (with random values of the appropriate type),
+    and any tags beyond those are private tags with IDs unknown to this package (which are parsed but not listed by
+    ``Image.list_all()``). The same arguments always generate the same image.
+
+    :param seed: random seed
+    :param tag_count: number of tags with random values in IFD 0 and the EXIF and GPS IFDs (i.e., excluding the
+        EXIF version, maker note, and pointers to other IFDs)
+    :param byte_order: TIFF byte order (``TiffByteOrder.BIG`` or ``TiffByteOrder.LITTLE``), or ``None`` to choose one
+        randomly
+    :param ascii_nbytes: number of characters in each ASCII tag value (and bytes in each UNDEFINED tag value)
+    :param maker_note_nbytes: number of bytes in the maker note (or 0 to omit it)
+    :param thumbnail_nbytes: number of bytes in the thumbnail in IFD 1 (or 0 to omit it)
+    :param extra_ifd_count: number of IFDs to chain after IFD 1 (which is added even without a thumbnail)
+    :param image_data_nbytes: number of bytes of filler image data after the start of scan segment
+    :returns: image bytes
+    :raises ValueError: EXIF metadata exceeds the maximum APP1 segment size
+
+    """
+    # pylint: disable=too-many-arguments,too-many-locals
+    rng = random.Random(f"exif.synthetic:{seed}")
+
+    if byte_order is None:
+        byte_order = rng.choice([TiffByteOrder.BIG, TiffByteOrder.LITTLE])
+
+    byte_order = TiffByteOrder(byte_order)
+    decoder = get_decoder(byte_order)
+
+    ifds: Dict[IfdKey, List[IfdEntry]] = {0: [], "exif": [_EXIF_VERSION]}
+
+    known_tags = rng.sample(_KNOWN_TAGS, min(tag_count, len(_KNOWN_TAGS)))
+    for tag_id, tag_type, ifd_key in known_tags:
+        ifds.setdefault(ifd_key, []).append(
+            _random_entry(rng, decoder, tag_id, tag_type, ascii_nbytes)
+        )
+
+    unknown_tag_ids = rng.sample(_UNKNOWN_TAG_IDS, max(tag_count - len(known_tags), 0))
+    for tag_id in unknown_tag_ids:
+        ifds[rng.choice(_UNKNOWN_TAG_IFD_KEYS)].append(
+            _random_entry(
+                rng, decoder, tag_id, rng.choice(_UNKNOWN_TAG_TYPES), ascii_nbytes
+            )
+        )
+
+    if maker_note_nbytes:
+        ifds["exif"].append(
+            IfdEntry(
+                _MAKER_NOTE_TAG_ID,
+                ExifType.UNDEFINED,
+                maker_note_nbytes,
+                _random_bytes(rng, maker_note_nbytes),
+            )
+        )
+
+    if thumbnail_nbytes or extra_ifd_count:
+        ifds[1] = [
+            IfdEntry(
+                ATTRIBUTE_ID_MAP["compression"],
+                ExifType.SHORT,
+                1,
+                decoder.uint16.pack(6),
+            ),
+            IfdEntry(
+                ATTRIBUTE_ID_MAP["resolution_unit"],
+                ExifType.SHORT,
+                1,
+                decoder.uint16.pack(2),
+            ),
+        ]
+
+        if thumbnail_nbytes:
+            thumbnail = _generate_thumbnail(rng, thumbnail_nbytes)
+            ifds[1] += [
+                IfdEntry(THUMBNAIL_OFFSET_TAG_ID, ExifType.LONG, 1, thumbnail),
+                IfdEntry(
+                    THUMBNAIL_LENGTH_TAG_ID,
+                    ExifType.LONG,
+                    1,
+                    decoder.uint32.pack(len(thumbnail)),
+                ),
+            ]
+
+    for ifd_number in range(2, 2 + extra_ifd_count):
+        ifds[ifd_number] = [
+            IfdEntry(
+                ATTRIBUTE_ID_MAP["image_width"],
+                ExifType.LONG,
+                1,
+                decoder.uint32.pack(rng.randrange(1, 0x10000)),
+            ),
+            IfdEntry(
+                ATTRIBUTE_ID_MAP["image_height"],
+                ExifType.LONG,
+                1,
+                decoder.uint32.pack(rng.randrange(1, 0x10000)),
+            ),
+        ]
+
+    tiff_header_bytes = (
+        (b"MM" if byte_order == TiffByteOrder.BIG else b"II")
+        + decoder.uint16.pack(0x2A)
+        + decoder.uint32.pack(0)  # IFD 0 offset is set when serialized
+    )
+    body_bytes = serialize_ifds(ifds, tiff_header_bytes, byte_order)
+
+    app1_len = (
+        2 + len(EXIF_IDENTIFIER) + len(body_bytes)
+    )  # length field includes itself
+    if app1_len > MAX_APP1_SEGMENT_LENGTH:
+        raise ValueError(
+            f"EXIF metadata exceeds the maximum APP1 segment size ({app1_len} > {MAX_APP1_SEGMENT_LENGTH} bytes)"
+        )
+
+    return b"".join(
+        [
+            ExifMarkers.SOI,
+            ExifMarkers.APP1,
+            app1_len.to_bytes(2, "big"),
+            EXIF_IDENTIFIER,
+            bytes(body_bytes),
+            _SOS_SEGMENT,
+            _random_bytes(rng, image_data_nbytes),
+            ExifMarkers.EOI,
+        ]
+    )
+
+
+def generate_images(count: int, seed: Union[int, str] = 0, **kwargs) -> Iterator[bytes]:
+    """Generate synthetic JPEG images with EXIF metadata.
+
+    :param count: number of images
+    :param seed: random seed of the corpus (each image's seed is derived from it and the image's index)
+    :param kwargs: keyword arguments for ``generate_image()`` (except ``seed``)
+    :returns: image bytes
+
+    """
+    for index in range(count):
+        yield generate_image(seed=f"{seed}:{index}", **kwargs)
+
+
+def write_corpus(
+    directory: Union[str, "os.PathLike[str]"],  # pylint: disable=unsubscriptable-object
+    count: int,
+    seed: Union[int, str] = 0,
+    **kwargs,
+) -> List[str]:
+    """Write synthetic JPEG images with EXIF metadata to a directory.
+
+    :param directory: directory to write the images to (created if it does not exist)
+    :param count: number of images
+    :param seed: random seed of the corpus (see ``generate_images()``)
+    :param kwargs: keyword arguments for ``generate_image()`` (except ``seed``)
+    :returns: file paths of the images (named by index)
+
+    """
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+
+    for index, image_bytes in enumerate(generate_images(count, seed, **kwargs)):
+        path = os.path.join(directory, f"synthetic_{index:07d}.jpg")
+        with open(path, "wb") as image_file:
+            image_file.write(image_bytes)
+
+        paths.append(path)
+
+    return paths
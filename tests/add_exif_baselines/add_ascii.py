@@ -1,57 +1,57 @@
-"""APP1 segment hexadecimal baseline for test_add_ascii in test_add module."""
-
-from baseline import Baseline
-
-ADD_ASCII_BASELINE = Baseline(
-    """
-    FFE103FF4578696600004D4D002A00000008000A011200030000000100010000011A0005000000010000008601
-    1B0005000000010000008E012800030000000100020000013100020000001C0000009601320002000000140000
-    00B28769000400000001000000FA010E00020000001D000000C6010F00020000000A000000E301100002000000
-    0B000000ED00000126000AFC8000002710000AFC800000271041646F62652050686F746F73686F702043533420
-    57696E646F777300323031383A31323A32322032333A32323A3439004E6F6973652047656E6572617465642062
-    792050686F746F73686F700054657374204D616B650054657374204D6F64656C0000000003A001000300000001
-    00010000A00200040000000100000006A003000400000001000000060000000000000006010300030000000100
-    060000011A00050000000100000174011B0005000000010000017C012800030000000100020000020100040000
-    0001000001840202000400000001000002730000000000000048000000010000004800000001FFD8FFE000104A
-    46494600010200004800480000FFED000C41646F62655F434D0001FFEE000E41646F626500648000000001FFDB
-    0084000C08080809080C09090C110B0A0B11150F0C0C0F1518131315131318110C0C0C0C0C0C110C0C0C0C0C0C
-    0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C010D0B0B0D0E0D100E0E10140E0E0E14140E0E0E0E1411
-    0C0C0C0C0C11110C0C0C0C0C0C110C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0CFFC000
-    11080006000603012200021101031101FFDD00040001FFC4013F00000105010101010101000000000000000300
-    01020405060708090A0B0100010501010101010100000000000000010002030405060708090A0B100001040103
-    0204020507060805030C33010002110304211231054151611322718132061491A1B14223241552C16233347282
-    D14307259253F0E1F163733516A2B283264493546445C2A3743617D255E265F2B384C3D375E3F3462794A485B4
-    95C4D4E4F4A5B5C5D5E5F55666768696A6B6C6D6E6F637475767778797A7B7C7D7E7F711000202010204040304
-    050607070605350100021103213112044151617122130532819114A1B14223C152D1F0332462E1728292435315
-    637334F1250616A2B283072635C2D2449354A317644555367465E2F2B384C3D375E3F34694A485B495C4D4E4F4
-    A5B5C5D5E5F55666768696A6B6C6D6E6F62737475767778797A7B7C7FFDA000C03010002110311003F00D0BABE
-    9FF69C7165B59C1DEE7D7B43DB78B8179F42F7B196D97596D365ECC5B2FA71BAAD7451996D3FE129C84BC69255
-    BD7C7FE57E4FF53FE6BFF4B7F2FE75D1F5D7F94FFC6BDFF7B8BFF4BFFED87FA39FFFD9
-    """
-)
-
-ADD_ASCII_LE_BASELINE = Baseline(
-    """
-    FFE103A94578696600004D4D002A000000080007011200030000000100010000011A0005000000010000006201
-    1B0005000000010000006A012800030000000100020000013100020000001C0000007201320002000000140000
-    008E8769000400000001000000A4000000D0000AFC8000002710000AFC800000271041646F62652050686F746F
-    73686F70204353342057696E646F777300323031383A31323A32322032333A32323A34390000000003A0010003
-    0000000100010000A00200040000000100000006A0030004000000010000000600000000000000060103000300
-    00000100060000011A0005000000010000011E011B000500000001000001260128000300000001000200000201
-    0004000000010000012E0202000400000001000002730000000000000048000000010000004800000001FFD8FF
-    E000104A46494600010200004800480000FFED000C41646F62655F434D0001FFEE000E41646F62650064800000
-    0001FFDB0084000C08080809080C09090C110B0A0B11150F0C0C0F1518131315131318110C0C0C0C0C0C110C0C
-    0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C010D0B0B0D0E0D100E0E10140E0E0E14140E0E
-    0E0E14110C0C0C0C0C11110C0C0C0C0C0C110C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C
-    0CFFC00011080006000603012200021101031101FFDD00040001FFC4013F000001050101010101010000000000
-    0000030001020405060708090A0B0100010501010101010100000000000000010002030405060708090A0B1000
-    010401030204020507060805030C33010002110304211231054151611322718132061491A1B14223241552C162
-    33347282D14307259253F0E1F163733516A2B283264493546445C2A3743617D255E265F2B384C3D375E3F34627
-    94A485B495C4D4E4F4A5B5C5D5E5F55666768696A6B6C6D6E6F637475767778797A7B7C7D7E7F7110002020102
-    04040304050607070605350100021103213112044151617122130532819114A1B14223C152D1F0332462E17282
-    92435315637334F1250616A2B283072635C2D2449354A317644555367465E2F2B384C3D375E3F34694A485B495
-    C4D4E4F4A5B5C5D5E5F55666768696A6B6C6D6E6F62737475767778797A7B7C7FFDA000C03010002110311003F
-    00D0BABE9FF69C7165B59C1DEE7D7B43DB78B8179F42F7B196D97596D365ECC5B2FA71BAAD7451996D3FE129C8
-    4BC69255BD7C7FE57E4FF53FE6BFF4B7F2FE75D1F5D7F94FFC6BDFF7B8BFF4BFFED87FA39FFFD9
-    """
-)
+"""APP1 segment hexadecimal baseline for test_add_ascii in test_add module."""
+
+from baseline import Baseline
+
+ADD_ASCII_BASELINE = Baseline(
+    """
+    FFE103FE4578696600004D4D002A00000008000A010E00020000001D00000086010F00020000000A000000A401
+    1000020000000B000000AE011200030000000100010000011A000500000001000000BA011B0005000000010000
+    00C2012800030000000100020000013100020000001C000000CA0132000200000014000000E687690004000000
+    01000000FA000001244E6F6973652047656E6572617465642062792050686F746F73686F70000054657374204D
+    616B650054657374204D6F64656C0000000AFC8000002710000AFC800000271041646F62652050686F746F7368
+    6F70204353342057696E646F777300323031383A31323A32322032333A32323A3439000003A001000300000001
+    00010000A00200040000000100000006A003000400000001000000060000000000060103000300000001000600
+    00011A00050000000100000172011B0005000000010000017A0128000300000001000200000201000400000001
+    000001820202000400000001000002730000000000000048000000010000004800000001FFD8FFE000104A4649
+    4600010200004800480000FFED000C41646F62655F434D0001FFEE000E41646F626500648000000001FFDB0084
+    000C08080809080C09090C110B0A0B11150F0C0C0F1518131315131318110C0C0C0C0C0C110C0C0C0C0C0C0C0C
+    0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C010D0B0B0D0E0D100E0E10140E0E0E14140E0E0E0E14110C0C
+    0C0C0C11110C0C0C0C0C0C110C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0CFFC0001108
+    0006000603012200021101031101FFDD00040001FFC4013F000001050101010101010000000000000003000102
+    0405060708090A0B0100010501010101010100000000000000010002030405060708090A0B1000010401030204
+    020507060805030C33010002110304211231054151611322718132061491A1B14223241552C16233347282D143
+    07259253F0E1F163733516A2B283264493546445C2A3743617D255E265F2B384C3D375E3F3462794A485B495C4
+    D4E4F4A5B5C5D5E5F55666768696A6B6C6D6E6F637475767778797A7B7C7D7E7F7110002020102040403040506
+    07070605350100021103213112044151617122130532819114A1B14223C152D1F0332462E17282924353156373
+    34F1250616A2B283072635C2D2449354A317644555367465E2F2B384C3D375E3F34694A485B495C4D4E4F4A5B5
+    C5D5E5F55666768696A6B6C6D6E6F62737475767778797A7B7C7FFDA000C03010002110311003F00D0BABE9FF6
+    9C7165B59C1DEE7D7B43DB78B8179F42F7B196D97596D365ECC5B2FA71BAAD7451996D3FE129C84BC69255BD7C
+    7FE57E4FF53FE6BFF4B7F2FE75D1F5D7F94FFC6BDFF7B8BFF4BFFED87FA39FFFD900
+    """
+)
+
+ADD_ASCII_LE_BASELINE = Baseline(
+    """
+    FFE103A94578696600004D4D002A000000080007011200030000000100010000011A0005000000010000006201
+    1B0005000000010000006A012800030000000100020000013100020000001C0000007201320002000000140000
+    008E8769000400000001000000A4000000D0000AFC8000002710000AFC800000271041646F62652050686F746F
+    73686F70204353342057696E646F777300323031383A31323A32322032333A32323A34390000000003A0010003
+    0000000100010000A00200040000000100000006A0030004000000010000000600000000000000060103000300
+    00000100060000011A0005000000010000011E011B000500000001000001260128000300000001000200000201
+    0004000000010000012E0202000400000001000002730000000000000048000000010000004800000001FFD8FF
+    E000104A46494600010200004800480000FFED000C41646F62655F434D0001FFEE000E41646F62650064800000
+    0001FFDB0084000C08080809080C09090C110B0A0B11150F0C0C0F1518131315131318110C0C0C0C0C0C110C0C
+    0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C010D0B0B0D0E0D100E0E10140E0E0E14140E0E
+    0E0E14110C0C0C0C0C11110C0C0C0C0C0C110C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C
+    0CFFC00011080006000603012200021101031101FFDD00040001FFC4013F000001050101010101010000000000
+    0000030001020405060708090A0B0100010501010101010100000000000000010002030405060708090A0B1000
+    010401030204020507060805030C33010002110304211231054151611322718132061491A1B14223241552C162
+    33347282D14307259253F0E1F163733516A2B283264493546445C2A3743617D255E265F2B384C3D375E3F34627
+    94A485B495C4D4E4F4A5B5C5D5E5F55666768696A6B6C6D6E6F637475767778797A7B7C7D7E7F7110002020102
+    04040304050607070605350100021103213112044151617122130532819114A1B14223C152D1F0332462E17282
+    92435315637334F1250616A2B283072635C2D2449354A317644555367465E2F2B384C3D375E3F34694A485B495
+    C4D4E4F4A5B5C5D5E5F55666768696A6B6C6D6E6F62737475767778797A7B7C7FFDA000C03010002110311003F
+    00D0BABE9FF69C7165B59C1DEE7D7B43DB78B8179F42F7B196D97596D365ECC5B2FA71BAAD7451996D3FE129C8
+    4BC69255BD7C7FE57E4FF53FE6BFF4B7F2FE75D1F5D7F94FFC6BDFF7B8BFF4BFFED87FA39FFFD9
+    """
+)
@@ -1,33 +1,33 @@
-"""APP1 segment hexadecimal baseline for test_add_gps in test_add module."""
-
-from baseline import Baseline
-
-ADD_GPS_BASELINE = Baseline(
-    """
-    FFE1043B4578696600004D4D002A000000080008011200030000000100010000011A0005000000010000006E01
-    1B00050000000100000076012800030000000100020000013100020000001C0000007E01320002000000140000
-    009A8769000400000001000000B08825000400000001000000DC00000162000AFC8000002710000AFC80000027
-    1041646F62652050686F746F73686F70204353342057696E646F777300323031383A31323A32322032333A3232
-    3A34390000000003A00100030000000100010000A00200040000000100000006A0030004000000010000000600
-    0000000000000600040005000000030000012A0002000500000003000001420003000200000002570000000001
-    0002000000024E00000000060005000000010000015A0005000100000001000000000000000000000070000000
-    010000000500000001000000D10000003200000024000000010000000300000001000001150000001900033DCD
-    000000610006010300030000000100060000011A000500000001000001B0011B000500000001000001B8012800
-    0300000001000200000201000400000001000001C0020200040000000100000273000000000000004800000001
-    0000004800000001FFD8FFE000104A46494600010200004800480000FFED000C41646F62655F434D0001FFEE00
-    0E41646F626500648000000001FFDB0084000C08080809080C09090C110B0A0B11150F0C0C0F15181313151313
-    18110C0C0C0C0C0C110C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C010D0B0B0D0E0D10
-    0E0E10140E0E0E14140E0E0E0E14110C0C0C0C0C11110C0C0C0C0C0C110C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C
-    0C0C0C0C0C0C0C0C0C0C0C0CFFC00011080006000603012200021101031101FFDD00040001FFC4013F00000105
-    01010101010100000000000000030001020405060708090A0B0100010501010101010100000000000000010002
-    030405060708090A0B1000010401030204020507060805030C3301000211030421123105415161132271813206
-    1491A1B14223241552C16233347282D14307259253F0E1F163733516A2B283264493546445C2A3743617D255E2
-    65F2B384C3D375E3F3462794A485B495C4D4E4F4A5B5C5D5E5F55666768696A6B6C6D6E6F637475767778797A7
-    B7C7D7E7F711000202010204040304050607070605350100021103213112044151617122130532819114A1B142
-    23C152D1F0332462E1728292435315637334F1250616A2B283072635C2D2449354A317644555367465E2F2B384
-    C3D375E3F34694A485B495C4D4E4F4A5B5C5D5E5F55666768696A6B6C6D6E6F62737475767778797A7B7C7FFDA
-    000C03010002110311003F00D0BABE9FF69C7165B59C1DEE7D7B43DB78B8179F42F7B196D97596D365ECC5B2FA
-    71BAAD7451996D3FE129C84BC69255BD7C7FE57E4FF53FE6BFF4B7F2FE75D1F5D7F94FFC6BDFF7B8BFF4BFFED8
-    7FA39FFFD9
-    """
-)
+"""APP1 segment hexadecimal baseline for test_add_gps in test_add module."""
+
+from baseline import Baseline
+
+ADD_GPS_BASELINE = Baseline(
+    """
+    FFE104384578696600004D4D002A000000080008011200030000000100010000011A0005000000010000006E01
+    1B00050000000100000076012800030000000100020000013100020000001C0000007E01320002000000140000
+    009A8769000400000001000000AE8825000400000001000000D80000015E000AFC8000002710000AFC80000027
+    1041646F62652050686F746F73686F70204353342057696E646F777300323031383A31323A32322032333A3232
+    3A3439000003A00100030000000100010000A00200040000000100000006A00300040000000100000006000000
+    00000600010002000000024E000000000200050000000300000126000300020000000257000000000400050000
+    00030000013E000500010000000100000000000600050000000100000156000000000000002400000001000000
+    0300000001000001150000001900000070000000010000000500000001000000D10000003200033DCD00000061
+    0006010300030000000100060000011A000500000001000001AC011B000500000001000001B401280003000000
+    01000200000201000400000001000001BC02020004000000010000027300000000000000480000000100000048
+    00000001FFD8FFE000104A46494600010200004800480000FFED000C41646F62655F434D0001FFEE000E41646F
+    626500648000000001FFDB0084000C08080809080C09090C110B0A0B11150F0C0C0F1518131315131318110C0C
+    0C0C0C0C110C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C010D0B0B0D0E0D100E0E1014
+    0E0E0E14140E0E0E0E14110C0C0C0C0C11110C0C0C0C0C0C110C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C
+    0C0C0C0C0C0C0C0CFFC00011080006000603012200021101031101FFDD00040001FFC4013F0000010501010101
+    010100000000000000030001020405060708090A0B010001050101010101010000000000000001000203040506
+    0708090A0B1000010401030204020507060805030C33010002110304211231054151611322718132061491A1B1
+    4223241552C16233347282D14307259253F0E1F163733516A2B283264493546445C2A3743617D255E265F2B384
+    C3D375E3F3462794A485B495C4D4E4F4A5B5C5D5E5F55666768696A6B6C6D6E6F637475767778797A7B7C7D7E7
+    F711000202010204040304050607070605350100021103213112044151617122130532819114A1B14223C152D1
+    F0332462E1728292435315637334F1250616A2B283072635C2D2449354A317644555367465E2F2B384C3D375E3
+    F34694A485B495C4D4E4F4A5B5C5D5E5F55666768696A6B6C6D6E6F62737475767778797A7B7C7FFDA000C0301
+    0002110311003F00D0BABE9FF69C7165B59C1DEE7D7B43DB78B8179F42F7B196D97596D365ECC5B2FA71BAAD74
+    51996D3FE129C84BC69255BD7C7FE57E4FF53FE6BFF4B7F2FE75D1F5D7F94FFC6BDFF7B8BFF4BFFED87FA39FFF
+    D900
+    """
+)
@@ -1,30 +1,30 @@
-"""APP1 segment hexadecimal baseline for test_add_rational in test_add module."""
-
-from baseline import Baseline
-
-ADD_RATIONAL_BASELINE = Baseline(
-    """
-    FFE103BD4578696600004D4D002A000000080007011200030000000100010000011A0005000000010000006201
-    1B0005000000010000006A012800030000000100020000013100020000001C0000007201320002000000140000
-    008E8769000400000001000000A4000000E4000AFC8000002710000AFC800000271041646F62652050686F746F
-    73686F70204353342057696E646F777300323031383A31323A32322032333A32323A34390000000004A0010003
-    0000000100010000A00200040000000100000006A00300040000000100000006920A000500000001000000DA00
-    000000000009A50000001400000006010300030000000100060000011A00050000000100000132011B00050000
-    00010000013A012800030000000100020000020100040000000100000142020200040000000100000273000000
-    0000000048000000010000004800000001FFD8FFE000104A46494600010200004800480000FFED000C41646F62
-    655F434D0001FFEE000E41646F626500648000000001FFDB0084000C08080809080C09090C110B0A0B11150F0C
-    0C0F1518131315131318110C0C0C0C0C0C110C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C
-    0C010D0B0B0D0E0D100E0E10140E0E0E14140E0E0E0E14110C0C0C0C0C11110C0C0C0C0C0C110C0C0C0C0C0C0C
-    0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0CFFC00011080006000603012200021101031101FFDD000400
-    01FFC4013F0000010501010101010100000000000000030001020405060708090A0B0100010501010101010100
-    000000000000010002030405060708090A0B1000010401030204020507060805030C3301000211030421123105
-    4151611322718132061491A1B14223241552C16233347282D14307259253F0E1F163733516A2B2832644935464
-    45C2A3743617D255E265F2B384C3D375E3F3462794A485B495C4D4E4F4A5B5C5D5E5F55666768696A6B6C6D6E6
-    F637475767778797A7B7C7D7E7F711000202010204040304050607070605350100021103213112044151617122
-    130532819114A1B14223C152D1F0332462E1728292435315637334F1250616A2B283072635C2D2449354A31764
-    4555367465E2F2B384C3D375E3F34694A485B495C4D4E4F4A5B5C5D5E5F55666768696A6B6C6D6E6F627374757
-    67778797A7B7C7FFDA000C03010002110311003F00D0BABE9FF69C7165B59C1DEE7D7B43DB78B8179F42F7B196
-    D97596D365ECC5B2FA71BAAD7451996D3FE129C84BC69255BD7C7FE57E4FF53FE6BFF4B7F2FE75D1F5D7F94FFC
-    6BDFF7B8BFF4BFFED87FA39FFFD9
-    """
-)
+"""APP1 segment hexadecimal baseline for test_add_rational in test_add module."""
+
+from baseline import Baseline
+
+ADD_RATIONAL_BASELINE = Baseline(
+    """
+    FFE103BA4578696600004D4D002A000000080007011200030000000100010000011A0005000000010000006201
+    1B0005000000010000006A012800030000000100020000013100020000001C0000007201320002000000140000
+    008E8769000400000001000000A2000000E0000AFC8000002710000AFC800000271041646F62652050686F746F
+    73686F70204353342057696E646F777300323031383A31323A32322032333A32323A3439000004920A00050000
+    0001000000D8A00100030000000100010000A00200040000000100000006A00300040000000100000006000000
+    00000009A5000000140006010300030000000100060000011A0005000000010000012E011B0005000000010000
+    013601280003000000010002000002010004000000010000013E02020004000000010000027300000000000000
+    48000000010000004800000001FFD8FFE000104A46494600010200004800480000FFED000C41646F62655F434D
+    0001FFEE000E41646F626500648000000001FFDB0084000C08080809080C09090C110B0A0B11150F0C0C0F1518
+    131315131318110C0C0C0C0C0C110C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C010D0B
+    0B0D0E0D100E0E10140E0E0E14140E0E0E0E14110C0C0C0C0C11110C0C0C0C0C0C110C0C0C0C0C0C0C0C0C0C0C
+    0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0C0CFFC00011080006000603012200021101031101FFDD00040001FFC401
+    3F0000010501010101010100000000000000030001020405060708090A0B010001050101010101010000000000
+    0000010002030405060708090A0B1000010401030204020507060805030C330100021103042112310541516113
+    22718132061491A1B14223241552C16233347282D14307259253F0E1F163733516A2B283264493546445C2A374
+    3617D255E265F2B384C3D375E3F3462794A485B495C4D4E4F4A5B5C5D5E5F55666768696A6B6C6D6E6F6374757
+    67778797A7B7C7D7E7F71100020201020404030405060707060535010002110321311204415161712213053281
+    9114A1B14223C152D1F0332462E1728292435315637334F1250616A2B283072635C2D2449354A3176445553674
+    65E2F2B384C3D375E3F34694A485B495C4D4E4F4A5B5C5D5E5F55666768696A6B6C6D6E6F62737475767778797
+    A7B7C7FFDA000C03010002110311003F00D0BABE9FF69C7165B59C1DEE7D7B43DB78B8179F42F7B196D97596D3
+    65ECC5B2FA71BAAD7451996D3FE129C84BC69255BD7C7FE57E4FF53FE6BFF4B7F2FE75D1F5D7F94FFC6BDFF7B8
+    BFF4BFFED87FA39FFFD900
+    """
+)
@@ -1,278 +1,297 @@
-"""APP1 segment hexadecimal baseline for test_add_short in test_add module."""
-
-from baseline import Baseline
-
-ADD_SHORT_BASELINE = Baseline(
-    """
-    FFE12C344578696600004D4D002A00000008000C010F0002000000060000009E0110000200000009000000A401
-    1200030000000100010000011A000500000001000000AD011B000500000001000000B501280003000000010002
-    00000131000200000007000000BD0132000200000014000000C402130003000000010001000087690004000000
-    01000008E488250004000000010000177EEA1C00070000080C000000D8000018C04170706C65006950686F6E65
-    2037000000004800000001000000480000000131322E312E3400323031393A30333A32362031393A33333A3437
-    001CEA000000080000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    0000000000000000000000000000000000000000000000000000000000000000000000000025829A0005000000
-    0100000AA6829D00050000000100000AAE88220003000000010002000088270003000000010014000090000007
-    0000000430323231900300020000001400000AB6900400020000001400000ACA91010007000000040102030092
-    01000A0000000100000ADE920200050000000100000AE69203000A0000000100000AEE9204000A000000010000
-    0AF6920700030000000100050000920900030000000100180000920A00050000000100000AFE92140003000000
-    0400000B06927C0007000003FA00001384929100020000000330300000929200020000000330300000A0000007
-    0000000430313030A001000300000001FFFF0000A00200040000000100000FC0A00300040000000100000BD0A2
-    1700030000000100020000A30100070000000101000000A40200030000000100000000A4030003000000010000
-    0000A405000300000001001C0000A40600030000000100000000A42000020000002100000B0EA4320005000000
-    0400000B2FA43300020000000600000B4FA43400020000002200000B55EA1C00070000080C00000B77EA1D0009
-    000000010000103C920800030000000100010000A4080003000000010000000000000000000000010000044000
-    00000900000005323031393A30333A32362031393A33333A343700323031393A30333A32362031393A33333A34
-    37000000FA6B000018D30000D62700007E450000CA7F0000156300000000000000010000018F0000006407DF05
-    E708A90532663938363763666336323337336235653030303030303030303030303030303000003FD5DF000FFF
-    B5003FD5DF000FFFB5000000090000000500000009000000054170706C65006950686F6E652037206261636B20
-    63616D65726120332E39396D6D20662F312E38001CEA0000000800000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    00000000000000000000004170706C6520694F530000014D4D001500010009000000010000000A000200070000
-    022E0000011000030007000000680000033E0004000900000001000000010005000900000001000000BB000600
-    0900000001000000BC0007000900000001000000010008000A00000003000003A6000C000A00000002000003BE
-    000D00090000000100000031000E00090000000100000004001000090000000100000001001400090000000100
-    000001001600020000001D000003CE001700090000000100000000001900090000000100000000001A00020000
-    0006000003EB001F00090000000100000000002500090000000100000000002600090000000100000000002700
-    0A00000001000003F10000000062706C69737430304F110200BD00C800D500E300F00000010F01200134011801
-    EB00E10003010101DB00A100CD00DB00EA00FA000A0118012801440158011001DA00C500C600AB0078007200E0
-    00EE00FD0010012601420157015C016A011401FD00BB0080006F00AD000801F300050115012501390151018501
-    9F0168010601F700B1009200DA000601CA000101150124012E0123010C011D018401A1014E0158017401AD013B
-    01E900D30006011B012B011501BF009E00F30034014A01BB01FB01F0012101CB00CE00B600D600F80014012A01
-    39011B0139013C019B013102F2038404C502A00170013E0182009100A300B600C700DA00F10013013E01A20124
-    037704320239011901E80047004F0059005E005D0061006600710073008000B800210194006700580050004700
-    52005100510055005B005E0075006A007E00AE005E0181006500610049002D0038003700380034003B00420051
-    0050005E007E00E2007A006700650062002F0042004B0051004B004C005B006B006F007500A100A30172005800
-    520053004100490049005700590057005E00640065005A008100C900880063005900570039003C00400042003D
-    003A003A00460051005A007A00DC0064005D004B00380034003A00410041003F0042004600510056004A004B00
-    62004B003A002D002700350037003B003700390042004800460041003B00410038002E00290024002200000800
-    0000000000020100000000000000010000000000000000000000000000020C62706C6973743030D40102030405
-    06070855666C6167735576616C75655974696D657363616C655565706F636810011300031EDE27D7566E123B9A
-    CA0010000811171D272D2F383D000000000000010100000000000000090000000000000000000000000000003F
-    FFFF9539000069A7FFFFED3300045694000006D800021775000000DD00000100000000C70000010041546B512B
-    56674D6476527832635A47382B713971386C77544E432F00713832357300000000000000000100001000000001
-    000000040202000000010002000000024E00000000020005000000030000184400030002000000025700000000
-    040005000000030000185C00050001000000010000000000060005000000010000187400070005000000030000
-    187C000C0002000000024B000000000D0005000000010000189400100002000000024D00000000110005000000
-    010000189C00170002000000024D0000000018000500000001000018A4001D00020000000B000018AC001F0005
-    00000001000018B7000000000000001B0000000100000031000000010000037500000064000000520000000100
-    0000310000000100000D3D00000064000100C30000FB89000000170000000100000021000000010000002F0000
-    00010000000000000001000AF09E00000A75000AF09E00000A75323031393A30333A3236000000000500000001
-    000006010300030000000100060000011A0005000000010000190E011B00050000000100001916012800030000
-    00010002000002010004000000010000191E02020004000000010000130D000000000000004800000001000000
-    4800000001FFD8FFE000104A46494600010100000100010000FFDB004300050304040403050404040505050607
-    0C08070707070F0B0B090C110F1212110F111113161C1713141A1511111821181A1D1D1F1F1F13172224221E24
-    1C1E1F1EFFDB0043010505050706070E08080E1E1411141E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E
-    1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1EFFC0001108007800A00301220002110103
-    1101FFC4001C0000010501010100000000000000000000040002030506070801FFC4003E100002010302030505
-    05050803010000000102030004110512062131134151617114228191A1073252B1C115232442D1253443536273
-    C2E133357283FFC4001A010003010101010000000000000000000002030401000506FFC4003011000201030104
-    09040203000000000000000102031121040512319113142232414252618151A1B1F0C1E182D1F1FFDA000C0301
-    0002110311003F00A358B3DD53C76F9EEA263868948BCAABB92581120C7754C90F2E946470D109079566F23520
-    0580F8548B6FE22AC92DEA416C0F7563985BACAF4B42C474EB4F16839E48DC3BAAC3B020731914E108C83B7978
-    D03930D58AC36A7A8156DA22DC24C4C52246DB48E670314961CFBBB4E4D1496EC8417808EECD2AA3525663295E
-    32BA1B73650C5621D2626E777EF10FDD3E942AA5EE9B224B6D344B25D295298CB01DC7CAAC64565DB220DA40C1
-    3E22A9B55748206ED646257EEAA2E49CD27771DAC8FE93B5D9C1F145F1667F6D60F8C673D3CB155BA969B34682
-    313C726EE6EC1C103C2A2D5408562315D240D38C077383E7F1AAD892EAD2F7104B1DC4AA4300E432FC7C6BAEA2
-    AE91B694DD9BB97E746BC9F488608E589083927773C7A55CE8D6A6DED8C0F7210A0FB88B92E7CCD0D6DAD5D5D3
-    19AF62B68E08A32EE54E37608E42A0B3D58493BC9346C173951C9474F0FD4D72ED714736E1749855ED9C61CBC9
-    9DCE72403CA9C238D2018271DC5AAA759E23D22DEC645B89E58C9E65D70C079023BEB0D79C6D692878608EE8E4
-    7B923B02E0F90E805509D895A723A0EB6F6F0C4893BAA0906EC3305CAFFDD67CDEDB88C95B7B445C9197997963
-    E35CBF509EEEEE724DC492F3E5B9B352E9DA05E5ECCB24C42445BDE6638A0E96D9931BD0DFBA8EBD1414547079
-    513141E545470795774827700E382898E2F2A32383CAA75B71E15DD2A3B700D21A223801EEA252D8F70A9A381C
-    74427D0503A882506411DB2B7238A7B58FBBB8303E58A312223EF2B2FA8A9E25E783F3353CEBDB832AA746F868
-    023B710832611D09C21603AFA7853AD5BB577596DD95CFDD0C460FD6AE8C3BA1D855714C9615EC937264A9EF51
-    D2A27A96D64BD69D276457DFB4F300F3DB8C2AED1B10F2F2AC5EA526FBAEC56E9A2916500F69855C1E7D0024D6
-    A35DBF8211BD8AAB63902C718AC66A7ACDBADC767D9ACEE0F20137601EBCF1451AAED6473A6AFBCEED82EA3A04
-    D73A86F69A02BB1992101B693D0E0E3E35450437168D74BD82E778DAD90001F1F315A89AFAFEE0896D2DD82E30
-    3DC008ACD6B126A5B1A370A368C80225E5F13450ACEF66C29D156C44A5D575D962DEE2E55D9BDC3BA43EBDDDD5
-    96D4753B9B995F12B10FFEB279558DD5ADDDD4BB442D2313CB0D9FCA8CD1B87EEE7B85865B578413CDBB227155
-    2AD18AE248E84A4F819E8A1BEBD1B44ACDB3B89E9E95A0E1BE01E20D626DD159BB46065DD9C2AA8F33FA574DD0
-    B8634AE19B66D46FAF23BF99BEE44210C63F3C66AD2EF89EF7B18E1D377C6A57202E9E1467CCB3003E54996AA5
-    2EE736323A6847BD9286D38174ED16D4CB3E9E6EEE800000DB914FE64D57EAF7BC3B6D6E45F35F76839F630C20
-    0F21EF62AD24D4B5AD6AF1AC23D4A7314836CA42AC4231DE4903BF9D0D2E9FC3FA64AEAD78ED7231FC4DC46762
-    63F0F8FC6854DDB2EECD70CF0B236714001E944C70F4E54A0962233B851713447BC54DD6C0EA8C62442A658B02
-    A74ECFC454A0467C3E759D71237AA304385193C8557DE6BDA559E44F7D021F02DCEAE2E6D21B88CA3E707C2B2F
-    AD702D8DE92D1C8F131EA719AE8EB69B7DA61F529F8035E71E6850839BA593CB61AAB97ED3B4A8DB1186201E5B
-    57154FAEFD9FC56397115E5CA8E65A35A0F46D03484900BBD1EFE75FFE4AD39CE838DD6428D1AC9D9BB1B1D33E
-    D534B621674914789AD25A71EF0CDC273BF894F8329FE9596D3EC781A3F75F43D847F9B3827E59AB58ADB85E6C
-    25A6896EF9EB83D3E22A0AB5697A5FD8BE9D1A9EA45CDC71070D5C42713C126E18F756A95AE6C67BAD96D6718C
-    720DB541C51169A1F0E091A459ED60C7228C7DE5F9D5AE9DC3FC19752FBB31B86CE31DB1EBE5514F554E1C13E4
-    590D3CDF1657BAB411B76315BC3CB0CC645A162D1787A7767D5AE8480804AA0C9CFA8EEADDAF05E8817B4B6D33
-    7903EE98CBE4FC6A7B5E1F8A3B5F72D670EDFE1456AABB7D49150CB6943C2E3A30A76CB31DA6C5C01A4B99ED61
-    859D7987918B63E07A54D73AB6906491EDEFACAD51D4EE5E4A48C7507A53755E1B90CB28304F8279C61B19F2F7
-    456335EE1E956EC7F64DCA6FC6D8C8383E9CB35650AF46A3CBC83568CE2BB2C1E48F866EF5293D8E0BCD467249
-    50ABD3C3981444963AD5CCAD2DBDB2E98ACBB58B4AAF851E38E7F01501D1F8C62C4763A5CB6F17F2AC6800C799
-    EBF33513F05F1BDD1FDECC6107B9AE028E7E40D7A2B554D79D73B9E6CF4D27E57F82BB5E7D574D0E926B1198C0
-    FBCCA8A1BC82FDE23D6B097D7D71B984772E54927030057457FB31D40E5EF756B18FC4B4A4FE941B70169714A5
-    66E27D35478A9C9F953E9EB68AF1BFC099E96A3F0B7C8ED26F2FEDF0049291E1BF15A4B6D5E72A374AE9F2AE02
-    9ABEA0B8C6B6727A6650054E9ADDFEF0835E5DC4FF009E2A99E81CB3744F0DA308E2CCF44DBEB4131BE477F1E4
-    28F8B5CB46C02C41F35AF38C7AB6B6C711EAF249CFAA4A3F5A2A3D435F7538D56E15B38C6F53FA54D2D94DF987
-    ADAD4FD27A2C6A5698DC6451E79A905FDA9FF171E8F5E715BFE22CFF00EC2EB1E24AE2BE49A96BCAF81A95C7C7
-    6E7E58A53D8F27E71AB6C525E43D1D2DD44E06DBD9A3C7E061FA8AF893DB60892EA49477872BCFE95E72FDA7C4
-    40129A9B903A83B7957D6D6F5E49001A8CA73DFB472FA52A5B1A6F1BE3A3B668FA19E86963D065CEEB6B6573D5
-    822EEFCA9B1E9BA206DF8931D7024C0FA0AE06759E20550CDA8CC57D14548BC47AF05531EA6EC58F25C2934996
-    C8AC962A0E8ED6D3B7983FB1E898EDF406033656ED8EF23AD5BE973E956CC3D9E0B78F9E7DD515E619B8C75EB7
-    63BB5320E700344A0FC7344DAF1EF1426DDB7CA41E9FB94C1A86B6C4D435DFBFCB2C86D5D1CB0E2D72FF0067B3
-    B87AFE39D400D904E07856A6348DADF25B9F81AF19687F687C57132BA5EAE319DDD8AEDAE8561F69DC4AFC3CF7
-    4D7B0960D8DDD9A6318F5AF36969351A0A9272829A78E3C3EC79F5F67C7553DEA32B2F7FD6762E26BC82280C6C
-    EA8C4925B6F85739D5F57C48E06B1229032152019F404F7D734D57ED235CBE0DBAFAD49FC6A8A71EA2B1DACF1B
-    F174273ED564D19FBADD9A106B749B2753277935FBF07A3A7969F474AD36DBF64766596DEEE2CBEB3AAB03CFDE
-    7ECBF2155B7CB63090866D42E7777B492483E38615C3E5E3AE2E762C975647FF00C507EB433F1EF1512435D5A6
-    7FD95FEB5ECC3646A13EF7EF2133DA9A4F4BE5FD9D9E7B1D299A402180E064936EE7779737E755171A4E96F338
-    D86150010CB6836B790C926B934DF681C5601FDFDA9F4854FEB42B7DA1715FE2B63E900FEB55C3676A579BF791
-    34B6968DF95F2FEC82481A48B6C7A2EA5B8F52EEA3F4A162D36EF7606957A39F3FE200CFCCD524BAF6AD313D9C
-    7B14F550391A72DDEBB2A922D8173CB2179E3C315F4D93E4B068E3D2A77194D26F3D56F403F9D3A4D22F5D4C47
-    4ED432075F6E538FAD54DB6A3C4621ECBB26407967B3C11E59CD36EC6B0706EAFA38F90C090107E3CEB326E0B3
-    FD93A92280B0DEA267041BA8B97D2A71A2CAF26D28D1B81DF7C83E3F76A9923D49144B06A3691EDE5BA251BB9F
-    AE7341B36A43225D61C28EE2A4FF00C6B1DCD5634F06932059FB5906F03F74C3510406C8E6DEEF4C7877E2A29B
-    46BC9F282EED5CF7FF00127F303956652E238DC86D4EEDB03188E21FF545C4DA73819BFD5154F5C46C7E8050B4
-    C34D1A6D3F4C6B6758DAE74F52BFCBED2CE73E60D193E9763382A6E6D3B4EA444086CD66AC869104A989B59B82
-    DCBDC8D803E5CF1470B38260556CB588A1E470F71B3E80D2649FD47C64BE81A96B1C4FCB5B8A3452708223B8FC
-    CF5AB8D2602A37AEAF0E17AEE821C8F5C9AC936851B92D1E98CE739569A62377AE47E468CB7E188676513E9CB0
-    13FCDDA647CB6E6915629ACBFC14519B4F0BF2742B137CE02C5AEBA96EAB1C56C3E5DF5B94D2EF23E0CDD2F115
-    EE5A4CB446384AB633838504F95715B6E11D33B5D925F5A093BA3895998FC320D6EAC7ECC6EE4D2619AD2DEEAF
-    219104AACBB6255F107B4753CB1D40C1AF1B534A9DD76ADFE27B742B54B777EE51EB71C103113B4E2672485010
-    67E0173595BFBA489FB0B7D3E67527DFDD3AAAB0F4C75ABCBDE19B582F1D2E26B7450720060EDF46C50177A1DA
-    46E004B9738CE762A83F5AB683824B3724D4748DBC580469F612C7BE1499D88CF6467C9F860F3AAB9E558B3B34
-    FB87F5988FF955BC9A4DB95C8B7963DBD5A499540F8E2895D3B4FDB895212E067776A73F4156C676F720941BF6
-    31777780310D6371177FF7963419BC1D3B2C83D7339CD6E2FAC34F5CB848401D581DDF99AA598E9C1D92256958
-    7744AA4FE54F84D3279D369E59422D6591B96AA71DDEF15CD1B6BA5DC390BFB6590FE1F68E7F9D5926A0CB2113
-    6956EE7B829CB9FA54904F72EC4C7C361477BE1462A9BB22B055970E4A630EFA9DDCCB8E6236CFD7346C5A2E95
-    12EE9AE65590F7484E48F520D558B8B9490767A63A38E409B876FA0E5538FDAF3F398EA48BF8215118F99E7436
-    97D4D562EE2D234B78F72C0B2AF52CD1B30FA8C50A6DB4E8E53ECDA55C48D9EAB0ED5FAD476F71D8A8FECAD527
-    61DF2DDE47D4D4EDAE4C83074CB88FFD22652714BC8C561B2594B2027F67A47FEE38C8F90E552DB58CC07BDECC
-    30790009FAD0536BEE4E0E9B7C796725971421E24BE4C343A64CE33C8175E5F2AC6A4C38EE2E26B22B191D54B3
-    C4D83CBA8DB44C760EE72D7080E7391CEB1D1F156A4E1C2E8372EE390264518FA54916BBC42D93FB2100EE6330
-    C8F0A43854288CE99A4934A0E77B5EB4873DEC47C3AD44FA7C05CF6D76EE17EEEE23231EB5452EA5C45236D169
-    650F2F78B4A5BE58A11E2D7EEDB64DA846800E5D9458340E13F190D8CE0B82B9B58F41D26670EDAC7B13050EB2
-    8ECD46075C9FD6B4B06ABC1BC31A5486F38BF56E20B8560CBA7DBB2189DF1C86FE7D3974C79572ED3B86A3BA3B
-    6FEF6E64527ABC842E7C2BA170F70EFD9B69B7ED717FAEA285446863B78D9DB7E39EE0A0E57A73F2E75E66A945
-    627272F64BF9B1E9D0949C77A3151F76FF0082A7581ABEA88DAAADC7ECE59C064B7052464523912C4723F91AC5
-    BD9EA2772CDADDFB927764BD6EF5BBBD1AE6E49D3F559CA16CFEF76951DDC9701BA557DC699A4C7121F6979377
-    7094E1BE14FD2CF762AF1B7B585EAE0A52C3BFC98C96CA175FE32E2F661DFB9CE3E4288874FD38A6D4D3E4940E
-    84467AFAD5CDFC5636F32F631F3C75C13F53504D7F1C684995171D371ABD4DB583CE7149E41E3B4B4881274B61
-    9FC51FFDD47318973D9C2D1F9000532F35DB4DB80FB8FF00A57FAD52DE6AF6EFD04BF4E74718C9F105CE28724B
-    AC2F313DAA0F116C2884B9BE723B4BD85CF8760173F5A120323C7DA265801EF0DB8C7864D4B0BA91B6548813D1
-    BA81E479D556200EF68B80DFDF258D4FF2AA818F4C53E252CDEFDFCA467001FD683C8ED8C2A1F246490797A54E
-    9284B43BB08CA39151D3D3C6BAC6DC346D41B7B38C48B9E78383F1A85E466042ABAF7EE0722847BB3B0044562D
-    8DCAA7BE99DB658A8DF9CF3507245758EB86E1DC969242F8E7CFA0F85397675255BD3950F1B3B280E08F3661F9
-    0FEB45C7ECF90663DA11F88F2F90E558CD4D12452C61493D7C19813F0A2A1699C7B91BB8F0119F9FA54705EDBC
-    3FF8D23079E085028793566507748416F0A4B43934835C4EABBDA28D477EE7FE99A02E6F6E579234699CFDD5C9
-    F99A1A6D5F29B7693E6D404B7D03B65F2FE41B14165E2862DE7C18549732ECDED2BB11D72C5ABEC735FDD1296F
-    14933E3A46A491E98A56DAC59DB81B2CEDF70FE674DD8F9D4B71C61AA7646382EA48A3231B63C463E4B8A4CE53
-    E118F32BA74A1C673E4BFE10CBC3FADAC9DA4962F0AFE29DBB3F8F320D29225B68F13EA32123F9616217E7DF55
-    379ABDE4ED992E2573E2589FAD00F3C8C49393EB4718D47DE6BE019BA51EEA7F25BCFA963DD491F18EACD9A067
-    BC2C7392C7D6AB9DA4272722A324F79F955118D89253B84B49BCE4E56A272809C31CD479FC44F9525505B19147
-    61468D52E92D83C1112A0ED240E79C7E54F12A5BC00380F291831A9F781F1F2A54A98286C2DD9C21A464424EED
-    CF91CFB863AD34CB24982E48DA30A4A803D76F3E7EB4A9571826656C6F264F53CBE5D29E2601797203C2952AE3
-    864D7F1C6B8DD93E5424BA93B0C29A54AB1849101BD93FCC3E82A3F6A7F126952A00D0D3725B9531A639EBCE95
-    2A1B05BCC4253DE7269C27503271F1A54A86C31498D7B8EEC8F9D45DB3B7DD0B8F1A54A89205C98D24B0C39C8E
-    EA6E3CCFA52A55A00FCE7957D0A7AF2A54AB4E3FFFD900
-    """
-)
-
-
-ADD_SHORT_LE_BASELINE = Baseline(
-    """
-    FFE1020245786966000049492A000800000009000F0102000D0000007A000000100102000E000000880000001A
-    01050001000000960000001B010500010000009E00000028010300010000000200000013020300010000000200
-    00001402050006000000A60000006987040001000000D600000025880400010000008801000000000000455849
-    46205061636B61676500004C6974746C6520456E6469616E00C800000001000000C80000000100000000000000
-    01000000FF000000010000008000000001000000FF000000010000008000000001000000FF000000010000000C
-    0000900700040000003032323003900200140000006C01000001910700040000000102030000A0070004000000
-    3031303001A00300010000000100000002A0030001000000D803000003A00300010000006505000009A4030001
-    000000010000000AA40300010000000100000008A4030001000000010000000892030001000000180000000392
-    0A00010000008001000000000000323031393A30323A30382032313A34343A33350031D4000010270000050000
-    00010004000000020300000100020002000000530000000200050003000000CA01000003000200020000005700
-    00000400050003000000E2010000000000004F000000010000002400000001000000B96B0100A30600002F0000
-    000100000019000000010000001BE50300E91C0000
-    """
-)
+"""APP1 segment hexadecimal baseline for test_add_short in test_add module."""
+
+from baseline import Baseline
+
+ADD_SHORT_BASELINE = Baseline(
+    """
+    FFE12F824578696600004D4D002A00001766000C010F0002000000060000009E0110000200000009000000A401
+    1200030000000100010000011A000500000001000000AD011B000500000001000000B501280003000000010002
+    00000131000200000007000000BD0132000200000014000000C402130003000000010001000087690004000000
+    01000008E4882500040000000100001766EA1C00070000080C000000D8000018A84170706C65006950686F6E65
+    2037000000004800000001000000480000000131322E312E3400323031393A30333A32362031393A33333A3437
+    001CEA000000080000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    0000000000000000000000000000000000000000000000000000000000000000000000000023829A0005000000
+    0100000A8E829D00050000000100000A9688220003000000010002000088270003000000010014000090000007
+    0000000430323231900300020000001400000A9E900400020000001400000AB291010007000000040102030092
+    01000A0000000100000AC6920200050000000100000ACE9203000A0000000100000AD69204000A000000010000
+    0ADE920700030000000100050000920900030000000100180000920A00050000000100000AE692140003000000
+    0400000AEE927C0007000003FA0000136C929100020000000330300000929200020000000330300000A0000007
+    0000000430313030A001000300000001FFFF0000A00200040000000100000FC0A00300040000000100000BD0A2
+    1700030000000100020000A30100070000000101000000A40200030000000100000000A4030003000000010000
+    0000A405000300000001001C0000A40600030000000100000000A42000020000002100000AF6A4320005000000
+    0400000B17A43300020000000600000B37A43400020000002200000B3DEA1C00070000080C00000B5FEA1D0009
+    000000010000103C0000000000000001000004400000000900000005323031393A30333A32362031393A33333A
+    343700323031393A30333A32362031393A33333A3437000000FA6B000018D30000D62700007E450000CA7F0000
+    156300000000000000010000018F0000006407DF05E708A9053266393836376366633632333733623565303030
+    3030303030303030303030303000003FD5DF000FFFB5003FD5DF000FFFB5000000090000000500000009000000
+    054170706C65006950686F6E652037206261636B2063616D65726120332E39396D6D20662F312E38001CEA0000
+    000800000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    00000000000000000000000000000000000000000000000000000000000000004170706C6520694F530000014D
+    4D001500010009000000010000000A000200070000022E0000011000030007000000680000033E000400090000
+    0001000000010005000900000001000000BB0006000900000001000000BC000700090000000100000001000800
+    0A00000003000003A6000C000A00000002000003BE000D00090000000100000031000E00090000000100000004
+    001000090000000100000001001400090000000100000001001600020000001D000003CE001700090000000100
+    000000001900090000000100000000001A000200000006000003EB001F00090000000100000000002500090000
+    0001000000000026000900000001000000000027000A00000001000003F10000000062706C69737430304F1102
+    00BD00C800D500E300F00000010F01200134011801EB00E10003010101DB00A100CD00DB00EA00FA000A011801
+    2801440158011001DA00C500C600AB0078007200E000EE00FD0010012601420157015C016A011401FD00BB0080
+    006F00AD000801F3000501150125013901510185019F0168010601F700B1009200DA000601CA00010115012401
+    2E0123010C011D018401A1014E0158017401AD013B01E900D30006011B012B011501BF009E00F30034014A01BB
+    01FB01F0012101CB00CE00B600D600F80014012A0139011B0139013C019B013102F2038404C502A00170013E01
+    82009100A300B600C700DA00F10013013E01A20124037704320239011901E80047004F0059005E005D00610066
+    00710073008000B80021019400670058005000470052005100510055005B005E0075006A007E00AE005E018100
+    6500610049002D0038003700380034003B004200510050005E007E00E2007A006700650062002F0042004B0051
+    004B004C005B006B006F007500A100A30172005800520053004100490049005700590057005E00640065005A00
+    8100C900880063005900570039003C00400042003D003A003A00460051005A007A00DC0064005D004B00380034
+    003A00410041003F0042004600510056004A004B0062004B003A002D002700350037003B003700390042004800
+    460041003B00410038002E00290024002200000800000000000002010000000000000001000000000000000000
+    0000000000020C62706C6973743030D4010203040506070855666C6167735576616C75655974696D657363616C
+    655565706F636810011300031EDE27D7566E123B9ACA0010000811171D272D2F383D0000000000000101000000
+    00000000090000000000000000000000000000003FFFFF9539000069A7FFFFED3300045694000006D800021775
+    000000DD00000100000000C70000010041546B512B56674D6476527832635A47382B713971386C77544E432F00
+    713832357300000000000000000100000C010F000200000006000017FC01100002000000090000180201120003
+    0000000100010000011A0005000000010000180C011B0005000000010000181401280003000000010002000001
+    310002000000070000181C01320002000000140000182402130003000000010001000087690004000000010000
+    1838882500040000000100001ACCEA1C00070000080C000000D800001C0E4170706C65006950686F6E65203700
+    000000004800000001000000480000000131322E312E340000323031393A30333A32362031393A33333A343700
+    0025829A000500000001000019FA829D00050000000100001A0288220003000000010002000088270003000000
+    0100140000900000070000000430323231900300020000001400001A0A900400020000001400001A1E91010007
+    00000004010203009201000A0000000100001A32920200050000000100001A3A9203000A0000000100001A4292
+    04000A0000000100001A4A92070003000000010005000092080003000000010001000092090003000000010018
+    0000920A00050000000100001A52921400030000000400001A5A927C0007000003FA0000136C92910002000000
+    0330300000929200020000000330300000A00000070000000430313030A001000300000001FFFF0000A0020004
+    0000000100000FC0A00300040000000100000BD0A21700030000000100020000A30100070000000101000000A4
+    0200030000000100000000A40300030000000100000000A405000300000001001C0000A4060003000000010000
+    0000A40800030000000100000000A42000020000002100001A62A43200050000000400001A84A4330002000000
+    0600001AA4A43400020000002200001AAAEA1C00070000080C00000B5FEA1D0009000000010000103C00000000
+    00000001000004400000000900000005323031393A30333A32362031393A33333A343700323031393A30333A32
+    362031393A33333A3437000000FA6B000018D30000D62700007E450000CA7F0000156300000000000000010000
+    018F0000006407DF05E708A9053266393836376366633632333733623565303030303030303030303030303030
+    300000003FD5DF000FFFB5003FD5DF000FFFB5000000090000000500000009000000054170706C65006950686F
+    6E652037206261636B2063616D65726120332E39396D6D20662F312E3800001000000001000000040202000000
+    010002000000024E000000000200050000000300001B9200030002000000025700000000040005000000030000
+    1BAA000500010000000100000000000600050000000100001BC2000700050000000300001BCA000C0002000000
+    024B000000000D00050000000100001BE200100002000000024D000000001100050000000100001BEA00170002
+    000000024D000000001800050000000100001BF2001D00020000000B00001BFA001F00050000000100001C0600
+    0000000000001B0000000100000031000000010000037500000064000000520000000100000031000000010000
+    0D3D00000064000100C30000FB89000000170000000100000021000000010000002F0000000100000000000000
+    01000AF09E00000A75000AF09E00000A75323031393A30333A3236000000000005000000010006010300030000
+    000100060000011A00050000000100001C5C011B00050000000100001C64012800030000000100020000020100
+    040000000100001C6C02020004000000010000130D0000000000000048000000010000004800000001FFD8FFE0
+    00104A46494600010100000100010000FFDB0043000503040404030504040405050506070C08070707070F0B0B
+    090C110F1212110F111113161C1713141A1511111821181A1D1D1F1F1F13172224221E241C1E1F1EFFDB004301
+    0505050706070E08080E1E1411141E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E
+    1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1E1EFFC0001108007800A003012200021101031101FFC4001C000001
+    0501010100000000000000000000040002030506070801FFC4003E100002010302030505050508030100000001
+    02030004110512062131134151617114228191A1073252B1C115232442D1253443536273C2E133357283FFC400
+    1A010003010101010000000000000000000002030401000506FFC4003011000201030104090402030000000000
+    00000102031121040512319113142232414252618151A1B1F0C1E182D1F1FFDA000C03010002110311003F00A3
+    58B3DD53C76F9EEA263868948BCAABB92581120C7754C90F2E946470D109079566F235200580F8548B6FE22AC9
+    2DEA416C0F7563985BACAF4B42C474EB4F16839E48DC3BAAC3B020731914E108C83B7978D03930D58AC36A7A81
+    56DA22DC24C4C52246DB48E670314961CFBBB4E4D1496EC8417808EECD2AA3525663295E32BA1B73650C5621D2
+    626E777EF10FDD3E942AA5EE9B224B6D344B25D295298CB01DC7CAAC64565DB220DA40C13E22A9B55748206ED6
+    46257EEAA2E49CD27771DAC8FE93B5D9C1F145F1667F6D60F8C673D3CB155BA969B34682313C726EE6EC1C103C
+    2A2D5408562315D240D38C077383E7F1AAD892EAD2F7104B1DC4AA4300E432FC7C6BAEA2AE91B694DD9BB97E74
+    6BC9F488608E589083927773C7A55CE8D6A6DED8C0F7210A0FB88B92E7CCD0D6DAD5D5D319AF62B68E08A32EE5
+    4E37608E42A0B3D58493BC9346C173951C9474F0FD4D72ED714736E1749855ED9C61CBC99DCE72403CA9C238D2
+    018271DC5AAA759E23D22DEC645B89E58C9E65D70C079023BEB0D79C6D692878608EE8E47B923B02E0F90E8055
+    09D895A723A0EB6F6F0C4893BAA0906EC3305CAFFDD67CDEDB88C95B7B445C9197997963E35CBF509EEEEE724D
+    C492F3E5B9B352E9DA05E5ECCB24C42445BDE6638A0E96D9931BD0DFBA8EBD1414547079513141E54547079577
+    4827700E382898E2F2A32383CAA75B71E15DD2A3B700D21A223801EEA252D8F70A9A381C74427D0503A8825064
+    11DB2B7238A7B58FBBB8303E58A312223EF2B2FA8A9E25E783F3353CEBDB832AA746F868023B710832611D09C2
+    1603AFA7853AD5BB577596DD95CFDD0C460FD6AE8C3BA1D855714C9615EC937264A9EF51D2A27A96D64BD69D27
+    6457DFB4F300F3DB8C2AED1B10F2F2AC5EA526FBAEC56E9A2916500F69855C1E7D0024D6A35DBF8211BD8AAB63
+    902C718AC66A7ACDBADC767D9ACEE0F20137601EBCF1451AAED6473A6AFBCEED82EA3A04D73A86F69A02BB1992
+    101B693D0E0E3E35450437168D74BD82E778DAD90001F1F315A89AFAFEE0896D2DD82E303DC008ACD6B126A5B1
+    A370A368C80225E5F13450ACEF66C29D156C44A5D575D962DEE2E55D9BDC3BA43EBDDDD596D4753B9B995F12B1
+    0FFEB279558DD5ADDDD4BB442D2313CB0D9FCA8CD1B87EEE7B85865B578413CDBB2271552AD18AE248E84A4F81
+    9E8A1BEBD1B44ACDB3B89E9E95A0E1BE01E20D626DD159BB46065DD9C2AA8F33FA574DD0B8634AE19B66D46FAF
+    23BF99BEE44210C63F3C66AD2EF89EF7B18E1D377C6A57202E9E1467CCB3003E54996AA52EE736323A6847BD92
+    86D38174ED16D4CB3E9E6EEE800000DB914FE64D57EAF7BC3B6D6E45F35F76839F630C200F21EF62AD24D4B5AD
+    6AF1AC23D4A7314836CA42AC4231DE4903BF9D0D2E9FC3FA64AEAD78ED7231FC4DC4676263F0F8FC6854DDB2EE
+    CD70CF0B236714001E944C70F4E54A0962233B851713447BC54DD6C0EA8C62442A658B02A74ECFC454A0467C3E
+    759D71237AA304385193C8557DE6BDA559E44F7D021F02DCEAE2E6D21B88CA3E707C2B2FAD702D8DE92D1C8F13
+    1EA719AE8EB69B7DA61F529F8035E71E6850839BA593CB61AAB97ED3B4A8DB1186201E5B57154FAEFD9FC56397
+    115E5CA8E65A35A0F46D03484900BBD1EFE75FFE4AD39CE838DD6428D1AC9D9BB1B1D33ED534B621674914789A
+    D25A71EF0CDC273BF894F8329FE9596D3EC781A3F75F43D847F9B3827E59AB58ADB85E6C25A6896EF9EB83D3E2
+    2A0AB5697A5FD8BE9D1A9EA45CDC71070D5C42713C126E18F756A95AE6C67BAD96D6718C720DB541C51169A1F0
+    E091A459ED60C7228C7DE5F9D5AE9DC3FC19752FBB31B86CE31DB1EBE5514F554E1C13E4590D3CDF1657BAB411
+    B76315BC3CB0CC645A162D1787A7767D5AE8480804AA0C9CFA8EEADDAF05E8817B4B6D337903EE98CBE4FC6A7B
+    5E1F8A3B5F72D670EDFE1456AABB7D49150CB6943C2E3A30A76CB31DA6C5C01A4B99ED61859D7987918B63E07A
+    54D73AB6906491EDEFACAD51D4EE5E4A48C7507A53755E1B90CB28304F8279C61B19F2F7456335EE1E956EC7F6
+    4DCA6FC6D8C8383E9CB35650AF46A3CBC83568CE2BB2C1E48F866EF5293D8E0BCD46724950ABD3C3981444963A
+    D5CCAD2DBDB2E98ACBB58B4AAF851E38E7F01501D1F8C62C4763A5CB6F17F2AC6800C799EBF33513F05F1BDD1F
+    DECC6107B9AE028E7E40D7A2B554D79D73B9E6CF4D27E57F82BB5E7D574D0E926B1198C0FBCCA8A1BC82FDE23D
+    6B097D7D71B984772E54927030057457FB31D40E5EF756B18FC4B4A4FE941B70169714A566E27D35478A9C9F95
+    3E9EB68AF1BFC099E96A3F0B7C8ED26F2FEDF0049291E1BF15A4B6D5E72A374AE9F2AE029ABEA0B8C6B6727A66
+    50054E9ADDFEF0835E5DC4FF009E2A99E81CB3744F0DA308E2CCF44DBEB4131BE477F1E428F8B5CB46C02C41F3
+    5AF38C7AB6B6C711EAF249CFAA4A3F5A2A3D435F7538D56E15B38C6F53FA54D2D94DF987ADAD4FD27A2C6A5698
+    DC6451E79A905FDA9FF171E8F5E715BFE22CFF00EC2EB1E24AE2BE49A96BCAF81A95C7C76E7E58A53D8F27E71A
+    B6C525E43D1D2DD44E06DBD9A3C7E061FA8AF893DB60892EA49477872BCFE95E72FDA7C440129A9B903A83B795
+    7D6D6F5E49001A8CA73DFB472FA52A5B1A6F1BE3A3B668FA19E86963D065CEEB6B6573D5822EEFCA9B1E9BA206
+    DF8931D7024C0FA0AE06759E20550CDA8CC57D14548BC47AF05531EA6EC58F25C2934996C8AC962A0E8ED6D3B7
+    983FB1E898EDF406033656ED8EF23AD5BE973E956CC3D9E0B78F9E7DD515E619B8C75EB763BB5320E700344A0F
+    C7344DAF1EF1426DDB7CA41E9FB94C1A86B6C4D435DFBFCB2C86D5D1CB0E2D72FF0067B3B87AFE39D400D904E0
+    7856A6348DADF25B9F81AF19687F687C57132BA5EAE319DDD8AEDAE8561F69DC4AFC3CF74D7B0960D8DDD9A631
+    8F5AF36969351A0A9272829A78E3C3EC79F5F67C7553DEA32B2F7FD6762E26BC82280C6CEA8C4925B6F85739D5
+    F57C48E06B1229032152019F404F7D734D57ED235CBE0DBAFAD49FC6A8A71EA2B1DACF1BF174273ED564D19FBA
+    DD9A106B749B2753277935FBF07A3A7969F474AD36DBF64766596DEEE2CBEB3AAB03CFDE7ECBF2155B7CB63090
+    866D42E7777B492483E38615C3E5E3AE2E762C975647FF00C507EB433F1EF1512435D5A67FD95FEB5ECC3646A1
+    3EF7EF2133DA9A4F4BE5FD9D9E7B1D299A402180E064936EE7779737E755171A4E96F338D86150010CB6836B79
+    0C926B934DF681C5601FDFDA9F4854FEB42B7DA1715FE2B63E900FEB55C3676A579BF79134B6968DF95F2FEC82
+    481A48B6C7A2EA5B8F52EEA3F4A162D36EF7606957A39F3FE200CFCCD524BAF6AD313D9C7B14F550391A72DDEB
+    B2A922D8173CB2179E3C315F4D93E4B068E3D2A77194D26F3D56F403F9D3A4D22F5D4C474ED432075F6E538FAD
+    54DB6A3C4621ECBB26407967B3C11E59CD36EC6B0706EAFA38F90C090107E3CEB326E0B3FD93A92280B0DEA267
+    041BA8B97D2A71A2CAF26D28D1B81DF7C83E3F76A9923D49144B06A3691EDE5BA251BB9FAE7341B36A43225D61
+    C28EE2A4FF00C6B1DCD5634F06932059FB5906F03F74C3510406C8E6DEEF4C7877E2A29B46BC9F282EED5CF7FF
+    00127F303956652E238DC86D4EEDB03188E21FF545C4DA73819BFD5154F5C46C7E8050B4C34D1A6D3F4C6B6758
+    DAE74F52BFCBED2CE73E60D193E9763382A6E6D3B4EA444086CD66AC869104A989B59B82DCBDC8D803E5CF1470
+    B38260556CB588A1E470F71B3E80D2649FD47C64BE81A96B1C4FCB5B8A3452708223B8FCCF5AB8D2602A37AEAF
+    0E17AEE821C8F5C9AC936851B92D1E98CE739569A62377AE47E468CB7E188676513E9CB013FCDDA647CB6E6915
+    629ACBFC14519B4F0BF2742B137CE02C5AEBA96EAB1C56C3E5DF5B94D2EF23E0CDD2F115EE5A4CB446384AB633
+    838504F95715B6E11D33B5D925F5A093BA3895998FC320D6EAC7ECC6EE4D2619AD2DEEAF219104AACBB6255F10
+    7B4753CB1D40C1AF1B534A9DD76ADFE27B742B54B777EE51EB71C103113B4E267248501067E0173595BFBA489F
+    B0B7D3E67527DFDD3AAAB0F4C75ABCBDE19B582F1D2E26B7450720060EDF46C50177A1DA46E004B9738CE762A8
+    3F5AB683824B3724D4748DBC580469F612C7BE1499D88CF6467C9F860F3AAB9E558B3B34FB87F5988FF955BC9A
+    4DB95C8B7963DBD5A499540F8E2895D3B4FDB895212E067776A73F4156C676F720941BF631777780310D637117
+    7FF7963419BC1D3B2C83D7339CD6E2FAC34F5CB848401D581DDF99AA598E9C1D922569587744AA4FE54F84D327
+    9D369E59422D6591B96AA71DDEF15CD1B6BA5DC390BFB6590FE1F68E7F9D5926A0CB21136956EE7B829CB9FA54
+    904F72EC4C7C361477BE1462A9BB22B055970E4A630EFA9DDCCB8E6236CFD7346C5A2E9512EE9AE65590F7484E
+    48F520D558B8B9490767A63A38E409B876FA0E5538FDAF3F398EA48BF8215118F99E743697D4D562EE2D234B78
+    F72C0B2AF52CD1B30FA8C50A6DB4E8E53ECDA55C48D9EAB0ED5FAD476F71D8A8FECAD52761DF2DDE47D4D4EDAE
+    4C83074CB88FFD22652714BC8C561B2594B2027F67A47FEE38C8F90E552DB58CC07BDECC30790009FAD0536BEE
+    4E0E9B7C796725971421E24BE4C343A64CE33C8175E5F2AC6A4C38EE2E26B22B191D54B3C4D83CBA8DB44C760E
+    E72D7080E7391CEB1D1F156A4E1C2E8372EE390264518FA54916BBC42D93FB2100EE6330C8F0A43854288CE99A
+    4934A0E77B5EB4873DEC47C3AD44FA7C05CF6D76EE17EEEE23231EB5452EA5C45236D169650F2F78B4A5BE58A1
+    1E2D7EEDB64DA846800E5D9458340E13F190D8CE0B82B9B58F41D26670EDAC7B13050EB28ECD46075C9FD6B4B0
+    6ABC1BC31A5486F38BF56E20B8560CBA7DBB2189DF1C86FE7D3974C79572ED3B86A3BA3B6FEF6E64527ABC842E
+    7C2BA170F70EFD9B69B7ED717FAEA285446863B78D9DB7E39EE0A0E57A73F2E75E66A945627272F64BF9B1E9D0
+    949C77A3151F76FF0082A7581ABEA88DAAADC7ECE59C064B7052464523912C4723F91AC5BD9EA2772CDADDFB92
+    7764BD6EF5BBBD1AE6E49D3F559CA16CFEF76951DDC9701BA557DC699A4C7121F69793777094E1BE14FD2CF762
+    AF1B7B585EAE0A52C3BFC98C96CA175FE32E2F661DFB9CE3E4288874FD38A6D4D3E4940E84467AFAD5CDFC5636
+    F32F631F3C75C13F53504D7F1C684995171D371ABD4DB583CE7149E41E3B4B4881274B619FC51FFDD47318973D
+    9C2D1F9000532F35DB4DB80FB8FF00A57FAD52DE6AF6EFD04BF4E74718C9F105CE28724BAC2F313DAA0F116C28
+    84B9BE723B4BD85CF8760173F5A120323C7DA265801EF0DB8C7864D4B0BA91B6548813D1BA81E479D556200EF6
+    8B80DFDF258D4FF2AA818F4C53E252CDEFDFCA467001FD683C8ED8C2A1F246490797A54E9284B43BB08CA39151
+    D3D3C6BAC6DC346D41B7B38C48B9E78383F1A85E466042ABAF7EE0722847BB3B0044562D8DCAA7BE99DB658A8D
+    F9CF3507245758EB86E1DC969242F8E7CFA0F85397675255BD3950F1B3B280E08F3661F90FEB45C7ECF90663DA
+    11F88F2F90E558CD4D12452C61493D7C19813F0A2A1699C7B91BB8F0119F9FA54705EDBC3FF8D23079E0850287
+    93566507748416F0A4B43934835C4EABBDA28D477EE7FE99A02E6F6E579234699CFDD5C9F99A1A6D5F29B7693E
+    6D404B7D03B65F2FE41B14165E2862DE7C18549732ECDED2BB11D72C5ABEC735FDD1296F14933E3A46A491E98A
+    56DAC59DB81B2CEDF70FE674DD8F9D4B71C61AA7646382EA48A3231B63C463E4B8A4CE53E118F32BA74A1C673E
+    4BFE10CBC3FADAC9DA4962F0AFE29DBB3F8F320D29225B68F13EA32123F9616217E7DF55379ABDE4ED992E2573
+    E2589FAD00F3C8C49393EB4718D47DE6BE019BA51EEA7F25BCFA963DD491F18EACD9A067BC2C7392C7D6AB9DA4
+    272722A324F79F955118D89253B84B49BCE4E56A272809C31CD479FC44F9525505B1914761468D52E92D83C111
+    2A0ED240E79C7E54F12A5BC00380F291831A9F781F1F2A54A98286C2DD9C21A464424EEDCF91CFB863AD34CB24
+    982E48DA30A4A803D76F3E7EB4A9571826656C6F264F53CBE5D29E2601797203C2952AE3864D7F1C6B8DD93E54
+    24BA93B0C29A54AB1849101BD93FCC3E82A3F6A7F126952A00D0D3725B9531A639EBCE952A1B05BCC4253DE726
+    9C27503271F1A54A86C31498D7B8EEC8F9D45DB3B7DD0B8F1A54A89205C98D24B0C39C8EEA6E3CCFA52A55A00F
+    CE7957D0A7AF2A54AB4E3FFFD900
+    """
+)
+
+
+ADD_SHORT_LE_BASELINE = Baseline(
+    """
+    FFE1020245786966000049492A000800000009000F0102000D0000007A000000100102000E000000880000001A
+    01050001000000960000001B010500010000009E00000028010300010000000200000013020300010000000200
+    00001402050006000000A60000006987040001000000D600000025880400010000008801000000000000455849
+    46205061636B61676500004C6974746C6520456E6469616E00C800000001000000C80000000100000000000000
+    01000000FF000000010000008000000001000000FF000000010000008000000001000000FF000000010000000C
+    0000900700040000003032323003900200140000006C01000001910700040000000102030003920A0001000000
+    8001000008920300010000001800000000A00700040000003031303001A00300010000000100000002A0030001
+    000000D803000003A00300010000006505000008A40300010000000100000009A4030001000000010000000AA4
+    0300010000000100000000000000323031393A30323A30382032313A34343A33350031D4000010270000050000
+    00010004000000020300000100020002000000530000000200050003000000CA01000003000200020000005700
+    00000400050003000000E2010000000000004F000000010000002400000001000000B96B0100A30600002F0000
+    000100000019000000010000001BE50300E91C0000
+    """
+)
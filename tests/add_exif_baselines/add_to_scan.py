@@ -4,15 +4,15 @@ from baseline import Baseline
 
 ADD_TO_SCANNED_IMAGE_BASELINE = Baseline(
     """
-    FFE101944578696600004D4D002A00000008000487690004000000010000006588250004000000010000010601
-    0F0002000000150000003E0110000200000012000000530000000041636D65205363616E6E657220436F6D7061
-    6E79005363616E2D6F2D4D61746963203530303000000490030002000000140000009B90040002000000140000
-    00AF9203000A00000001000000C3928600070000003A000000CB00000000313939393A31323A33312032333A34
-    393A313200323032303A30373A31312031303A31313A33370000006B4D000009C4415343494900000054686973
-    20696D61676520776173207363616E6E656420696E2066726F6D20616E206F6C642070686F746F20616C62756D
-    2E00000600020005000000030000015400010002000000024E00000000040005000000030000016C0003000200
-    000002570000000006000500000001000001840005000100000001000000000000000000000029000000010000
-    001D000000010000059D0000001900000051000000010000002900000001000003E400000019000184BD000001
-    F4
+    FFE101964578696600004D4D002A000000080004010F0002000000150000003E01100002000000120000005487
+    69000400000001000000668825000400000001000001080000000041636D65205363616E6E657220436F6D7061
+    6E7900005363616E2D6F2D4D61746963203530303000000490030002000000140000009C900400020000001400
+    0000B09203000A00000001000000C4928600070000003A000000CC00000000313939393A31323A33312032333A
+    34393A313200323032303A30373A31312031303A31313A33370000006B4D000009C44153434949000000546869
+    7320696D61676520776173207363616E6E656420696E2066726F6D20616E206F6C642070686F746F20616C6275
+    6D2E0000000600010002000000024E000000000200050000000300000156000300020000000257000000000400
+    05000000030000016E000500010000000100000000000600050000000100000186000000000000002900000001
+    0000001D000000010000059D0000001900000051000000010000002900000001000003E400000019000184BD00
+    0001F4
     """
 )
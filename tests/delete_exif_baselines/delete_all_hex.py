@@ -1,252 +1,117 @@
-"""APP1 segment hexadecimal baseline for test_delete_all_tags."""
-
-from baseline import Baseline
-
-DELETE_ALL_HEX_BASELINE = Baseline(
-    """
-    FFE12AAE4578696600004D4D002A0000000800038769000400000001000008F288250004000000010000171AEA
-    1C0007000008180000009E000018AC000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    0000000000000000000000000000000000000000000000000000000000000000001CEA00000008000001000000
-    521800005A00000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    00000000000003900000070000000430323231EA1C00070000080C00000A90EA1D000900000001000010480000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    00000000000000000000000000001CEA0000000800000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    0000000000000000000007DF05E708A905324170706C6520694F530000014D4D00120001000900000001000000
-    09000200070000022E000000EC00030007000000680000031A0004000900000001000000010005000900000001
-    000000C80006000900000001000000D40007000900000001000000010008000A0000000300000382000C000A00
-    0000020000039A000D00090000000100000033000E000900000001000000040010000900000001000000010014
-    00090000000100000001001600020000001D000003AA0017000900000001000000000019000900000001000000
-    00001A000200000006000003C8001F000900000001000000000000000062706C69737430304F1102007D017801
-    6B015B015601590168017A017E0179017D01800182017201650160018D01960192018F018F0190019201900197
-    019A01A701A7019A01830169016601810189019701A701B401BC01B701AE01AE01AB01A001930183017E017E01
-    7B0188019601A301B701C301CD01D001CE01CA01C201B801AC01A401A101A2019901CE00E700E800F0001F0140
-    016C018B018E0178016C0154014F0158015B0163018A00A600B8009200A100A600D1000201F900E000D900D700
-    D600C100B4004E005C008C00B900B8009500B500C700C400E200F400EC00E000D000C500940027008500B20000
-    01C2007C00A900A700A000B700C700BD00B500C100B00050002A007C006400C800AC00950096009F009700AF00
-    D100C400B100A700A600710026007F00720086009300A00090009800A800AD00D800DE00BC00B800C200810025
-    006B009B006A00890091009C009B00B600AE00D100E000B900AE00990057007C0071006C00730071009E00A300
-    A000AF00B400CE00E200A700A500A7006E00410050003F00720077009000950099009600E400B600C800AC00B7
-    00B30049003A0022002A00410057006E008A009D00A900A600B800A400AC009A006D005000300063005C005600
-    57005E006F006E0097007C006B0058005200520059004E0033007900760086006B0065005F005F005800520050
-    00480043003900300029001D000008000000000000020100000000000000010000000000000000000000000000
-    020C62706C6973743030D4010203040506070855666C6167735576616C75655974696D657363616C655565706F
-    63681001130001668F2C8EB8B9123B9ACA0010000811171D272D2F383D00000000000001010000000000000009
-    0000000000000000000000000000003FFFFFF58900000A940000023400008599FFFFF986000026630000008F00
-    0001000000000F000000404163303663356D51374C7777796E6269744D465034516D304A717058000071383235
-    730000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    0000000000000000000000000000000000000000000000000000530061006D0070006C00650020007500730065
-    007200200063006F006D006D0065006E0074002000730065007400200069006E002000570069006E0064006F00
-    7700730020004500780070006C006F007200650072002E00000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-    000000000000000000000000000000000000000000000000004800000001FFD8FFDB0043000806060706050807
-    07070909080A0C140D0C0B0B0C1912130F141D1A1F1E1D1A1C1C20242E2720222C231C1C2837292C3031343434
-    1F27393D38323C2E333432FFDB0043010909090C0B0C180D0D1832211C21323232323232323232323232323232
-    3232323232323232323232323232323232323232323232323232323232323232323232FFC0001108007800A003
-    012100021101031101FFC4001F0000010501010101010100000000000000000102030405060708090A0BFFC400
-    B5100002010303020403050504040000017D01020300041105122131410613516107227114328191A1082342B1
-    C11552D1F02433627282090A161718191A25262728292A3435363738393A434445464748494A53545556575859
-    5A636465666768696A737475767778797A838485868788898A92939495969798999AA2A3A4A5A6A7A8A9AAB2B3
-    B4B5B6B7B8B9BAC2C3C4C5C6C7C8C9CAD2D3D4D5D6D7D8D9DAE1E2E3E4E5E6E7E8E9EAF1F2F3F4F5F6F7F8F9FA
-    FFC4001F0100030101010101010101010000000000000102030405060708090A0BFFC400B51100020102040403
-    040705040400010277000102031104052131061241510761711322328108144291A1B1C109233352F0156272D1
-    0A162434E125F11718191A262728292A35363738393A434445464748494A535455565758595A63646566676869
-    6A737475767778797A82838485868788898A92939495969798999AA2A3A4A5A6A7A8A9AAB2B3B4B5B6B7B8B9BA
-    C2C3C4C5C6C7C8C9CAD2D3D4D5D6D7D8D9DAE2E3E4E5E6E7E8E9EAF2F3F4F5F6F7F8F9FAFFDA000C0301000211
-    0311003F00F4D62477A61DE7A0AE8218D60DDC530838AA44913A16A88C5571131318E050013C55137265898F43
-    52080D4B00F2CE7935221DA793536289D5D48EB8A5DEBEB486481C74A717A8655C89C82DEF49D2A1B28439A633
-    91C534264A5778E952221DB5420F2BE6E94C922217814D3115DA2623EB4DFB3BF5AB892C6F90C7B5385B8EE1AA
-    EE40E5800ECD5208FD8D26343BCA53D452FD9626EA48A9B8C78B24EC4D3BEC8807534AE507938F5A694A963216
-    041A371E959B45A61F31ED4C68DFD28481B27008E94E0E4569633B8F129A78901A2C3E61C369F4A3621A109EA2
-    F94B9E9479429DC431A21EA69BE5AAF5DD54992C50A9D8B5218C7F78D0314023F8A9C5914659C0FC690C69B88F
-    FBD9A619A33D2972B0E6431896E805342CB9FE1A7CA2E60DB2E7EF63E94C6593BEE34EC1726478BA17FCEA4CC2
-    7F8E33F46ACEE55850887A11F9D2F9433C114D489B1208E9C10D1701C10D2EDF5A2E171A507A530C04F6FD6A93
-    21879440FF00EBD06227DAAEE8571A62FF0068D34C01BAFF002A2E8433ECABEA7F2A5FB27A1A3990598F5B723D
-    E9E2203AD4B65A42796334BB7B62A6E5D8F244D77553A9476C3C43235ADC0262B82AA08E3A118C8E7835A316A9
-    AAA3431C7AC4933B93BD4C4994C6383C75E6B85D668EB54917F52D6757D39616FB64325B95FDE3181728D9E071
-    EBFCEA01AEEB8F710C467B7D9228652221D093FE142AFA5C4E8D997175BD6D3516B43736E51977472A460F1EA4
-    67A75A2D7C59A879B109EE2128F2795FBB84925B9E9CE29FD618BD81A49E25BA17CB6BBEDB79E798D81DA4E01E
-    B52DBF8B83ED12C7192C485D84F38EBC1EF550AE9BB326542CAE5E5F1245C661EBD39EB53AEBF6E4730B8FD457
-    46A63ECC0EBD687A21A85FC456E8706239AA4D8BD931ADE24B70B91093FF0002A8CF89A26CECB7C81C93BBFF00
-    AD436C152645FF00096C3FF3EDFF008FFF00F5AA45F165901FBC8DD7E9CE7E94AEC7ECD8F3E28B151BA4495140
-    CF2B8E3F3A587C61A2C92044171231EB84E052E6635043A2F1568B3CEF0A5C0DEADB4A8E704F6AE0FE2778D26B
-    28ADF4FD2AF961924CB4E50E1F6F619ED9ACDCDD8AE43CF3518DADEED9AD24061572D137B1E40AD8B2F105EC77
-    12DEC4E8B3C8A3721E5588EFEC6B99AE64742972B35A7D78DFD8FEF2CF209DD2E1F001041E9E99AB31EB73CB73
-    0CD12F973041167A8DBDB8AC542C8D9D4BEB60BABCBA8EFE2BE8932550C4D1AE4719EBC56644D7D6D21281A581
-    6E44F14722F1CE4E33E9D6AA29244C9DCD8B6BBB8BD0D7102AC130F9786C8E3B1AA834F9A69A65777478BF7842
-    74E7924134A368BD4B6B996874367F6816ABE74D1B303D739FCCFAD5E798346010A7E95D91AAE491CEE0D311D9
-    F202C642E3A9E6AB4914B260BB1DB9CE0251CECA48688379524B052703E5E685B43920E4FE147336559217C8C2
-    E7B9E9D3A5412C113AF405873D726AD4999BB1125B426456DF83E841C8FE958DAF6A9A7E99FE8373E7A8963E5A
-    25C601F7A5298ECAD73CF6DAEDED2F566B63E6847FDD963B771E809A9B5A96F754BE50F06678E2C164F9B701D4
-    E47519AE7BB7A11D0EBAC9F4CD56C57CAE1C21C24ABB712FA74E47F8554D5746B9B253AA5A244D68177108DF32
-    81C127D066B28CDA9599D2E09C7991AF6D0C72D85A6B30C8B1C736219222996DC3F8B1EA6BA0B1D19277FB38B9
-    B86500B26155471D07F9E82A252B0D42E3AEE06D35DE5F3E4CA105F73FF092037F33DEA95C595B412A5B2249E5
-    B42E325F20B0FBA003D3BD4A95CAE5B18FE15BA5BF54F3549F2E52B276C9231F9735ACF72F63716EB7002ACDBA
-    3191D5C76CFAE3F91AB92F7AC34D285C279AE07EEB7C7F20DB855E4FA37F2A75BCC194894FCC3A103231569D91
-    0B565FB6BA037797395CF0411C1AB8F768114C6C58F7F4AB8BD4892219352755C32B951CD402FC5CCAA8AA4961
-    DCE2B548CDB15BFBC3208A63B795CB6066A9489B75239B5036D0B4E662628D7EE94CD79A789F567D6B54596244
-    0C80C4D923181DF8ACE654B44607971C633BDB79C93B791ED4EB69DED4929330DEBB4FCBC91E99F4359DEC423B
-    1F0DC693D94F3C985581E3971FC472DB4E3F0ADBB8912CFC37AED94ECC6660C62C8E3613EA3D339ACEA6B2B1D7
-    4F48DCC1F096B4F6712D84AEBF677903166FF967C8C9FA62BD4A5BCB4648E6B7BA08CAC191860640EBD7DAA311
-    1D6E8BA0FDDB32BEBB7105E47912EE8BE512EC6C839FFEBD73D7578D1C804B1EF0BB4AFCD91BB1CFF5A8A6B41D
-    49A4CC8B0D226D2A295D5FCE17126E18E158765FAD6BC0897D1BC5237CC30C03F546FF001F7ADE4EEEE611EC39
-    0CDE58472B2152473C9C54683F7C4950AA3A11D6A2F735574AE5F8C2A32AEE014F7C66AE1B64057136EC6785E7
-    354A561B85C64CAF131057E5EA33DC55228A7957DADDB22B78C8E59AB3181AE217C8F9C7A678CD594B92F0EE75
-    F988C91E98AA62452BA8A1BEB668E41BA2907201C1AF38D674D9F4CBA48188647C94900E71FD2A66AE825B19F2
-    245B300A927AE1B9350450E7F7AFB5B03EE9E2B24F4219D678684CD74F11DF1C6D0346FDB3E9FAFF005AE92775
-    9B4EB8B6B80DBCA18C9E00C63191EF4AA2F78EA84BDD3978BC2CF6EFB88B89616FEE1C66B7EDF74AA814FCB1FC
-    A09E481EF5537CC8C6375A1A31ACA016038917046EC60FB53D563906DBADC8E060638DFEA6B2B9B72B68991A28
-    ADDED1F6B46AA1941E491FE7FA55298C50CB1ED90FCC081DB03D0FE94AE68A368DD9792DF7480ACACC8E0303E9
-    486D0C6C4E582B9E4F520D245CB5893C40ACA10B86EC3E6E95ACB6B25B60B1407B1DBD6AAE4AB966E1629ADB33
-    1D8CBC8ACAC20FBC9F8D6907A18545EF0E06D723E66E9CE56A44F2E4521539C7AD55D8972897964F17EF1D02EE
-    51C0ED5E73E2DB3B97759E36325B2AE18A72067BD3E6BA14D6871D1A797F3A637FBF6A895A5123939C7F111D05
-    2B5D189E9335AC8FFBD8F70727BF5E2A24BC7926F2EE41126DE3D08FA8A95A9A6C6FE9F786187ECECD1B392405
-    0DF3271593796C2DAE8DC412C8E31B8E3921BBFD41FD2B3BD9D8DA30725724B2D5ADAE60DA0347708E5704D5F6
-    B69AEE131ABAAE40CEE18E47BD4B5666F092686A5AEF292BB6F70BB644E98C76C7A55A6B0475DDB5430FBA7B8C
-    F5A1B1C55D6A24402CA14C9F2A9E4633D6B41D15A168CC8E848EDD4D260B6B10A0DE8227E594803D4D69C33452
-    DA491167FB4AF004849A193768BBB19AD76CB01638EA3922B258A465D2446DBD88EB5A45984F72033400E442E1
-    71EB9A789D3811AF38EFDAAEEC956395F165FDF5B6A325D24A515EDC432153CE3E9FE7A537C2D6CCF629119209
-    63619C4873B41EA3D7142D10377651F1268DA614315ADDD9C77C18858D1B6AFBE49EF5E76EB35B4EF0BB725B07
-    0723F3AA46535667AC5A6A304F691ED5C955DB96393F9D0F344B2A2B58A9427693EBF4AC9DD33A29F2BDCA973A
-    A47A46A51B95C59BC837E002573EBED56ACA469D4BA3A00AC70430E454CA375735A6D29588AE34C2F76F74872C
-    E32C3BE474C1AD6D3269248B0EFF00BE1C30239FAD36EE8495A5A7516F25166B2DCA12D201B1940CEEEF8E2AF4
-    047D8B2932371D76139CFA566F6358BE856B9082691A791F682369276A8ED8C0EB57AD583811C849623839E0D3
-    E82D2E4AF652372A8778E33ED56062C1C3120C9FC64741410D5E562F096710865F99FF008431E48F5AC6BE9669
-    2E0BB28563C7B538EFA18CC846E270B183EF56634F293E75DAC4FE35A5C945492DAD24984F2DB6E2083B98640C
-    5702DE20483509ECF4AB74801999CB87E1B1D319E00EBC53429191A95C47A94EF752DA80F9C4CE0F04FB554D96
-    FE53C6D1A14C6432F0463B668BD8876BDC726A52DA31F2DDB07923AE6AF43E20B95DA73BD070BBCE48AD65052D
-    4A8CF958C935192EA17494EF571B5862B574BD46C2DE2F2AE639106DDAAC8723F1153CB65629CD377359AF2236
-    CB7105C48501E71DBEA29C352468F7C0AE1C756CF247707159246CDEBA1B51CC92DB70EA02E19DBAE011566C1E
-    25DB68ADBA36188994F51D7AFA566CA4F528EB70B4D7B6C5CFEE900E9C9E3D6AC4C970DF3DA2962CC0F3D3F0AA
-    BE88977BB3A4D3AF546F8A63CC4A158B71824567DDA99E7768DFF765CF23B5677F7AC6B1568DC5D46EAE74EB10
-    D1C41CA0E99E40A8ACF65FC02E60732AB7DE42BCA9EF5A2DAE8E67BD87AC652605D01DDF2938C63DA9D75770DA
-    283B09C753E9F9D31232755D694E9773C88E10BB5801B99811E95E6F65A3C124C8D34D8B69321E51FF002CC900
-    8527A679A7160E3B047716F697725B5A4524B2676A9FBCB20FF77D7E954A795DDDD2487CA60DCAEDDA57D88AAB
-    194AC5B1E18BE99433BC3181D72D923F2ABB0F85191496BC8CB0E891A1626B5F68914E04D2F868C16ED3B5D2A3
-    0C7EE9930CD9F4A7C3A6DBC11F9734A5DDBF8106063EA6A5CD0D40B42CECA384C6B113DCEE72067B7152405215
-    2A90AA8EBF7EA1BB9A2562D5ABB6640D2431C6DD438E0E3E9579648B4F58CC096F142B92A236270DD7BF6A9B0E
-    F61F15DC7773AA4F3208F3B896FE1F502B7DA6D3628112CEE220AC32E03E76FF008544AE8B8ABBB98B25D4114F
-    79F6BB978CCB2F41CFCA30294F886CAC900B48A4B84071BA43B4367D075A396E8A94FA10DEF89A69A1D8218D93
-    A3277FCEAA41E22B9B65DB1421727F8063354A36462F7B90DB6BDA879CF9732AE7288C8495CFD2ABA5C1BB9253
-    35CCC8F236E393800D532513A258A4322DCDF328C60007EF7E7D8D6496D2E3B296D22491D5CFCC431009EC7DE9
-    265348C1D461164B09B676F3836448A307DB9F51594D7134B334B2CACCCFF333B9C963DEB45A9CF2763D154BEE
-    52DB377FB200AD5B5413B9489897519E3BFE559E86E437BA6DD4F7AA15582A8CE6450D9FCFF9D360D0E18A454B
-    8762C464765FA669DD0AE25D695106020408ABF78BC84835545B44CEC5A445F719EBEC2828ACE2276E5F001C72
-    0922836C819774C42F7F93A0A004898046F318C6A3804AE770F5A8CC91E095C7F8FD69E8086ACC4925893EC286
-    951B6952430E99A5E4221F346FCEF393C6693CD9438712B1C7BD30236BCB8030934807A06AAB25C4A1BEF13CFE
-    74C4466E0B100FE154E4BC9A366404ED1DF1C504B653925775FBE724E7AD40E4107232A7D29A3167A4B58DEAC3
-    B8D94A8A3D45751A4409A6D8EC65CCCDF34A476F6AC99D45B7BE8B0498C9C74C8EB59BAA4F7135BE523F2A31C9
-    2ADF352123989A73C8C64679C9CD406E1C740BC0C62A8A18A776E053767F0A4DE563033F5E698884C819B6F5EF
-    4AA081D57A6706810E0032676E1B1C73C9A6F9323B280986C725CE050030584F904CB1853DCBE7F0E2ADFF0063
-    39507ED90EEECB834C4324D0E5C645CC7C9EC0D569B45911C0F30153C6403C534C452B986DAD0E24999B8CFC8B
-    D6AB4DF66B940209B6F192B21C66992D993C899810383F5A182AA13B8373C76A7E4647FFD90000000000000000
-    00
-    """
-)
+"""APP1 segment hexadecimal baseline for test_delete_all_tags."""
+
+from baseline import Baseline
+
+DELETE_ALL_HEX_BASELINE = Baseline(
+    """
+    FFE113044578696600004D4D002A0000129C000C010F000200000006000008B60110000200000009000008BC01
+    1200030000000100010000011A000500000001000008C6011B000500000001000008CE01280003000000010002
+    00000131000200000007000008D60132000200000014000008DE02130003000000010001000087690004000000
+    01000008F288250004000000010000171AEA1C0007000008180000009E000018AC1CEA00000008000001000000
+    521800005A00000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    00000000000000000000000000000000000000000000000000000000000000000000004170706C65006950686F
+    6E65203700000000004800000001000000480000000131312E322E360000323031383A30333A31322031303A31
+    323A3037000022829A0005000000010000129C829D000500000001000012A48822000300000001000200008827
+    000300000001001400009000000700000004303232319003000200000014000012AC9004000200000014000012
+    C09101000700000004010203009201000A00000001000012D49202000500000001000012DC9203000A00000001
+    000012E49204000A00000001000012EC920700030000000100050000920900030000000100100000920A000500
+    000001000012F49214000300000004000012FC927C0007000003CE000013049291000200000004353532009292
+    00020000000435353200A00000070000000430313030A001000300000001FFFF0000A00200040000000100000F
+    C0A00300040000000100000BD0A21700030000000100020000A30100070000000101000000A402000300000001
+    00000000A40300030000000100000000A405000300000001001C0000A40600030000000100000000A432000500
+    000004000016D2A433000200000006000016F2A434000200000022000016F8EA1C00070000080C00000A90EA1D
+    00090000000100001048000000001CEA0000000800000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
+    0000000000038769000400000001000012C68825000400000001000012F0EA1C0007000008180000009E000012
+    F60003900000070000000430323231EA1C00070000080C00000A90EA1D00090000000100001048000000000000
+    00000000000000000000
+    """
+)
@@ -1,20 +1,20 @@
-"""APP1 segment hexadecimal baseline for test_modify."""
-
-from baseline import Baseline
-
-LITTLE_ENDIAN_MODIFY_BASELINE = Baseline(
-    """
-    FFE1021045786966000049492A000800000009001001020009000000940000001A01050001000000A20000001B
-    01050001000000AA0000002801030001000000020000001302030001000000020000001402050006000000B200
-    00006987040001000000100100002588040001000000960100000F0102002E000000E200000000000000000000
-    00000000000000000000000000000000000000000000004D6F646966696564000000000000C800000001000000
-    C8000000010000000000000001000000FF000000010000008000000001000000FF000000010000008000000001
-    000000FF0000000100000056616C756520666F72204D616B65205461672074686174206973204C6F6E67657220
-    7468616E204265666F726500090000900700040000003032323003900200140000008201000001910700040000
-    000102030000A00700040000003031303001A00300010000000100000002A0030001000000D803000003A00300
-    010000006505000009A4030001000000010000000AA40300010000000100000000000000323031393A30323A30
-    382032313A34343A33350005000000010004000000020300000100020002000000530000000200050003000000
-    D80100000300020002000000570000000400050003000000F0010000000000004F000000010000002400000001
-    000000B96B0100A30600000C000000010000002200000001000000D5DD0000E8030000
-    """
-)
+"""APP1 segment hexadecimal baseline for test_modify."""
+
+from baseline import Baseline
+
+LITTLE_ENDIAN_MODIFY_BASELINE = Baseline(
+    """
+    FFE101F245786966000049492A000800000009000F0102002E0000007A0000001001020009000000A80000001A
+    01050001000000B20000001B01050001000000BA00000028010300010000000200000013020300010000000200
+    00001402050006000000C20000006987040001000000F20000002588040001000000780100000000000056616C
+    756520666F72204D616B65205461672074686174206973204C6F6E676572207468616E204265666F7265004D6F
+    6469666965640000C800000001000000C8000000010000000000000001000000FF000000010000008000000001
+    000000FF000000010000008000000001000000FF00000001000000090000900700040000003032323003900200
+    140000006401000001910700040000000102030000A00700040000003031303001A00300010000000100000002
+    A0030001000000D803000003A00300010000006505000009A4030001000000010000000AA40300010000000100
+    000000000000323031393A30323A30382032313A34343A33350005000000010004000000020300000100020002
+    000000530000000200050003000000BA0100000300020002000000570000000400050003000000D20100000000
+    00004F000000010000002400000001000000B96B0100A30600000C000000010000002200000001000000D5DD00
+    00E8030000
+    """
+)
@@ -5,6 +5,8 @@ import os
 import textwrap
 import unittest
 
+import pytest
+
 from exif import GpsAltitudeRef, Image
 
 from .add_exif_baselines.add_short import ADD_SHORT_BASELINE, ADD_SHORT_LE_BASELINE
@@ -193,3 +195,52 @@ def test_add_to_scanner_image():
         .upper()
     )
     assert "\n".join(textwrap.wrap(segment_hex, 90)) == ADD_TO_SCANNED_IMAGE_BASELINE
+
+
+def test_add_exif_ifd():
+    """Test adding an EXIF IFD tag to an image that only contains IFD 0."""
+    with open(
+        os.path.join(os.path.dirname(__file__), "scanner_without_app1.jpg"), "rb"
+    ) as image_file:
+        image_bytes = image_file.read()
+
+    app1_bytes = binascii.unhexlify(
+        "FFE10022"  # APP1 marker and length
+        "457869660000"  # EXIF identifier code
+        "4D4D002A00000008"  # TIFF header (big endian)
+        "0001011200030000000100010000"  # IFD 0 with orientation tag
+        "00000000"  # no subsequent IFD
+    )
+    image = Image(image_bytes[:2] + app1_bytes + image_bytes[2:])
+    assert "exif" not in image._segments["APP1"].ifd_pointers
+
+    image.datetime_original = "1999:12:31 23:49:12"
+    image.make = "Acme Scanner Company"
+
+    reloaded_image = Image(image.get_file())
+    assert reloaded_image.orientation == 1
+    assert reloaded_image.datetime_original == "1999:12:31 23:49:12"
+    assert reloaded_image.make == "Acme Scanner Company"
+
+
+def test_add_gps_without_ifd1():
+    """Test adding a GPS IFD tag to an image without a thumbnail IFD (i.e., IFD 1)."""
+    image = Image(os.path.join(os.path.dirname(__file__), "windows_xp_tags.jpg"))
+    assert 1 not in image._segments["APP1"].ifd_pointers
+
+    image.gps_latitude = (41.0, 29.0, 57.48)
+
+    reloaded_image = Image(image.get_file())
+    assert reloaded_image.gps_latitude == (41.0, 29.0, 57.48)
+    assert reloaded_image.xp_title == "XP-Style Title"
+
+
+def test_add_exceeds_segment_size():
+    """Test adding a tag value that does not fit within the maximum APP1 segment size."""
+    image = Image(os.path.join(os.path.dirname(__file__), "noise.jpg"))
+    original_file = image.get_file()
+
+    with pytest.raises(ValueError, match="exceeds the maximum APP1 segment size"):
+        image.image_description = "x" * 0x10000
+
+    assert image.get_file() == original_file
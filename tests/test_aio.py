@@ -0,0 +1,117 @@
+"""Test the asyncio front end."""
+
+import asyncio
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from exif import Image
+from exif.aio import AsyncImage, open_image
+
+IMAGE_PATH = os.path.join(os.path.dirname(__file__), "grand_canyon.jpg")
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+
+    """Thread pool executor that counts submitted calls."""
+
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.submissions = 0
+
+    def submit(self, *args, **kwargs):  # pylint: disable=arguments-differ
+        self.submissions += 1
+        return super().submit(*args, **kwargs)
+
+
+class _RecordingReader:
+
+    """Asynchronous file object and opener that records the sizes of reads."""
+
+    def __init__(self):
+        self.file = None
+        self.read_sizes = []
+        self.bytes_read = 0
+
+    def __call__(self, path, mode):
+        self.file = open(
+            path, mode
+        )  # pylint: disable=consider-using-with,unspecified-encoding
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.file.close()
+
+    async def read(self, size=-1):
+        """Read from the file."""
+        self.read_sizes.append(size)
+        chunk = self.file.read(size)
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+def test_open_image_header_only():
+    """Verify only the header is read in bounded chunks through the opener."""
+    reader = _RecordingReader()
+    image = asyncio.run(
+        open_image(IMAGE_PATH, header_only=True, opener=reader, chunk_size=0x1000)
+    )
+
+    assert isinstance(image, AsyncImage)
+    assert image.make == "Apple"
+    assert set(reader.read_sizes) == {0x1000}
+    assert reader.bytes_read < os.path.getsize(IMAGE_PATH)
+
+    with pytest.raises(RuntimeError, match="header_only"):
+        asyncio.run(image.async_save(IMAGE_PATH))
+
+
+def test_open_image_stream():
+    """Verify reading an image from an in-memory stream."""
+    with open(IMAGE_PATH, "rb") as image_file:
+        image_bytes = image_file.read()
+
+    async def open_stream_image():
+        stream = asyncio.StreamReader()
+        stream.feed_data(image_bytes)
+        stream.feed_eof()
+        return await open_image(stream, tags=["model"])
+
+    image = asyncio.run(open_stream_image())
+
+    assert image.get_all() == {"model": "iPhone 7"}
+    assert image.get_file() == image_bytes
+
+    with pytest.raises(ValueError, match="must specify a path"):
+        asyncio.run(image.async_save())
+
+
+def test_async_save(tmp_path):
+    """Verify parsing and saving run in the executor."""
+    image_path = str(tmp_path / "grand_canyon.jpg")
+    shutil.copyfile(IMAGE_PATH, image_path)
+
+    async def modify_image(executor):
+        image = await open_image(image_path, executor=executor)
+        image.make = "Py"  # same layout (saved in place)
+        await image.async_save()
+        image.copyright = "Python"  # new layout
+        await image.async_save(str(tmp_path / "copy.jpg"))
+
+    with _CountingExecutor() as executor:
+        asyncio.run(modify_image(executor))
+
+    # Opening and closing the file, at least one read, parsing, and two saves.
+    assert executor.submissions >= 6
+
+    assert Image(image_path).make == "Py"
+    assert "copyright" not in Image(image_path).list_all()
+
+    copied_image = Image(str(tmp_path / "copy.jpg"))
+    assert copied_image.make == "Py"
+    assert copied_image.copyright == "Python"
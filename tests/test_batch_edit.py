@@ -0,0 +1,194 @@
+"""Test batching tag modifications, additions, and deletions."""
+
+import os
+
+import pytest
+
+from exif import GpsAltitudeRef, Image
+import exif._app1_metadata
+
+# pylint: disable=protected-access
+
+GPS_TAGS = {
+    "gps_latitude": (41.0, 29.0, 17.53),
+    "gps_latitude_ref": "N",
+    "gps_longitude": (81.0, 35.0, 5.86),
+    "gps_longitude_ref": "W",
+    "gps_altitude": 262.0,
+    "gps_altitude_ref": GpsAltitudeRef.ABOVE_SEA_LEVEL,
+    "gps_timestamp": (15.0, 4.0, 30.0),
+    "gps_datestamp": "2021:06:14",
+    "gps_map_datum": "WGS-84",
+}
+
+
+def _read_test_image(file_name):
+    with open(os.path.join(os.path.dirname(__file__), file_name), "rb") as image_file:
+        return image_file.read()
+
+
+@pytest.fixture(name="serializations")
+def fixture_serializations(monkeypatch):
+    """Count how many times the APP1 body is serialized."""
+    serializations = []
+    original_serialize_ifds = exif._app1_metadata.serialize_ifds
+
+    def serialize_ifds(*args, **kwargs):
+        serializations.append(args)
+        return original_serialize_ifds(*args, **kwargs)
+
+    monkeypatch.setattr(exif._app1_metadata, "serialize_ifds", serialize_ifds)
+    return serializations
+
+
+def test_set_many(serializations):
+    """Verify adding several tags (including a new GPS IFD) rebuilds the APP1 body once."""
+    image = Image(_read_test_image("noise.jpg"))
+    assert "gps" not in image._segments["APP1"].ifd_pointers
+
+    image.set_many(GPS_TAGS)
+
+    assert len(serializations) == 1
+    for reloaded_image in [image, Image(image.get_file())]:
+        for tag, value in GPS_TAGS.items():
+            assert reloaded_image[tag] == value
+
+        assert reloaded_image.software == "Adobe Photoshop CS4 Windows"
+        assert (
+            reloaded_image.get_thumbnail()
+            == Image(_read_test_image("noise.jpg")).get_thumbnail()
+        )
+
+
+def test_edit(serializations):
+    """Verify modifying, adding, and deleting tags within an edit block."""
+    image = Image(_read_test_image("grand_canyon.jpg"))
+
+    with image.edit():
+        image.make = "Python"  # modify
+        image.model = "A model name longer than the original value"  # re-add
+        image.copyright = "Python"  # add
+        del image.gps_altitude  # delete
+        image["gps_map_datum"] = "WGS-84"  # add
+        image.delete("flash")  # delete
+
+        assert image.make == "Apple"  # deferred until the block exits
+
+    assert len(serializations) == 1
+    for reloaded_image in [image, Image(image.get_file())]:
+        assert reloaded_image.make == "Python"
+        assert reloaded_image.model == "A model name longer than the original value"
+        assert reloaded_image.copyright == "Python"
+        assert reloaded_image.gps_map_datum == "WGS-84"
+        assert "gps_altitude" not in reloaded_image.list_all()
+        assert "flash" not in reloaded_image.list_all()
+        assert reloaded_image.gps_latitude == (36.0, 3.0, 11.08)
+
+
+def test_edit_modify_only(serializations):
+    """Verify modifying existing tags within an edit block does not rebuild the APP1 body."""
+    image = Image(_read_test_image("grand_canyon.jpg"))
+    original_len = len(image.get_file())
+
+    image.set_many({"make": "Py", "gps_altitude": 100.0})
+
+    assert not serializations
+    assert image.make == "Py"
+    assert image.gps_altitude == 100.0
+    assert len(image.get_file()) == original_len
+
+
+@pytest.mark.parametrize(
+    "file_name", ["grand_canyon.jpg", "no_app1.png"], ids=["app1", "no_app1"]
+)
+def test_edit_add_then_delete(file_name, serializations):
+    """Verify deleting a tag added earlier in the same edit block cancels the addition."""
+    image = Image(_read_test_image(file_name))
+    original_file = image.get_file()
+
+    with image.edit():
+        image.copyright = "Python"
+        del image.copyright
+
+    assert not serializations
+    assert "copyright" not in image.list_all()
+    assert image.get_file() == original_file
+
+
+def test_edit_exception():
+    """Verify edits are discarded if the edit block raises an exception."""
+    image = Image(_read_test_image("grand_canyon.jpg"))
+
+    with pytest.raises(ZeroDivisionError):
+        with image.edit():
+            image.copyright = "Python"
+            del image.make
+            raise ZeroDivisionError
+
+    assert image.make == "Apple"
+    assert "copyright" not in image.list_all()
+
+    image.copyright = "Python"  # no longer deferred
+    assert image.copyright == "Python"
+
+
+def test_edit_errors():
+    """Verify invalid batched edits raise errors."""
+    image = Image(_read_test_image("grand_canyon.jpg"))
+
+    with pytest.raises(AttributeError, match="image does not have attribute"):
+        with image.edit():
+            del image.copyright
+
+    with pytest.raises(AttributeError, match="cannot add attribute"):
+        image.set_many({"image_width": 6, "copyright": "Python"})
+
+    with pytest.raises(RuntimeError, match="already being edited"):
+        with image.edit():
+            with image.edit():
+                pass
+
+    assert "copyright" not in image.list_all()
+
+
+@pytest.mark.parametrize(
+    "values, exception",
+    [
+        ({"model": "Short", "image_description": "x" * 70000}, ValueError),
+        ({"model": "M", "orientation": 99999}, ValueError),
+        ({"model": "M", "copyright": "Python", "orientation": 99999}, ValueError),
+    ],
+    ids=["exceeds_app1_size", "invalid_value", "invalid_value_with_addition"],
+)
+def test_set_many_failure(values, exception):
+    """Verify a failing batch leaves the image unchanged (including tags modified before the failure)."""
+    image = Image(_read_test_image("grand_canyon.jpg"))
+    original_file = image.get_file()
+
+    with pytest.raises(exception):
+        image.set_many(values)
+
+    assert image.get_file() == original_file
+    assert image.model == "iPhone 7"
+    assert image.orientation == Image(original_file).orientation
+    assert "copyright" not in image.list_all()
+    assert not image._segments["APP1"].body_bytes.get_dirty_ranges()
+
+    image.model = "Python"  # still modifiable
+    assert Image(image.get_file()).model == "Python"
+
+
+def test_set_many_no_app1():
+    """Verify adding tags to an image without EXIF metadata within an edit block."""
+    image = Image(_read_test_image("scanner_without_app1.jpg"))
+    image.set_many({"make": "Python", "gps_latitude": (1.0, 2.0, 3.0)})
+
+    reloaded_image = Image(image.get_file())
+    assert reloaded_image.make == "Python"
+    assert reloaded_image.gps_latitude == (1.0, 2.0, 3.0)
+
+    image = Image(_read_test_image("scanner_without_app1.jpg"))
+    with pytest.raises(ValueError):
+        image.set_many({"make": "Python", "image_description": "x" * 70000})
+
+    assert not image.has_exif
@@ -0,0 +1,77 @@
+"""Test the APP1 body buffer shared by the tag parsers."""
+
+import os
+import struct
+
+import pytest
+
+from exif import Image
+
+# pylint: disable=protected-access
+
+
+def _get_app1(file_name="grand_canyon.jpg"):
+    return Image(os.path.join(os.path.dirname(__file__), file_name))._segments["APP1"]
+
+
+def test_shared_view():
+    """Verify the tag parsers read through one memory view that reflects modifications."""
+    image = Image(os.path.join(os.path.dirname(__file__), "grand_canyon.jpg"))
+    app1 = image._segments["APP1"]
+    body_view = app1.body_view
+
+    image.model = "Modified"
+
+    assert app1.body_view is body_view
+    assert bytes(body_view) == bytes(app1.body_bytes)
+    assert image.model == "Modified"
+
+
+def test_write_records_dirty_range():
+    """Verify writes within the body modify it in place and record the modified range."""
+    app1 = _get_app1()
+    body_view = app1.body_view
+    body_len = len(app1.body_bytes)
+
+    app1.write(0x20, b"\x01\x02\x03")
+
+    assert app1.body_view is body_view
+    assert len(app1.body_bytes) == body_len
+    assert bytes(body_view[0x20:0x23]) == b"\x01\x02\x03"
+    assert app1.body_bytes.get_dirty_ranges() == [(0x20, 0x23)]
+
+
+def test_write_regrows_body():
+    """Verify writes beyond the end of the body grow it and replace the shared view."""
+    app1 = _get_app1()
+    body_len = len(app1.body_bytes)
+
+    app1.write(0x20, b"\x01")
+    app1.write(body_len + 2, b"\x04\x05")
+
+    assert len(app1.body_bytes) == body_len + 4
+    assert bytes(app1.body_view[body_len:]) == b"\x00\x00\x04\x05"
+    assert app1.body_bytes.get_dirty_ranges() == [
+        (0x20, 0x21),
+        (body_len, body_len + 4),
+    ]
+
+    app1.write(0x21, b"\x06")  # the new view is also writable
+
+    assert app1.body_view[0x21] == 0x06
+
+
+@pytest.mark.parametrize(
+    "tag, value",
+    [("orientation", 99999), ("x_resolution", 2**40), ("gps_altitude", -1.0)],
+)
+def test_modify_out_of_range(tag, value):
+    """Verify modifying a tag with a value out of its type's range raises an error naming the tag."""
+    image = Image(os.path.join(os.path.dirname(__file__), "grand_canyon.jpg"))
+    original_value = image[tag]
+
+    with pytest.raises(ValueError, match=f"invalid value for {tag}") as exc_info:
+        image[tag] = value
+
+    assert isinstance(exc_info.value.__cause__, struct.error)
+    assert image[tag] == original_value
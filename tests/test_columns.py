@@ -0,0 +1,124 @@
+"""Test reading tag values from many images into typed columns."""
+
+import os
+
+import pytest
+
+from exif import Image, read_columns
+
+TEST_DIR = os.path.dirname(__file__)
+IMAGE_NAMES = [
+    "grand_canyon.jpg",
+    "little_endian.jpg",
+    "noise.jpg",
+    "user_comment.jpg",
+    "windows_xp_tags.jpg",
+    "no_app1.png",
+    "does_not_exist.jpg",
+]
+
+
+def _get_path(file_name):
+    return os.path.join(TEST_DIR, file_name)
+
+
+def _get_expected_values(tag):
+    expected_values = []
+
+    for file_name in IMAGE_NAMES:
+        if os.path.exists(_get_path(file_name)):
+            image = Image(_get_path(file_name))
+            expected_values.append(image.get(tag) if image.has_exif else None)
+        else:
+            expected_values.append(None)
+
+    return expected_values
+
+
+def _get_rows(column):
+    rows = []
+
+    for row, is_valid in enumerate(column.valid):
+        if not is_valid:
+            rows.append(None)
+        elif column.kind == "string":
+            value_bytes = column.values[column.offsets[row] : column.offsets[row + 1]]
+            rows.append(value_bytes.decode("utf-8"))
+        elif column.width == 1:
+            rows.append(column.values[row])
+        else:
+            rows.append(
+                tuple(column.values[row * column.width : (row + 1) * column.width])
+            )
+
+    return rows
+
+
+@pytest.mark.parametrize(
+    "tag, kind, width",
+    [
+        ("exif_version", "string", 1),
+        ("f_number", "float", 1),
+        ("gps_latitude", "float", 3),
+        ("model", "string", 1),
+        ("orientation", "int", 1),
+        ("user_comment", "string", 1),
+        ("x_resolution", "float", 1),
+        ("xp_title", "string", 1),
+    ],
+)
+def test_read_columns(tag, kind, width):
+    """Verify each column matches reading the tag from each image individually."""
+    paths = [_get_path(file_name) for file_name in IMAGE_NAMES]
+    column = read_columns(iter(paths), [tag])[tag]
+
+    assert (column.kind, column.width) == (kind, width)
+    assert len(column.valid) == len(paths)
+    assert len(column.values) == (
+        column.offsets[-1] if kind == "string" else len(paths) * width
+    )
+    assert _get_rows(column) == _get_expected_values(tag)
+
+
+def test_read_columns_buffers():
+    """Verify the columns expose fixed-width buffers (e.g., for zero-copy NumPy or Arrow arrays)."""
+    columns = read_columns(
+        [_get_path("grand_canyon.jpg"), _get_path("noise.jpg")],
+        ["gps_latitude", "orientation", "make"],
+    )
+
+    for tag, item_format in [("gps_latitude", "d"), ("orientation", "q")]:
+        view = memoryview(columns[tag].values)
+        assert (view.format, view.itemsize) == (item_format, 8)
+
+    assert memoryview(columns["make"].offsets).tolist() == [0, 5, 5]
+    assert bytes(columns["make"].values) == b"Apple"
+    assert bytes(columns["make"].valid) == b"\x01\x00"
+
+
+def test_read_columns_unsupported_values():
+    """Verify unknown tag names raise an error and values that can't be read into a column are invalid."""
+    with pytest.raises(ValueError, match="unknown image attribute"):
+        read_columns([_get_path("grand_canyon.jpg")], ["not_a_tag"])
+
+    column = read_columns([_get_path("grand_canyon.jpg")], ["maker_note"])["maker_note"]
+    assert (column.kind, bytes(column.valid)) == ("float", b"\x00")
+
+
+def test_read_columns_rational_pairs():
+    """Verify rational values can be read as undivided numerator and denominator pairs."""
+    paths = [_get_path(file_name) for file_name in IMAGE_NAMES]
+    float_columns = read_columns(paths, ["gps_latitude", "f_number"])
+    pair_columns = read_columns(
+        paths, ["gps_latitude", "f_number"], rational_pairs=True
+    )
+
+    for tag, float_column in float_columns.items():
+        pair_column = pair_columns[tag]
+        assert (pair_column.kind, pair_column.width) == ("rational", float_column.width)
+        assert pair_column.valid == float_column.valid
+        assert len(pair_column.values) == 2 * len(float_column.values)
+
+        for index, value in enumerate(float_column.values):
+            numerator, denominator = pair_column.values[2 * index : 2 * index + 2]
+            assert value == (numerator / denominator if denominator else 0)
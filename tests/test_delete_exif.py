@@ -9,6 +9,10 @@ from tempfile import TemporaryFile
 from baseline import Baseline
 
 from exif import Image
+from exif._app1_serializer import IfdEntry, read_ifd_entries, serialize_ifds
+from exif._constants import ATTRIBUTE_ID_MAP, EXIF_IFD_POINTER_TAG_ID
+from exif._datatypes import ExifType, TiffByteOrder
+from exif._ifd_decoder import get_decoder
 from .delete_exif_baselines import (
     DELETE_ALL_HEX_BASELINE,
     DELETE_ASCII_TAGS_HEX_BASELINE,
@@ -147,3 +151,97 @@ class TestDeleteExif(unittest.TestCase):
             AttributeError, "unknown image attribute dummy_attr"
         ):
             self.image.dummy_attr
+
+
+def test_repeated_edits_compact():
+    """Verify repeatedly adding and deleting tags does not grow the APP1 segment."""
+    image = Image(os.path.join(os.path.dirname(__file__), "grand_canyon.jpg"))
+    image.copyright = "Python"
+    segment_len = len(image._segments["APP1"].get_segment_bytes())
+
+    for _ in range(10):
+        del image.copyright
+        assert len(image._segments["APP1"].get_segment_bytes()) < segment_len
+
+        image.copyright = "Python"
+        assert len(image._segments["APP1"].get_segment_bytes()) == segment_len
+
+    reloaded_image = Image(image.get_file())
+    assert reloaded_image.copyright == "Python"
+    assert reloaded_image.get_thumbnail() == image.get_thumbnail()
+
+
+def _get_maker_note_entry(image):
+    app1 = image._segments["APP1"]
+    ifds = read_ifd_entries(app1.body_view, app1.ifd_pointers, app1.endianness)
+    return next(
+        entry
+        for entry in ifds["exif"]
+        if entry.tag_id == ATTRIBUTE_ID_MAP["maker_note"]
+    )
+
+
+def test_edits_keep_maker_note_offset():
+    """Verify adding and deleting tags leaves the maker note at its original offset."""
+    image = Image(os.path.join(os.path.dirname(__file__), "grand_canyon.jpg"))
+    maker_note = _get_maker_note_entry(image)
+    assert maker_note.is_opaque()
+
+    image.copyright = "Python"
+    del image.model
+    reloaded_image = Image(image.get_file())
+
+    assert _get_maker_note_entry(reloaded_image) == maker_note
+    assert reloaded_image.copyright == "Python"
+
+
+def test_serialize_unknown_type():
+    """Verify the value offset field of a tag of an unknown type (i.e., a possible pointer) stays valid."""
+    decoder = get_decoder(TiffByteOrder.BIG)
+    original_body_bytes = b"MM\x00\x2a" + decoder.uint32.pack(16) + b"unknown!"
+    ifds = {0: [IfdEntry(0xABCD, 99, 1, decoder.uint32.pack(8), 8)]}
+
+    body_bytes = serialize_ifds(ifds, original_body_bytes, TiffByteOrder.BIG)
+
+    (ifd0_offset,) = decoder.uint32.unpack_from(body_bytes, 4)
+    ifd_tags, _ = decoder.read_ifd(body_bytes, ifd0_offset)
+    assert ifd_tags[0].value_offset == 8
+    assert body_bytes[8:16] == b"unknown!"
+
+
+def test_serialize_ifd_chain_gap():
+    """Verify each IFD points to the next one present (e.g., IFD 0 to IFD 2 if IFD 1 couldn't be read)."""
+    decoder = get_decoder(TiffByteOrder.BIG)
+    ifds = {
+        ifd_key: [IfdEntry(0x0100 + ifd_key, ExifType.SHORT, 1, bytes(4))]
+        for ifd_key in (0, 2)
+    }
+
+    body_bytes = serialize_ifds(ifds, b"MM\x00\x2a" + bytes(4), TiffByteOrder.BIG)
+
+    (ifd0_offset,) = decoder.uint32.unpack_from(body_bytes, 4)
+    _, next_ifd_offset = decoder.read_ifd(body_bytes, ifd0_offset)
+    ifd_tags, next_ifd_offset = decoder.read_ifd(body_bytes, next_ifd_offset)
+    assert ifd_tags[0].tag_id == 0x0102
+    assert next_ifd_offset == 0
+
+
+def test_read_unreadable_sub_ifd():
+    """Verify the pointer to a sub-IFD that can't be read is dropped along with the sub-IFD."""
+    decoder = get_decoder(TiffByteOrder.BIG)
+    body_bytes = serialize_ifds(
+        {
+            0: [IfdEntry(0x0100, ExifType.SHORT, 1, bytes(4))],
+            "exif": [IfdEntry(0x9000, ExifType.UNDEFINED, 4, b"0232")],
+        },
+        b"MM\x00\x2a" + bytes(4),
+        TiffByteOrder.BIG,
+    )
+    (ifd0_offset,) = decoder.uint32.unpack_from(body_bytes, 4)
+
+    ifds = read_ifd_entries(
+        body_bytes, {0: ifd0_offset, "exif": len(body_bytes)}, TiffByteOrder.BIG
+    )
+
+    assert list(ifds) == [0]
+    assert all(entry.tag_id != EXIF_IFD_POINTER_TAG_ID for entry in ifds[0])
@@ -1,8 +1,11 @@
 """Test modifying EXIF attributes and getting new file contents."""
 
 import binascii
+import io
 import os
+import socket
 import textwrap
+import threading
 
 from exif import Image
 from .get_file_baselines import GRAND_CANYON_THUMBNAIL, MODIFIED_NOISE_FILE_HEX_BASELINE
@@ -30,3 +33,59 @@ def test_get_thumbnail():
 
     file_hex = binascii.hexlify(image.get_thumbnail()).decode("utf8")
     assert "\n".join(textwrap.wrap(file_hex, 90)) == GRAND_CANYON_THUMBNAIL
+
+
+def test_write_to_file():
+    """Verify writing an image to a file object produces the same contents as ``get_file()``."""
+    image = Image(os.path.join(os.path.dirname(__file__), "noise.jpg"))
+    image.software = "Python"
+
+    output_file = io.BytesIO()
+    bytes_written = image.write_to(output_file)
+
+    assert output_file.getvalue() == image.get_file()
+    assert bytes_written == len(output_file.getvalue())
+
+
+def test_write_to_socket():
+    """Verify writing a memory-mapped image to a socket produces the same contents as ``get_file()``."""
+    with Image(
+        os.path.join(os.path.dirname(__file__), "grand_canyon.jpg"), memory_map=True
+    ) as image:
+        image.model = "Python"
+        expected_bytes = image.get_file()
+
+        sending_socket, receiving_socket = socket.socketpair()
+        received_chunks = []
+
+        def receive():
+            while True:
+                chunk = receiving_socket.recv(0x10000)
+                if not chunk:
+                    break
+                received_chunks.append(chunk)
+
+        receiver = threading.Thread(target=receive)
+        receiver.start()
+
+        with sending_socket:
+            assert image.write_to(sending_socket) == len(expected_bytes)
+
+        receiver.join()
+        receiving_socket.close()
+
+    assert b"".join(received_chunks) == expected_bytes
+
+
+def test_iter_chunks():
+    """Verify the chunks of a memory-mapped image are views of the mapped file."""
+    image_path = os.path.join(os.path.dirname(__file__), "grand_canyon.jpg")
+    with open(image_path, "rb") as image_file:
+        image_bytes = image_file.read()
+
+    with Image(image_path, memory_map=True) as image:
+        chunks = list(image.iter_chunks())
+
+        assert isinstance(chunks[0], memoryview)
+        assert isinstance(chunks[-1], memoryview)
+        assert b"".join(chunks) == image_bytes
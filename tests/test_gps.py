@@ -0,0 +1,80 @@
+"""Test reading GPS coordinates from many images into arrays."""
+
+import os
+
+import pytest
+
+from exif import GpsAltitudeRef, Image, read_gps_many
+
+TEST_DIR = os.path.dirname(__file__)
+IMAGE_NAMES = [
+    "florida_beach.jpg",
+    "gitlab_issue_67.jpg",
+    "grand_canyon.jpg",
+    "little_endian.jpg",
+    "noise.jpg",
+    "no_app1.png",
+    "does_not_exist.jpg",
+]
+
+
+def _get_path(file_name):
+    return os.path.join(TEST_DIR, file_name)
+
+
+def _get_decimal_degrees(image, tag):
+    degrees, minutes, seconds = image.get(tag)
+    sign = -1 if image.get(f"{tag}_ref") in ("S", "W") else 1
+    return sign * (degrees + minutes / 60 + seconds / 3600)
+
+
+def test_read_gps_many():
+    """Verify the coordinates match those read from each image individually."""
+    paths = [_get_path(file_name) for file_name in IMAGE_NAMES]
+    gps_arrays = read_gps_many(iter(paths))
+
+    for row, path in enumerate(paths):
+        image = Image(path) if os.path.exists(path) else None
+
+        if image is not None and image.has_exif and image.get("gps_latitude"):
+            assert gps_arrays.valid[row] == 1
+            assert gps_arrays.latitude[row] == pytest.approx(
+                _get_decimal_degrees(image, "gps_latitude")
+            )
+            assert gps_arrays.longitude[row] == pytest.approx(
+                _get_decimal_degrees(image, "gps_longitude")
+            )
+        else:
+            assert gps_arrays.valid[row] == 0
+            assert (gps_arrays.latitude[row], gps_arrays.longitude[row]) == (0, 0)
+
+        if image is not None and image.has_exif and image.get("gps_altitude"):
+            assert gps_arrays.altitude_valid[row] == 1
+            assert gps_arrays.altitude[row] == image.gps_altitude
+        else:
+            assert gps_arrays.altitude_valid[row] == 0
+
+    assert gps_arrays.latitude[IMAGE_NAMES.index("little_endian.jpg")] < 0  # south
+    assert gps_arrays.longitude[IMAGE_NAMES.index("grand_canyon.jpg")] < 0  # west
+
+
+def test_read_gps_many_references(tmp_path):
+    """Verify the references determine the sign and that coordinates without a reference are invalid."""
+    image = Image(_get_path("grand_canyon.jpg"))
+    image.gps_latitude_ref = "S"
+    image.gps_altitude_ref = GpsAltitudeRef.BELOW_SEA_LEVEL
+    southern_path = tmp_path / "southern.jpg"
+    image.save(southern_path)
+
+    del image.gps_longitude_ref
+    no_ref_path = tmp_path / "no_ref.jpg"
+    image.save(no_ref_path)
+
+    gps_arrays = read_gps_many(
+        [_get_path("grand_canyon.jpg"), southern_path, no_ref_path]
+    )
+
+    assert gps_arrays.latitude[1] == -gps_arrays.latitude[0]
+    assert gps_arrays.altitude[1] == -gps_arrays.altitude[0]
+    assert bytes(gps_arrays.valid) == b"\x01\x01\x00"
+    assert bytes(gps_arrays.altitude_valid) == b"\x01\x01\x01"
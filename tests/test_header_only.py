@@ -0,0 +1,75 @@
+"""Test opening images with only their header (i.e., up to the end of the EXIF metadata) loaded."""
+
+import io
+import os
+
+import pytest
+
+from exif import Image
+
+
+class CountingReader(io.BytesIO):
+
+    """In-memory file object that records how many bytes were read from it."""
+
+    def __init__(self, initial_bytes):
+        super().__init__(initial_bytes)
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        chunk = super().read(size)
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+def test_header_only_read():
+    """Verify header-only images report the same tags while only reading the start of the file."""
+    image_path = os.path.join(os.path.dirname(__file__), "grand_canyon.jpg")
+    with open(image_path, "rb") as image_file:
+        image_bytes = image_file.read()
+
+    reader = CountingReader(image_bytes)
+    image = Image(reader, header_only=True)
+
+    assert image.has_exif
+    assert image.get_all() == Image(image_bytes).get_all()
+    assert image.get_thumbnail() == Image(image_bytes).get_thumbnail()
+    assert reader.bytes_read < 0x10000 < len(image_bytes)
+
+
+def test_header_only_file_path():
+    """Verify opening a header-only image from a file path."""
+    image = Image(
+        os.path.join(os.path.dirname(__file__), "little_endian.jpg"), header_only=True
+    )
+
+    assert image.model == "Little Endian"
+
+
+def test_header_only_no_app1():
+    """Verify header-only reading stops at the start of scan of an image without EXIF metadata."""
+    image_path = os.path.join(os.path.dirname(__file__), "scanner_without_app1.jpg")
+    with open(image_path, "rb") as image_file:
+        image_bytes = image_file.read()
+
+    reader = CountingReader(image_bytes)
+    image = Image(reader, header_only=True)
+
+    assert not image.has_exif
+    assert reader.bytes_read < len(image_bytes)
+
+
+def test_header_only_is_read_only():
+    """Verify header-only images cannot be modified or exported."""
+    image = Image(
+        os.path.join(os.path.dirname(__file__), "noise.jpg"), header_only=True
+    )
+
+    with pytest.raises(RuntimeError, match="cannot modify an image opened with"):
+        image.software = "Python"
+
+    with pytest.raises(RuntimeError, match="cannot modify an image opened with"):
+        del image.software
+
+    with pytest.raises(RuntimeError, match="cannot get file contents of an image"):
+        image.get_file()
@@ -0,0 +1,68 @@
+"""Test decoding IFDs using the struct-based fast path."""
+
+import os
+import struct
+
+import pytest
+from plum.buffer import Buffer
+
+from exif import Image
+from exif._datatypes import Ifd, IfdLe, TiffByteOrder
+from exif._ifd_decoder import divide_rationals, get_decoder
+
+# pylint: disable=protected-access
+
+
+@pytest.mark.parametrize("file_name", ["grand_canyon.jpg", "little_endian.jpg"])
+def test_read_ifd(file_name):
+    """Verify the decoded IFD tags match those unpacked by the plum IFD structures."""
+    app1 = Image(os.path.join(os.path.dirname(__file__), file_name))._segments["APP1"]
+    ifd_cls = Ifd if app1.endianness == TiffByteOrder.BIG else IfdLe
+
+    for ifd_offset in app1.ifd_pointers.values():
+        ifd_tags, next_ifd_offset = get_decoder(app1.endianness).read_ifd(
+            app1.body_bytes, ifd_offset
+        )
+
+        body_bytes_buffer = Buffer(app1.body_bytes)
+        body_bytes_buffer.offset = ifd_offset
+        ifd_t = body_bytes_buffer.unpack(ifd_cls)
+
+        assert next_ifd_offset == ifd_t.next
+        assert ifd_tags == [
+            (tag_t.tag_id, tag_t.type, tag_t.value_count, tag_t.value_offset)
+            for tag_t in ifd_t.tags
+        ]
+
+
+def test_read_truncated_ifd():
+    """Verify decoding an IFD that extends beyond the end of the APP1 body raises an error."""
+    decoder = get_decoder(TiffByteOrder.BIG)
+
+    with pytest.raises(struct.error):
+        decoder.read_ifd(
+            b"\x00\x02" + bytes(12), 0
+        )  # 2 tags, but only enough bytes for 1
+
+
+@pytest.mark.parametrize(
+    "byte_order", [TiffByteOrder.BIG, TiffByteOrder.LITTLE], ids=["big", "little"]
+)
+def test_read_rationals(byte_order):
+    """Verify consecutive RATIONAL and SRATIONAL values are decoded at once (with 0/0 decoded as 0)."""
+    decoder = get_decoder(byte_order)
+    rational_bytes = b"".join(
+        decoder.srational.pack(*fields) for fields in [(3, 2), (0, 0), (-1, 4)]
+    )
+
+    fields = decoder.read_rationals(b"\xff" + rational_bytes, 1, 3, signed=True)
+
+    assert fields == (3, 2, 0, 0, -1, 4)
+    assert decoder.read_rationals(rational_bytes, 16, 1) == (2**32 - 1, 4)
+    assert divide_rationals(fields) == [1.5, 0, -0.25]
+
+    with pytest.raises(struct.error):
+        decoder.read_rationals(rational_bytes, 8, 3)
+
+    with pytest.raises(ZeroDivisionError):
+        divide_rationals((1, 0))
@@ -0,0 +1,87 @@
+"""Test recording per-phase timing and work counters."""
+
+import os
+import threading
+
+from exif import Image, Instrumentation
+
+TEST_DIR = os.path.dirname(__file__)
+
+
+def _read_image_bytes():
+    with open(os.path.join(TEST_DIR, "grand_canyon.jpg"), "rb") as image_file:
+        return image_file.read()
+
+
+def test_phases_and_counters():
+    """Verify each phase and counter is recorded while the instrumentation is active."""
+    image_bytes = _read_image_bytes()
+
+    with Instrumentation() as instrumentation:
+        image = Image(image_bytes)
+        assert image.model == "iPhone 7"
+        assert image.make == "Apple"
+        image.get_file()
+
+    assert {
+        phase: stats.call_count for phase, stats in instrumentation.phases.items()
+    } == {
+        "parse_segments": 1,
+        "parse_ifds": 1,
+        "read_tag": 2,
+        "get_file": 1,
+    }
+    assert all(stats.seconds >= 0 for stats in instrumentation.phases.values())
+
+    counters = instrumentation.counters
+    assert 0 < counters["bytes_scanned"] <= len(image_bytes)
+    assert counters["ifds_visited"] >= 3  # IFD 0, EXIF, and GPS
+    assert counters["tags_built"] == 2
+
+    assert instrumentation.as_dict()["counters"] == counters
+    assert instrumentation.as_dict()["phases"]["read_tag"]["call_count"] == 2
+
+
+def test_serialize_phase():
+    """Verify adding a tag records rebuilding the APP1 body and relocating the values stored after each IFD."""
+    image = Image(_read_image_bytes())
+
+    with Instrumentation() as instrumentation:
+        image.copyright = "Copyright 2026"
+
+    assert instrumentation.phases["serialize_ifds"].call_count == 1
+    assert instrumentation.counters["values_relocated"] > 0
+
+
+def test_disabled():
+    """Verify nothing is recorded outside of (or after) the instrumentation's context."""
+    instrumentation = Instrumentation()
+    Image(_read_image_bytes()).get_all()
+
+    with instrumentation:
+        pass
+
+    Image(_read_image_bytes()).get_all()
+    assert (instrumentation.phases, instrumentation.counters) == ({}, {})
+
+
+def test_on_phase_callback():
+    """Verify the callback is called with each phase's name and wall time."""
+    calls = []
+
+    with Instrumentation(on_phase=lambda phase, seconds: calls.append(phase)):
+        Image(_read_image_bytes())
+
+    assert calls == ["parse_ifds", "parse_segments"]  # inner phase ends first
+
+
+def test_thread_isolation():
+    """Verify measurements of other threads aren't recorded by the active instrumentation."""
+    image_bytes = _read_image_bytes()
+
+    with Instrumentation() as instrumentation:
+        thread = threading.Thread(target=Image, args=(image_bytes,))
+        thread.start()
+        thread.join()
+
+    assert (instrumentation.phases, instrumentation.counters) == ({}, {})
@@ -0,0 +1,114 @@
+"""Test lazily constructing IFD tag parsers."""
+
+import os
+
+import pytest
+
+from exif import Image, Orientation
+from exif._app1_metadata import App1MetaData
+from exif._constants import ATTRIBUTE_ID_MAP
+from exif._datatypes import ExifType
+from exif.ifd_tag import (
+    Ascii,
+    BaseIfdTag,
+    ExifVersion,
+    Rational,
+    Short,
+    UserComment,
+    WindowsXp,
+)
+from exif.synthetic import generate_image
+
+# pylint: disable=protected-access
+
+
+def test_lazy_tag_construction(monkeypatch):
+    """Verify tag parsers are only constructed when (and the first time) their tag is accessed."""
+    constructed_tag_ids = []
+    original_tag_factory = App1MetaData._tag_factory
+
+    def tag_factory(self, tag_id, tag_type, offset):
+        constructed_tag_ids.append(tag_id)
+        return original_tag_factory(self, tag_id, tag_type, offset)
+
+    monkeypatch.setattr(App1MetaData, "_tag_factory", tag_factory)
+
+    image = Image(os.path.join(os.path.dirname(__file__), "grand_canyon.jpg"))
+    assert not constructed_tag_ids
+    assert "orientation" in image.list_all()
+    assert not constructed_tag_ids
+
+    assert image.orientation == Orientation.TOP_LEFT
+    assert image.orientation == Orientation.TOP_LEFT
+    assert constructed_tag_ids == [0x0112]
+
+    image.orientation = Orientation.BOTTOM_RIGHT
+    assert image.orientation == Orientation.BOTTOM_RIGHT
+    assert constructed_tag_ids == [0x0112]
+
+
+def test_compact_tag_index():
+    """Verify the tag index records each tag's parent IFD and that tag parsers don't have instance dictionaries."""
+    app1 = Image(os.path.join(os.path.dirname(__file__), "grand_canyon.jpg"))._segments[
+        "APP1"
+    ]
+
+    assert app1.ifd_tags.get_parent_ifd(0x010F) == 0  # make
+    assert app1.ifd_tags.get_parent_ifd(0x829A) == "exif"  # exposure time
+    assert app1.ifd_tags.get_parent_ifd(0x0002) == "gps"  # latitude
+    assert app1.ifd_tags.get_parent_ifd(0x0201) == 1  # thumbnail offset
+
+    for tag_id in app1.ifd_tags:
+        assert not hasattr(app1.ifd_tags[tag_id], "__dict__")
+
+    del app1.ifd_tags[0x010F]
+    assert 0x010F not in app1.ifd_tags
+    with pytest.raises(KeyError):
+        app1.ifd_tags.get_parent_ifd(0x010F)
+
+
+def test_long_ifd_chain():
+    """Verify parsing more chained IFDs than fit in a byte (with later IFDs overriding the tags of earlier ones)."""
+    image = Image(generate_image(tag_count=8, extra_ifd_count=300))
+    app1 = image._segments["APP1"]
+
+    assert (
+        len(app1.ifd_pointers) == 304
+    )  # IFD 0 through 301 along with the EXIF and GPS IFDs
+    assert app1.ifd_tags.get_parent_ifd(ATTRIBUTE_ID_MAP["image_width"]) == 301
+    assert app1.ifd_tags.get_parent_ifd(ATTRIBUTE_ID_MAP["compression"]) == 1
+    image.image_width  # pylint: disable=pointless-statement
+
+    tag_locations = {
+        tag_id: app1.ifd_tags.get_tag_location(tag_id) for tag_id in app1.ifd_tags
+    }
+    del app1.ifd_tags[ATTRIBUTE_ID_MAP["compression"]]
+    del tag_locations[ATTRIBUTE_ID_MAP["compression"]]
+
+    assert ATTRIBUTE_ID_MAP["compression"] not in app1.ifd_tags
+    assert {
+        tag_id: app1.ifd_tags.get_tag_location(tag_id) for tag_id in app1.ifd_tags
+    } == tag_locations
+
+
+@pytest.mark.parametrize(
+    "tag_id, tag_type, expected_cls",
+    [
+        (0x9C9B, ExifType.BYTE, WindowsXp),  # xp_title
+        (0x9C9F, ExifType.BYTE, WindowsXp),  # xp_subject
+        (0x9000, ExifType.UNDEFINED, ExifVersion),  # exif_version
+        (0x9286, ExifType.UNDEFINED, UserComment),  # user_comment
+        (0x0112, ExifType.SHORT, Short),  # orientation
+        (0x010F, ExifType.ASCII, Ascii),  # make
+        (0xEA1C, ExifType.UNDEFINED, BaseIfdTag),  # unknown tag ID
+        (0xEA1C, ExifType.RATIONAL, Rational),  # unknown tag ID
+        (0x0112, 0x1234, BaseIfdTag),  # nonstandard type
+    ],
+)
+def test_tag_factory_dispatch(tag_id, tag_type, expected_cls):
+    """Verify the tag parser class selected for each tag ID and type."""
+    app1 = Image(os.path.join(os.path.dirname(__file__), "grand_canyon.jpg"))._segments[
+        "APP1"
+    ]
+
+    assert type(app1._tag_factory(tag_id, tag_type, 0)) is expected_cls
@@ -0,0 +1,57 @@
+"""Test opening memory-mapped images."""
+
+import os
+
+import pytest
+
+from exif import Image
+
+# pylint: disable=protected-access
+
+GRAND_CANYON = os.path.join(os.path.dirname(__file__), "grand_canyon.jpg")
+
+
+def test_memory_map_read():
+    """Verify memory-mapped images slice the file without copying it."""
+    with open(GRAND_CANYON, "rb") as image_file:
+        image_bytes = image_file.read()
+
+    with Image(GRAND_CANYON, memory_map=True) as image:
+        assert isinstance(image._segments["preceding"], memoryview)
+        assert isinstance(image._segments["succeeding"], memoryview)
+
+        assert image.get_all() == Image(image_bytes).get_all()
+        assert image.get_thumbnail() == Image(image_bytes).get_thumbnail()
+        assert image.get_file() == image_bytes
+
+
+def test_memory_map_modify():
+    """Verify modifying a memory-mapped image produces the same file as an image read into memory."""
+    baseline_image = Image(GRAND_CANYON)
+    baseline_image.model = "Python"
+    baseline_image.light_source = 1
+
+    with Image(GRAND_CANYON, memory_map=True) as image:
+        image.model = "Python"
+        image.light_source = 1
+
+        assert image.get_file() == baseline_image.get_file()
+
+
+def test_memory_map_close():
+    """Verify closing a memory-mapped image releases the mapping."""
+    image = Image(GRAND_CANYON, memory_map=True)
+    image.close()
+
+    assert image._memory_map.mapping.closed
+    with pytest.raises(ValueError):
+        image.get_file()
+
+    image.close()  # closing more than once is harmless
+
+
+def test_memory_map_requires_path():
+    """Verify memory mapping is only available when opening file paths."""
+    with open(GRAND_CANYON, "rb") as image_file:
+        with pytest.raises(ValueError, match="memory mapping requires a file path"):
+            Image(image_file, memory_map=True)
@@ -0,0 +1,132 @@
+"""Test caching EXIF metadata in a SQLite database file."""
+
+import os
+import shutil
+
+import pytest
+
+from exif import Image, MetadataCache
+from exif.synthetic import write_corpus
+
+# pylint: disable=protected-access
+
+TEST_DIR = os.path.dirname(__file__)
+
+
+@pytest.fixture(name="image_path")
+def fixture_image_path(tmp_path):
+    """Copy of a test image that can be modified."""
+    image_path = str(tmp_path / "grand_canyon.jpg")
+    shutil.copyfile(os.path.join(TEST_DIR, "grand_canyon.jpg"), image_path)
+    return image_path
+
+
+def test_cache_hit(tmp_path, image_path, monkeypatch):
+    """Verify unchanged files are looked up from the cache (across sessions) without being opened."""
+    expected_tags = Image(image_path).get_all()
+
+    with MetadataCache(tmp_path / "cache.db") as cache:
+        assert cache.get_all(image_path) == expected_tags
+        assert (cache.hit_count, cache.miss_count, len(cache)) == (0, 1, 1)
+
+    def fail_open(*args, **kwargs):
+        raise AssertionError("file opened on cache hit")
+
+    monkeypatch.setattr("builtins.open", fail_open)
+
+    with MetadataCache(tmp_path / "cache.db") as cache:
+        assert cache.get_all(image_path) == expected_tags
+        assert (cache.hit_count, cache.miss_count, len(cache)) == (1, 0, 1)
+
+
+def test_cache_invalidation(tmp_path, image_path):
+    """Verify modified files are read again (replacing their previous entry)."""
+    with MetadataCache(tmp_path / "cache.db") as cache:
+        cache.get_all(image_path)
+
+        image = Image(image_path)
+        image.model = "Modified"
+        image.save()
+        stat_result = os.stat(image_path)
+        os.utime(
+            image_path,
+            ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000),
+        )
+
+        assert cache.get_all(image_path)["model"] == "Modified"
+        assert (cache.hit_count, cache.miss_count, len(cache)) == (0, 2, 1)
+
+
+def test_cache_eviction(tmp_path):
+    """Verify the least recently used entries are evicted to stay within the size limits."""
+    paths = write_corpus(tmp_path / "corpus", 4)
+
+    with MetadataCache(tmp_path / "cache.db", max_entries=3) as cache:
+        for path in paths[:3]:
+            cache.get_all(path)
+
+        cache.get_all(paths[0])  # most recently used
+        cache.get_all(paths[3])  # evicts the least recently used (i.e., paths[1])
+        assert len(cache) == 3
+
+        cache.get_all(paths[0])
+        cache.get_all(paths[2])
+        assert cache.miss_count == 4
+
+        cache.get_all(paths[1])
+        assert cache.miss_count == 5
+
+    with MetadataCache(tmp_path / "cache.db") as cache:
+        max_nbytes = cache.nbytes - 1
+
+    with MetadataCache(tmp_path / "cache.db", max_nbytes=max_nbytes) as cache:
+        assert len(cache) == 2  # evicted when opened
+        assert cache.nbytes <= max_nbytes
+
+        cache.clear()
+        assert (len(cache), cache.nbytes) == (0, 0)
+
+
+def test_cache_shared_file(tmp_path):
+    """Verify eviction recounts entries modified through another connection to the same database file."""
+    paths = write_corpus(tmp_path / "corpus", 4)
+
+    with MetadataCache(tmp_path / "cache.db", max_entries=3) as cache:
+        for path in paths[:3]:
+            cache.get_all(path)
+        cache.commit()
+
+        with MetadataCache(tmp_path / "cache.db") as other_cache:
+            other_cache.clear()
+
+        cache.get_all(paths[3])  # not evicted since the table is within its limit
+        assert len(cache) == 1
+
+        cache.get_all(paths[3])
+        assert (cache.hit_count, cache.miss_count) == (1, 4)
+
+
+def test_cache_eviction_batch(tmp_path):
+    """Verify evicted entries are deleted at once without committing (and releasing the lock) partway through."""
+    paths = write_corpus(tmp_path / "corpus", 5)
+
+    with MetadataCache(
+        tmp_path / "cache.db", max_entries=4, commit_interval=1
+    ) as cache:
+        for path in paths[:4]:
+            cache.get_all(path)
+
+        statements = []
+        cache._settings = cache._settings._replace(max_entries=1)
+        cache._connection.set_trace_callback(statements.append)
+        cache.get_all(paths[4])
+
+        eviction = statements[statements.index("BEGIN IMMEDIATE") :]
+        assert [statement.split()[0] for statement in eviction] == [
+            "BEGIN",
+            "SELECT",  # recount
+            "SELECT",  # least recently used entries
+            "DELETE",
+            "COMMIT",
+        ]
+        assert len(cache) == 1
@@ -40,8 +40,9 @@ class TestModifyExif(unittest.TestCase):
         assert self.image.model == "My Artificially Set Camera Attribute"
 
         # Verify pre-existing attributes can still be read as expected since this deletes and re-adds under-the-hood.
+        # (The thumbnail offset changes since the APP1 body is re-serialized.)
         for attribute, func, value in read_attributes_grand_canyon:
-            if attribute != "model":
+            if attribute not in ["model", "jpeg_interchange_format"]:
                 assert func(getattr(self.image, attribute)) in value
 
     def test_index_modifier(self):
@@ -0,0 +1,63 @@
+"""Test reading EXIF metadata from many images at once."""
+
+import os
+
+import pytest
+
+from exif import Image, read_many
+
+TEST_DIR = os.path.dirname(__file__)
+IMAGE_NAMES = ["grand_canyon.jpg", "little_endian.jpg", "noise.jpg", "user_comment.jpg"]
+
+
+def _get_path(file_name):
+    return os.path.join(TEST_DIR, file_name)
+
+
+@pytest.mark.parametrize("workers", [0, 2], ids=["in_process", "process_pool"])
+def test_read_many(workers):
+    """Verify reading all tags from many images matches reading each image individually."""
+    paths = [_get_path(file_name) for file_name in IMAGE_NAMES]
+    results = list(read_many(iter(paths), workers=workers, chunk_size=1))
+
+    assert sorted(result.path for result in results) == sorted(paths)
+    for result in results:
+        assert result.error is None
+        with open(result.path, "rb") as image_file:
+            assert result.tags == Image(image_file).get_all()
+
+
+def test_read_many_tags():
+    """Verify only the requested tags present in each image are read."""
+    results = {
+        os.path.basename(result.path): result
+        for result in read_many(
+            [_get_path("grand_canyon.jpg"), _get_path("noise.jpg")],
+            tags=["make", "software"],
+            workers=0,
+        )
+    }
+
+    assert results["grand_canyon.jpg"].tags == {"make": "Apple", "software": "11.2.6"}
+    assert results["noise.jpg"].tags == {"software": "Adobe Photoshop CS4 Windows"}
+
+
+@pytest.mark.parametrize("workers", [0, 1], ids=["in_process", "process_pool"])
+def test_read_many_errors(workers):
+    """Verify errors reading individual files are captured in their results."""
+    paths = [
+        _get_path("does_not_exist.jpg"),
+        _get_path("invalid_exif_app1.png"),
+        _get_path("grand_canyon.jpg"),
+    ]
+    results = {
+        os.path.basename(result.path): result
+        for result in read_many(paths, tags=["make"], workers=workers)
+    }
+
+    assert isinstance(results["does_not_exist.jpg"].error, ValueError)
+    assert results["invalid_exif_app1.png"] == (paths[1], {}, None)  # no EXIF
+    assert results["grand_canyon.jpg"] == (paths[2], {"make": "Apple"}, None)
+
+    with pytest.raises(ValueError, match="unknown image attribute"):
+        next(read_many(paths, tags=["not_a_tag"], workers=workers))
@@ -0,0 +1,97 @@
+"""Test saving images to files (including patching EXIF metadata in place)."""
+
+import os
+import shutil
+
+import pytest
+
+from exif import Image, Orientation
+import exif._image
+
+
+@pytest.fixture(name="image_path")
+def fixture_image_path(tmp_path):
+    """Copy a sample image to a temporary directory."""
+    image_path = tmp_path / "grand_canyon.jpg"
+    shutil.copyfile(
+        os.path.join(os.path.dirname(__file__), "grand_canyon.jpg"), image_path
+    )
+    return str(image_path)
+
+
+@pytest.fixture(name="writes")
+def fixture_writes(monkeypatch):
+    """Record in-place writes made when saving images."""
+    writes = []
+    original_write_at = exif._image._write_at  # pylint: disable=protected-access
+
+    def write_at(image_file, data, offset):
+        writes.append((offset, bytes(data)))
+        original_write_at(image_file, data, offset)
+
+    monkeypatch.setattr(exif._image, "_write_at", write_at)
+    return writes
+
+
+@pytest.mark.parametrize("memory_map", [False, True], ids=["read", "memory_map"])
+def test_save_in_place(image_path, writes, memory_map):
+    """Verify modifying existing tags only writes the modified bytes back to the file."""
+    with open(image_path, "rb") as image_file:
+        original_bytes = image_file.read()
+
+    with Image(image_path, memory_map=memory_map) as image:
+        image.orientation = Orientation.BOTTOM_RIGHT
+        image.model = "Phone"
+        expected_bytes = image.get_file()
+        image.save()
+
+    with open(image_path, "rb") as image_file:
+        saved_bytes = image_file.read()
+
+    assert saved_bytes == expected_bytes
+    assert len(saved_bytes) == len(original_bytes)
+    assert 0 < sum(len(data) for _, data in writes) < 64
+
+    image = Image(image_path)
+    assert image.orientation == Orientation.BOTTOM_RIGHT
+    assert image.model == "Phone"
+
+
+def test_save_layout_change(image_path, writes):
+    """Verify adding tags rewrites the entire file (and later edits are patched relative to it)."""
+    image = Image(image_path)
+    image.copyright = "Python"
+    image.save()
+
+    assert not writes
+    with open(image_path, "rb") as image_file:
+        assert image_file.read() == image.get_file()
+
+    image.copyright = "Py"
+    image.save()
+
+    assert writes
+    with open(image_path, "rb") as image_file:
+        assert image_file.read() == image.get_file()
+    assert Image(image_path).copyright == "Py"
+
+
+def test_save_other_path(image_path, tmp_path):
+    """Verify saving to a different path writes the entire file."""
+    image = Image(image_path)
+    image.model = "Phone"
+
+    new_path = str(tmp_path / "new.jpg")
+    image.save(new_path)
+
+    with open(new_path, "rb") as image_file:
+        assert image_file.read() == image.get_file()
+
+
+def test_save_requires_path(image_path):
+    """Verify saving an image not opened from a file path requires a path."""
+    with open(image_path, "rb") as image_file:
+        image = Image(image_file)
+
+    with pytest.raises(ValueError, match="must specify a path to save an image"):
+        image.save()
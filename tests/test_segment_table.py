@@ -0,0 +1,57 @@
+"""Test traversing JPEG marker segments by their length fields."""
+
+import os
+
+from exif import Image
+from exif._constants import ExifMarkers
+
+# pylint: disable=protected-access
+
+
+def _read_test_image(file_name):
+    with open(os.path.join(os.path.dirname(__file__), file_name), "rb") as image_file:
+        return image_file.read()
+
+
+def test_segment_table():
+    """Verify the segment table of an image without EXIF metadata ends at the start of scan."""
+    image = Image(_read_test_image("scanner_without_app1.jpg"))
+
+    assert not image.has_exif
+    assert [(segment.marker, segment.offset) for segment in image._segment_table] == [
+        (ExifMarkers.SOI, 0),
+        (ExifMarkers.SEG_PREFIX + b"\xe0", 2),
+        (ExifMarkers.DQT, 20),
+        (ExifMarkers.DQT, 89),
+        (ExifMarkers.SOF, 158),
+        (ExifMarkers.DHT, 177),
+        (ExifMarkers.DRI, 597),
+        (ExifMarkers.SOS, 603),
+    ]
+
+
+def test_app1_at_odd_offset():
+    """Verify an EXIF APP1 segment is found when it begins at an odd offset."""
+    image_bytes = _read_test_image("little_endian.jpg")
+    # Insert an APP3 segment with a 1 byte payload before the APP1 segment.
+    odd_segment = ExifMarkers.SEG_PREFIX + b"\xe3\x00\x03\x00"
+    image_bytes = image_bytes[:2] + odd_segment + image_bytes[2:]
+
+    image = Image(image_bytes)
+
+    assert image.has_exif
+    assert image.model == "Little Endian"
+    assert image.get_file() == image_bytes
+
+
+def test_skip_non_exif_app1():
+    """Verify APP1 segments without the EXIF identifier (e.g., XMP) are skipped."""
+    image_bytes = _read_test_image("little_endian.jpg")
+    xmp_segment = ExifMarkers.APP1 + b"\x00\x0chttp://ns."
+    image_bytes = image_bytes[:2] + xmp_segment + image_bytes[2:]
+
+    image = Image(image_bytes)
+
+    assert image.has_exif
+    assert image.model == "Little Endian"
+    assert image.get_file() == image_bytes
@@ -0,0 +1,81 @@
+"""Test parsing EXIF metadata incrementally as image bytes arrive."""
+
+import os
+
+import pytest
+
+from exif import ExifStreamParser, Image
+
+# pylint: disable=protected-access
+
+
+def _read_test_image(file_name):
+    with open(os.path.join(os.path.dirname(__file__), file_name), "rb") as image_file:
+        return image_file.read()
+
+
+def _feed(parser, image_bytes, chunk_size):
+    """Feed image bytes in chunks until the parser is done and return the metadata and maximum buffer size."""
+    metadata = None
+    max_buffer_len = 0
+
+    for offset in range(0, len(image_bytes), chunk_size):
+        result = parser.feed(image_bytes[offset : offset + chunk_size])
+        max_buffer_len = max(max_buffer_len, len(parser._buffer))
+
+        if result is not None:
+            assert metadata is None
+            metadata = result
+
+        if parser.done:
+            break
+
+    return metadata, max_buffer_len
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 0x1000, 0x100000])
+@pytest.mark.parametrize(
+    "file_name", ["grand_canyon.jpg", "little_endian.jpg", "windows_xp_tags.jpg"]
+)
+def test_stream_parser(file_name, chunk_size):
+    """Verify metadata fed in chunks matches that of the whole image."""
+    image_bytes = _read_test_image(file_name)
+    image = Image(image_bytes)
+    app1_len = len(image._segments["APP1"].get_segment_bytes())
+
+    parser = ExifStreamParser()
+    metadata, max_buffer_len = _feed(parser, image_bytes, chunk_size)
+
+    assert parser.done
+    assert parser.metadata is metadata
+    assert metadata.get_all() == image.get_all()
+    assert (
+        metadata._segments["APP1"].thumbnail_bytes
+        == image._segments["APP1"].thumbnail_bytes
+    )
+    assert max_buffer_len <= app1_len + chunk_size
+    assert parser.feed(b"\xff" * 10) is None  # ignores the rest of the image
+
+
+@pytest.mark.parametrize(
+    "file_name", ["no_app1.png", "scanner_without_app1.jpg", "invalid_exif_app1.png"]
+)
+def test_stream_parser_no_exif(file_name):
+    """Verify the parser finishes without metadata if the image does not contain any."""
+    image_bytes = _read_test_image(file_name)
+    parser = ExifStreamParser()
+
+    assert _feed(parser, image_bytes, 64) == (None, 0)
+    assert parser.done
+    assert parser.metadata is None
+
+
+def test_stream_parser_tags():
+    """Verify only the requested tags are parsed."""
+    parser = ExifStreamParser(tags=["orientation", "datetime_original"])
+    metadata, _ = _feed(parser, _read_test_image("grand_canyon.jpg"), 0x1000)
+
+    assert metadata.list_all() == ["orientation", "datetime_original"]
+
+    with pytest.raises(ValueError, match="unknown image attribute"):
+        ExifStreamParser(tags=["not_a_tag"])
@@ -0,0 +1,94 @@
+"""Test generating synthetic images with EXIF metadata."""
+
+import os
+
+import pytest
+
+from exif import Image, extract_thumbnail
+from exif._constants import ATTRIBUTE_ID_MAP
+from exif._datatypes import TiffByteOrder
+from exif.synthetic import generate_image, generate_images, write_corpus
+
+# pylint: disable=protected-access
+
+
+def test_deterministic():
+    """Verify the same seed always generates the same image (and different seeds different images)."""
+    assert generate_image(seed=1) == generate_image(seed=1)
+    assert generate_image(seed=1) != generate_image(seed=2)
+    assert list(generate_images(3, seed="corpus")) == list(
+        generate_images(3, seed="corpus")
+    )
+
+
+@pytest.mark.parametrize(
+    "byte_order", [TiffByteOrder.BIG, TiffByteOrder.LITTLE], ids=["big", "little"]
+)
+def test_generate_image(byte_order):
+    """Verify generated images parse with the requested byte order, tags, thumbnail, and IFDs."""
+    image_bytes = generate_image(
+        seed=byte_order,
+        tag_count=250,
+        byte_order=byte_order,
+        ascii_nbytes=64,
+        maker_note_nbytes=8192,
+        thumbnail_nbytes=4096,
+        extra_ifd_count=2,
+    )
+    image = Image(image_bytes)
+    app1 = image._segments["APP1"]
+
+    assert app1.endianness == byte_order
+    assert set(app1.ifd_pointers) == {0, 1, 2, 3, "exif", "gps"}
+    assert len(app1.get_tag_list()) >= 250
+
+    assert app1.ifd_tags[ATTRIBUTE_ID_MAP["maker_note"]]._decode().value_count == 8192
+    assert len(image.get_thumbnail()) == 4096
+    assert extract_thumbnail(image_bytes) == image.get_thumbnail()
+    assert image.get_file() == image_bytes
+
+    for tag_name in image.list_all():
+        if tag_name != "maker_note":
+            getattr(image, tag_name)  # every known tag is readable
+
+
+def test_generate_image_too_large():
+    """Verify generating EXIF metadata larger than an APP1 segment raises an error."""
+    with pytest.raises(ValueError, match="exceeds the maximum APP1 segment size"):
+        generate_image(maker_note_nbytes=0x10000)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"ascii_nbytes": 0},
+        {"image_data_nbytes": 0},
+        {"thumbnail_nbytes": 3},
+        {"thumbnail_nbytes": 4},
+    ],
+    ids=["ascii", "image_data", "thumbnail_3", "thumbnail_4"],
+)
+def test_generate_image_empty_values(kwargs):
+    """Verify generating images with empty random values (e.g., a thumbnail consisting of only its markers)."""
+    image_bytes = generate_image(seed=3, **kwargs)
+    assert generate_image(seed=3, **kwargs) == image_bytes
+
+    image = Image(image_bytes)
+    assert image.get_file() == image_bytes
+
+    for tag_name in image.list_all():
+        getattr(image, tag_name)
+
+
+def test_write_corpus(tmp_path):
+    """Verify writing a corpus writes each generated image."""
+    paths = write_corpus(tmp_path / "corpus", 3, seed=7, byte_order=None)
+
+    assert [os.path.basename(path) for path in paths] == [
+        "synthetic_0000000.jpg",
+        "synthetic_0000001.jpg",
+        "synthetic_0000002.jpg",
+    ]
+    for path, image_bytes in zip(paths, generate_images(3, seed=7, byte_order=None)):
+        with open(path, "rb") as image_file:
+            assert image_file.read() == image_bytes
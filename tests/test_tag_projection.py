@@ -0,0 +1,100 @@
+"""Test parsing only a requested subset of tags."""
+
+import os
+
+import pytest
+
+from exif import Image
+from exif._app1_metadata import App1MetaData
+
+# pylint: disable=protected-access
+
+TEST_IMAGES = ["grand_canyon.jpg", "little_endian.jpg", "noise.jpg", "user_comment.jpg"]
+
+
+def _read_test_image(file_name):
+    with open(os.path.join(os.path.dirname(__file__), file_name), "rb") as image_file:
+        return image_file.read()
+
+
+@pytest.fixture(name="parsed_ifds")
+def fixture_parsed_ifds(monkeypatch):
+    """Record which IFDs are parsed."""
+    parsed_ifds = []
+    original_iter_ifd_tags = App1MetaData._iter_ifd_tags
+
+    def _iter_ifd_tags(self, ifd_key):
+        parsed_ifds.append(ifd_key)
+        return original_iter_ifd_tags(self, ifd_key)
+
+    monkeypatch.setattr(App1MetaData, "_iter_ifd_tags", _iter_ifd_tags)
+    return parsed_ifds
+
+
+@pytest.mark.parametrize("file_name", TEST_IMAGES)
+def test_projection_values(file_name):
+    """Verify projected tag values match those of a fully-parsed image."""
+    image_bytes = _read_test_image(file_name)
+    all_tags = Image(image_bytes).get_all()
+    requested_tags = {"make", "model", "orientation", "datetime_original", "flash"}
+    requested_tags |= {"gps_latitude", "gps_longitude", "user_comment"}
+
+    image = Image(image_bytes, tags=requested_tags)
+
+    assert image.get_all() == {
+        tag: value for tag, value in all_tags.items() if tag in requested_tags
+    }
+
+
+@pytest.mark.parametrize(
+    "tags, expected_ifds",
+    [
+        ({"datetime_original", "f_number"}, [0, "exif"]),
+        ({"gps_latitude"}, [0, "gps"]),
+        ({"make", "copyright"}, [0]),
+        ({"x_resolution"}, [0, 1]),
+        (set(), [0]),
+    ],
+)
+def test_projection_skips_ifds(parsed_ifds, tags, expected_ifds):
+    """Verify only the IFDs that can contain the requested tags are parsed."""
+    image = Image(_read_test_image("grand_canyon.jpg"), tags=tags)
+
+    assert parsed_ifds == expected_ifds
+    assert len(image._segments["APP1"].ifd_tags) <= len(tags)
+
+
+def test_projection_unrequested_tag():
+    """Verify accessing a tag that was not requested."""
+    image = Image(_read_test_image("grand_canyon.jpg"), tags=["make", "copyright"])
+
+    assert image.list_all() == ["make"]
+    assert image.get("model") is None
+
+    with pytest.raises(AttributeError, match="was not requested"):
+        image.model  # pylint: disable=pointless-statement
+
+    with pytest.raises(AttributeError, match="does not have attribute"):
+        image.copyright  # pylint: disable=pointless-statement
+
+
+def test_projection_modify():
+    """Verify modifying a projected image parses and preserves every tag."""
+    image_bytes = _read_test_image("grand_canyon.jpg")
+    image = Image(image_bytes, tags=["make"])
+    image.copyright = "Python"
+
+    expected_image = Image(image_bytes)
+    expected_image.copyright = "Python"
+
+    for reloaded_image in [image, Image(image.get_file())]:
+        assert reloaded_image.get_all() == expected_image.get_all()
+        assert reloaded_image.get_thumbnail() == expected_image.get_thumbnail()
+
+    assert image.model == "iPhone 7"
+
+
+def test_projection_unknown_tag():
+    """Verify requesting an unknown tag raises an error."""
+    with pytest.raises(ValueError, match="unknown image attribute not_a_tag"):
+        Image(_read_test_image("grand_canyon.jpg"), tags=["make", "not_a_tag"])
@@ -0,0 +1,143 @@
+"""Test locating and extracting the thumbnail using the IFD 1 offset and length tags."""
+
+import io
+import os
+
+import pytest
+
+from exif import Image, extract_thumbnail, extract_thumbnails
+from exif._constants import THUMBNAIL_LENGTH_TAG_ID, THUMBNAIL_OFFSET_TAG_ID
+from exif._ifd_decoder import IFD_TAG_VALUE_OFFSET
+
+# pylint: disable=protected-access
+
+
+TEST_DIR = os.path.dirname(__file__)
+
+
+class _ReadCountingFile(io.BytesIO):
+
+    """In-memory file that counts the number of bytes read from it."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.nbytes_read = 0
+
+    def read(self, size=-1):
+        read_bytes = super().read(size)
+        self.nbytes_read += len(read_bytes)
+        return read_bytes
+
+
+def _get_path(file_name):
+    return os.path.join(TEST_DIR, file_name)
+
+
+def _open_image():
+    return Image(_get_path("grand_canyon.jpg"))
+
+
+def test_thumbnail_shares_body():
+    """Verify the thumbnail is a view of the APP1 body bytes at the location IFD 1 specifies."""
+    image = _open_image()
+    app1 = image._segments["APP1"]
+    thumbnail = image.get_thumbnail_view()
+
+    assert isinstance(thumbnail, memoryview)
+    assert thumbnail.obj is app1.body_bytes
+    assert len(thumbnail) == image.jpeg_interchange_format_length
+    assert bytes(thumbnail[:2]) == b"\xff\xd8"
+    assert bytes(thumbnail[-2:]) == b"\xff\xd9"
+    assert image.get_thumbnail() == thumbnail
+    assert isinstance(image.get_thumbnail(), bytes)
+
+
+def test_thumbnail_containing_end_marker():
+    """Verify the thumbnail isn't truncated if its data contains the JPEG end marker."""
+    image = _open_image()
+    app1 = image._segments["APP1"]
+    thumbnail_offset = image.jpeg_interchange_format
+    thumbnail_nbytes = image.jpeg_interchange_format_length
+
+    app1.write(thumbnail_offset + thumbnail_nbytes // 2, b"\xff\xd9")
+
+    assert len(image.get_thumbnail()) == thumbnail_nbytes
+
+
+def test_thumbnail_fallback_scan():
+    """Verify the thumbnail is found by scanning for its markers if the IFD 1 offset tag is invalid."""
+    image = _open_image()
+    app1 = image._segments["APP1"]
+    expected_thumbnail = image.get_thumbnail()
+
+    for tag_id in [THUMBNAIL_OFFSET_TAG_ID, THUMBNAIL_LENGTH_TAG_ID]:
+        assert app1.ifd_tags.get_parent_ifd(tag_id) == 1
+
+    app1.write(
+        app1.ifd_tags[THUMBNAIL_OFFSET_TAG_ID]._tag_offset + IFD_TAG_VALUE_OFFSET,
+        app1.decoder.uint32.pack(0xFFFFFFF0),
+    )
+
+    assert image.get_thumbnail() == expected_thumbnail
+
+
+@pytest.mark.parametrize(
+    "file_name",
+    ["florida_beach.jpg", "grand_canyon.jpg", "noise.jpg", "user_comment.jpg"],
+)
+def test_extract_thumbnail(file_name):
+    """Verify extracting only the thumbnail matches the thumbnail of the fully-parsed image."""
+    with open(_get_path(file_name), "rb") as image_file:
+        image_bytes = image_file.read()
+
+    expected_thumbnail = Image(image_bytes).get_thumbnail()
+
+    assert extract_thumbnail(_get_path(file_name)) == expected_thumbnail
+    assert extract_thumbnail(image_bytes) == expected_thumbnail
+
+    counting_file = _ReadCountingFile(image_bytes)
+    assert extract_thumbnail(counting_file) == expected_thumbnail
+    assert counting_file.nbytes_read < len(expected_thumbnail) + 0x100
+
+
+def test_extract_thumbnail_invalid_length():
+    """Verify an invalid IFD 1 length tag doesn't cause reading beyond the APP1 segment."""
+    image = _open_image()
+    app1 = image._segments["APP1"]
+    expected_thumbnail = image.get_thumbnail()
+
+    app1.write(
+        app1.ifd_tags[THUMBNAIL_LENGTH_TAG_ID]._tag_offset + IFD_TAG_VALUE_OFFSET,
+        app1.decoder.uint32.pack(0xFFFFFFF0),
+    )
+
+    counting_file = _ReadCountingFile(image.get_file())
+    assert extract_thumbnail(counting_file) == expected_thumbnail
+    assert counting_file.nbytes_read < 2 * len(app1.get_segment_bytes())
+
+
+@pytest.mark.parametrize(
+    "file_name", ["little_endian.jpg", "no_app1.png", "scanner_without_app1.jpg"]
+)
+def test_extract_thumbnail_absent(file_name):
+    """Verify extracting the thumbnail from an image without one raises the same error as ``get_thumbnail()``."""
+    with pytest.raises(RuntimeError, match="image does not contain thumbnail"):
+        extract_thumbnail(_get_path(file_name))
+
+
+@pytest.mark.parametrize("workers", [0, 2], ids=["in_process", "process_pool"])
+def test_extract_thumbnails(workers):
+    """Verify extracting many thumbnails at once matches extracting each individually."""
+    paths = [_get_path("grand_canyon.jpg"), _get_path("noise.jpg")]
+    results = {
+        os.path.basename(result.path): result
+        for result in extract_thumbnails(
+            paths + [_get_path("little_endian.jpg")], workers=workers, chunk_size=1
+        )
+    }
+
+    for path in paths:
+        assert results[os.path.basename(path)] == (path, extract_thumbnail(path), None)
+
+    assert results["little_endian.jpg"].thumbnail is None
+    assert isinstance(results["little_endian.jpg"].error, RuntimeError)